@@ -1,38 +1,105 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
+# 기본은 폴더형(onedir) 배포: 실행마다 압축 해제가 없어 인스턴스를 여러 개 띄워도 바로 시작된다.
+# 단일 파일이 필요하면 HDMS_ONEFILE=1 pyinstaller HDMS_MQTT_Data_Generator_V2.spec
+ONEFILE = os.environ.get("HDMS_ONEFILE") == "1"
 
 a = Analysis(
-    ['mqtt_data_generator_v2.py'],
+    # 인자가 없으면 V2 GUI, 있으면 헤드리스 CLI (tkinter를 불러오지 않음)
+    ['app_launcher.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # 함수 안에서 늦게 불러오는 모듈 (시작 시간 단축용 지연 import)
+    hiddenimports=[
+        'cli',
+        'mqtt_data_generator_v2',
+        'async_publisher',
+        'metrics_server',
+        'loopback_broker',
+        'sharded_runner',
+        'golden_check',
+        'bench_suite',
+        'benchmark',
+        'state_checkpoint',
+        'yaml',
+        'paho.mqtt.client',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 쓰지 않는 표준 라이브러리/개발 도구 (압축 해제와 모듈 탐색 시간 단축)
+    excludes=[
+        'unittest',
+        'doctest',
+        'pydoc',
+        'pdb',
+        'lib2to3',
+        'test',
+        'tkinter.test',
+        'idlelib',
+        'xmlrpc',
+        'sqlite3',
+        'distutils',
+        'setuptools',
+        'pip',
+        'pytest',
+        'numpy.f2py',
+        'numpy.distutils',
+        'numpy.testing',
+    ],
     noarchive=False,
     optimize=0,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='HDMS_MQTT_Data_Generator_V2',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+# UPX 압축은 실행마다 풀어야 해서 시작이 느려지므로 사용하지 않음
+if ONEFILE:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='HDMS_MQTT_Data_Generator_V2',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='HDMS_MQTT_Data_Generator_V2',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='HDMS_MQTT_Data_Generator_V2',
+    )
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# 모듈들이 스크립트와 같은 디렉터리에서 평면 import 되므로 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+if __name__ == "__main__":
+    # --profile-startup은 다른 모듈을 불러오기 전에 측정을 시작해야 하므로 argparse보다 먼저 처리
+    from startup_profile import profile_requested, start_profiling
+
+    profile_output, argv = profile_requested(sys.argv[1:])
+    if profile_output:
+        start_profiling("cli", profile_output)
+
+    from cli import main
+
+    sys.exit(main(argv))
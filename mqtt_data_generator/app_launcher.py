@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import sys
+
+# 모듈들이 스크립트와 같은 디렉터리에서 평면 import 되므로 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def launch(argv):
+    """실행 파일 진입점: 인자가 있으면 헤드리스 CLI (tkinter를 불러오지 않음), 없으면 V2 GUI
+
+    HDMS_MQTT_Data_Generator_V2.exe run --config fleet.json 처럼 같은 실행 파일로
+    GUI 없는 인스턴스를 여러 개 띄울 수 있다.
+    """
+    from startup_profile import profile_requested, start_profiling
+
+    profile_output, argv = profile_requested(argv)
+    kind = "cli" if argv else "gui"
+    if profile_output:
+        start_profiling(kind, profile_output)
+
+    if kind == "cli":
+        from cli import main
+        return main(argv)
+
+    from mqtt_data_generator_v2 import main
+    main()
+    return 0
+
+
+if __name__ == "__main__":
+    # 실행 파일로 묶였을 때 --workers 워커 프로세스는 같은 실행 파일을 --multiprocessing-fork 인자로 다시 실행하므로
+    # CLI 인자 처리 전에 워커로 넘김 (일반 파이썬 실행에서는 아무것도 안 함)
+    multiprocessing.freeze_support()
+    sys.exit(launch(sys.argv[1:]))
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import paho.mqtt.client as mqtt
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from mqtt_connection import create_mqtt_client, is_connect_failure
+
+# (센서 ID, 토픽, 페이로드)
+Message = Tuple[int, str, Any]
+
+
+class PooledConnection:
+    """asyncio 이벤트 루프가 소켓 읽기/쓰기를 구동하는 paho 연결 하나"""
+
+    def __init__(self, index: int, client_id: str, pool: "AsyncPublisherPool"):
+        self.index = index
+        self.client_id = client_id
+        self.pool = pool
+        self.loop = pool.loop
+        self.connected = False
+
+        # 연결별 통계 (루프 스레드에서만 갱신)
+        self.published = 0
+        self.acked = 0
+        self.failed = 0
+        self.bytes = 0
+        self._last_published = 0
+        self._last_time = time.monotonic()
+
+        self.client = create_mqtt_client(client_id, pool.protocol)
+        self.client.max_inflight_messages_set(pool.max_inflight)
+        self.client.max_queued_messages_set(0)  # 0: 제한 없음
+        self.client.on_connect = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+        self.client.on_publish = self._on_publish
+        self.client.on_socket_open = self._on_socket_open
+        self.client.on_socket_close = self._on_socket_close
+        self.client.on_socket_register_write = self._on_socket_register_write
+        self.client.on_socket_unregister_write = self._on_socket_unregister_write
+        self._misc_task: Optional[asyncio.Task] = None
+
+    # 소켓 이벤트를 이벤트 루프에 등록 (paho 외부 루프 API)
+    def _on_socket_open(self, client, userdata, sock):
+        self.loop.add_reader(sock, client.loop_read)
+        self._misc_task = self.loop.create_task(self._misc_loop())
+
+    def _on_socket_close(self, client, userdata, sock):
+        self.loop.remove_reader(sock)
+        self.loop.remove_writer(sock)
+        if self._misc_task:
+            self._misc_task.cancel()
+            self._misc_task = None
+
+    def _on_socket_register_write(self, client, userdata, sock):
+        self.loop.add_writer(sock, client.loop_write)
+
+    def _on_socket_unregister_write(self, client, userdata, sock):
+        self.loop.remove_writer(sock)
+
+    async def _misc_loop(self):
+        """keepalive/재전송 처리"""
+        while self.client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            await asyncio.sleep(1)
+
+    def _on_connect(self, client, userdata, flags, reason_code=None, properties=None):
+        if is_connect_failure(reason_code):
+            self.pool.log(f"❌ [{self.client_id}] MQTT 연결 실패: {reason_code}")
+            return
+        self.connected = True
+        self.pool._connection_changed()
+
+    def _on_disconnect(self, client, userdata, flags=None, reason_code=None, properties=None):
+        self.connected = False
+        self.pool._connection_changed()
+
+    def _on_publish(self, client, userdata, mid, reason_codes=None, properties=None):
+        self.acked += 1
+        if self.pool.on_publish:
+            self.pool.on_publish(self.index, mid)
+
+    def publish(self, sensor_id: int, topic: str, payload, properties=None):
+        """루프 스레드에서 호출 (QoS1)"""
+        sent_ns = time.monotonic_ns()
+        info = self.client.publish(topic, payload, qos=1, properties=properties)
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            self.failed += 1
+            if self.pool.on_publish_failed:
+                self.pool.on_publish_failed(self.index, info.rc)
+            return
+        if self.pool.on_publish_sent:
+            self.pool.on_publish_sent(self.index, info.mid, sensor_id, sent_ns)
+        self.published += 1
+        self.bytes += len(payload)
+
+    def stats(self) -> Dict[str, Any]:
+        """연결별 처리량/미확인 메시지 수"""
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        rate = (self.published - self._last_published) / elapsed if elapsed > 0 else 0.0
+        self._last_published = self.published
+        self._last_time = now
+        return {
+            "client_id": self.client_id,
+            "connected": self.connected,
+            "published": self.published,
+            "acked": self.acked,
+            "failed": self.failed,
+            "in_flight": self.published - self.acked,
+            "bytes": self.bytes,
+            "rate": rate
+        }
+
+
+class AsyncPublisherPool:
+    """N개의 브로커 연결을 하나의 asyncio 루프로 구동하는 발행기
+
+    센서 ID로 연결을 고르므로 같은 토픽의 메시지는 항상 같은 연결로 순서대로 나간다.
+    생성 스레드는 틱(배치)마다 한 번만 루프로 넘기고, 메시지별 스레드 전환은 없다.
+    """
+
+    def __init__(self, broker: str, port: int, client_id: str, size: int,
+                 max_inflight: int = 1000, protocol: int = mqtt.MQTTv311,
+                 log: Optional[Callable[[str], None]] = None,
+                 on_connection_change: Optional[Callable[[bool], None]] = None,
+                 on_publish: Optional[Callable[[int, int], None]] = None,
+                 on_publish_failed: Optional[Callable[[int, int], None]] = None,
+                 on_publish_sent: Optional[Callable[[int, int, int, int], None]] = None):
+        if size < 1:
+            raise ValueError("연결 수는 1 이상이어야 합니다.")
+        self.broker = broker
+        self.port = port
+        self.size = size
+        self.max_inflight = max_inflight
+        self.protocol = protocol
+        self.log = log or print
+        self.on_connection_change = on_connection_change
+        self.on_publish = on_publish
+        self.on_publish_failed = on_publish_failed
+        self.on_publish_sent = on_publish_sent
+
+        self.loop = asyncio.new_event_loop()
+        self.thread: Optional[threading.Thread] = None
+        self.connections: List[PooledConnection] = [
+            PooledConnection(i, f"{client_id}-{i}", self) for i in range(size)
+        ]
+        self.is_connected = False
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self, timeout: float = 10.0):
+        """루프 스레드 시작 후 모든 연결 시도 (TCP 연결 실패 시 예외)"""
+        self.thread = threading.Thread(target=self._run_loop, name="mqtt-pool", daemon=True)
+        self.thread.start()
+        future = asyncio.run_coroutine_threadsafe(self._connect_all(), self.loop)
+        future.result(timeout)
+
+    async def _connect_all(self):
+        for connection in self.connections:
+            connection.client.connect(self.broker, self.port, 60)
+
+    def stop(self, timeout: float = 5.0):
+        """모든 연결 해제 후 루프 종료"""
+        if not self.thread:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._disconnect_all(timeout), self.loop)
+        try:
+            future.result(timeout + 1)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+            self.thread = None
+
+    async def _disconnect_all(self, timeout: float):
+        for connection in self.connections:
+            connection.client.disconnect()
+        # DISCONNECT 패킷이 나가고 소켓이 닫힐 때까지 대기
+        deadline = time.monotonic() + timeout
+        while any(c.client.socket() for c in self.connections) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+    def _connection_changed(self):
+        """연결별 상태 변화 → 풀 전체 상태 (모든 연결이 붙어 있어야 연결됨)"""
+        connected = sum(1 for c in self.connections if c.connected)
+        self.log(f"🔗 MQTT 연결 {connected}/{self.size}")
+        is_connected = connected == self.size
+        if is_connected != self.is_connected:
+            self.is_connected = is_connected
+            if self.on_connection_change:
+                self.on_connection_change(is_connected)
+
+    def publish_batch(self, messages: List[Message], properties=None):
+        """메시지 묶음을 루프로 한 번에 전달 (스레드 안전, properties: MQTT v5 PUBLISH 속성)"""
+        if messages:
+            self.loop.call_soon_threadsafe(self._publish_batch, messages, properties)
+
+    def _publish_batch(self, messages: List[Message], properties=None):
+        connections = self.connections
+        size = self.size
+        for sensor_id, topic, payload in messages:
+            connections[sensor_id % size].publish(sensor_id, topic, payload, properties)
+
+    def connection_stats(self) -> List[Dict[str, Any]]:
+        """연결별 처리량/미확인(in-flight) 통계"""
+        return [connection.stats() for connection in self.connections]
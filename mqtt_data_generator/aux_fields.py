@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from rng_streams import SensorStreams, DRAW_AUX
+from sensor_registry import SensorRegistry
+from sensor_types import SENSOR_TYPES_BY_CODE
+
+
+class AuxFieldEngine:
+    """센서 타입 표의 ADC/부가 필드를 틱마다 계산하는 열 단위 엔진 (v1 다중 필드 페이로드를 v2에서 재현)
+
+    타입별 ADC 배율과 부가 필드 범위/시작값/최대 변화를 배열로 컴파일해 두고, 틱마다 타입 묶음 하나에
+    랜덤 워크 한 번과 ADC 정수화 한 번만 한다 (타입이 늘어도 메시지당 분기 없음).
+    부가 필드 상태는 센서 ID와 함께 보관해 센서 추가/삭제 뒤에도 이어진다.
+
+    결과는 센서 × width 행렬이며, 타입별로 앞 칸부터 ADC → 부가 필드 순서(페이로드 순서)로 채운다.
+
+    시드 모드에서는 난수를 (센서 ID, 틱, 필드) 카운터 스트림에서 뽑으므로 샤드 분할/선계산/체크포인트 재개와
+    무관하게 같은 값이 나온다. 부가 필드는 랜덤 워크라 틱 이동(--start-tick)은 그 틱에서 시작값부터 다시 걷는다.
+    """
+
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        self.rng = rng or np.random.default_rng()
+        self.streams: Optional[SensorStreams] = None
+        # 레지스트리 version별 (타입 코드, 센서 위치) 묶음
+        self._version = -1
+        self._groups: List[Tuple[int, np.ndarray]] = []
+        # 타입 코드 → (센서 ID, 부가 필드 상태 행렬), 묶음의 센서 위치 순서
+        self._state: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self.compile()
+
+    def compile(self):
+        """센서 타입 표 → 타입별 (ADC 배율 또는 None, 최소, 최대, 시작값, 최대 변화) 배열 (타입 추가 시 다시 호출)"""
+        self.types = {}
+        width = 0
+        for code, sensor_type in SENSOR_TYPES_BY_CODE.items():
+            fields = sensor_type.aux_fields
+            adc = (sensor_type.adc.scale_low, sensor_type.adc.scale_high) if sensor_type.adc else None
+            self.types[code] = (
+                adc,
+                np.array([field.low for field in fields]),
+                np.array([field.high for field in fields]),
+                np.array([field.initial for field in fields]),
+                np.array([field.max_change for field in fields])
+            )
+            width = max(width, len(fields) + (1 if adc else 0))
+        self.width = width
+        self._version = -1
+
+    def set_seed(self, seed: Optional[int]):
+        """부가 필드 난수 시드 (None이면 매 실행 다른 값, 상태는 시작값부터 다시)"""
+        self.rng = np.random.default_rng(seed)
+        self.streams = SensorStreams(seed) if seed is not None else None
+        self._state.clear()
+        self._version = -1
+
+    def _regroup(self, registry: SensorRegistry):
+        """타입별 센서 위치를 다시 묶고 부가 필드 상태를 새 위치로 옮김 (새 센서는 시작값)"""
+        codes = np.frombuffer(registry.type_codes, dtype=np.int8)
+        ids = np.frombuffer(registry.ids, dtype=np.int64)
+        groups = []
+        state = {}
+        for code in np.unique(codes).tolist():
+            positions = np.flatnonzero(codes == code)
+            group_ids = ids[positions].copy()
+            _, _, _, initial, _ = self.types[code]
+            matrix = np.tile(initial, (len(positions), 1))
+            if code in self._state and len(initial):
+                old_ids, old_matrix = self._state[code]
+                order = np.argsort(old_ids)
+                sorted_ids = old_ids[order]
+                slots = np.minimum(np.searchsorted(sorted_ids, group_ids), max(len(sorted_ids) - 1, 0))
+                known = sorted_ids[slots] == group_ids if len(sorted_ids) else np.zeros(len(group_ids), dtype=bool)
+                matrix[known] = old_matrix[order][slots[known]]
+            groups.append((code, positions))
+            state[code] = (group_ids, matrix)
+        self._groups = groups
+        self._state = state
+        self._version = registry.version
+
+    def snapshot_state(self) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """체크포인트용 부가 필드 상태 복사본 (타입 코드 → 센서 ID, 센서 × 필드 행렬, registry.lock 안에서 호출)"""
+        return {code: (ids.copy(), matrix.copy()) for code, (ids, matrix) in self._state.items()}
+
+    def restore_state(self, state: Dict[int, Tuple[np.ndarray, np.ndarray]]):
+        """체크포인트의 부가 필드 상태 복원 (다음 step에서 현재 센서 위치로 다시 묶음, 필드 수가 바뀐 타입은 시작값)"""
+        self._state = {code: (ids, matrix) for code, (ids, matrix) in state.items()
+                       if code in self.types and matrix.shape[1] == len(self.types[code][1])}
+        self._version = -1
+
+    def _uniform(self, group_ids: np.ndarray, tick: int, draw: int) -> np.ndarray:
+        """센서별 [0, 1) 난수 (시드 모드는 카운터 스트림, 아니면 공유 생성기)"""
+        if self.streams:
+            return self.streams.uniform(group_ids, tick, draw)
+        return self.rng.random(len(group_ids))
+
+    def step(self, registry: SensorRegistry, values: np.ndarray, tick: int = 0) -> np.ndarray:
+        """이번 틱의 ADC/부가 필드 (registry.lock 안에서 호출, values는 틱 번호 tick의 주 값)"""
+        if self._version != registry.version:
+            self._regroup(registry)
+        out = np.zeros((len(values), self.width))
+        for code, positions in self._groups:
+            adc, low, high, _, max_change = self.types[code]
+            group_ids, matrix = self._state[code]
+            column = 0
+            if adc:
+                # v1과 같이 int(값 × 최소 배율) ~ int(값 × 최대 배율) 정수 (양 끝 포함)
+                main = values[positions]
+                bounds_low = np.trunc(main * adc[0])
+                bounds_high = np.trunc(main * adc[1])
+                lowest = np.minimum(bounds_low, bounds_high)
+                span = np.abs(bounds_high - bounds_low) + 1
+                out[positions, 0] = lowest + np.floor(self._uniform(group_ids, tick, DRAW_AUX) * span)
+                column = 1
+            if len(low):
+                if self.streams:
+                    for field in range(len(low)):
+                        change = self.streams.uniform(group_ids, tick, DRAW_AUX + 1 + field)
+                        change *= 2.0
+                        change -= 1.0
+                        matrix[:, field] += change * max_change[field]
+                else:
+                    matrix += self.rng.uniform(-max_change, max_change, size=matrix.shape)
+                np.clip(matrix, low, high, out=matrix)
+                out[positions, column:column + len(low)] = matrix
+        return out
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import re
+from typing import Dict, Any, Iterator
+
+# 기간 단위 → 초
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(text: str) -> datetime.timedelta:
+    """기간 문자열 파싱 (예: 30s, 5m, 1h, 1d, 단위 없으면 초)"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", str(text))
+    if not match:
+        raise ValueError(f"잘못된 기간 형식입니다: {text} (예: 30s, 5m, 1h, 1d)")
+    seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2) or "s"]
+    return datetime.timedelta(seconds=seconds)
+
+
+def parse_time(text: str) -> datetime.datetime:
+    """ISO 8601 시각 파싱 (예: 2026-09-01, 2026-09-01T00:00:00)"""
+    try:
+        return datetime.datetime.fromisoformat(str(text))
+    except ValueError:
+        raise ValueError(f"잘못된 시각 형식입니다: {text} (예: 2026-09-01T00:00:00)")
+
+
+class VirtualClock:
+    """백필용 가상 시계: start부터 end 전까지 step 간격의 시뮬레이션 시각
+
+    실제 시간과 무관하게 틱을 진행하므로 발행 속도는 브로커가 받아주는 만큼으로 정해진다.
+    """
+
+    def __init__(self, start: datetime.datetime, end: datetime.datetime, step: datetime.timedelta):
+        if end <= start:
+            raise ValueError("백필 종료 시각은 시작 시각보다 뒤여야 합니다.")
+        if step.total_seconds() <= 0:
+            raise ValueError("백필 간격은 0보다 커야 합니다.")
+        self.start = start
+        self.end = end
+        self.step = step
+        self.current = start
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "VirtualClock":
+        """{"start": ISO 시각, "end": ISO 시각, "step": 기간} 설정으로 생성"""
+        return cls(parse_time(config["start"]), parse_time(config["end"]),
+                   parse_duration(config.get("step", "60s")))
+
+    @property
+    def total_ticks(self) -> int:
+        span = (self.end - self.start).total_seconds()
+        step = self.step.total_seconds()
+        return int(span // step) + (1 if span % step else 0)
+
+    def ticks(self) -> Iterator[datetime.datetime]:
+        """시뮬레이션 시각 순회 (current 갱신)"""
+        current = self.start
+        while current < self.end:
+            self.current = current
+            yield current
+            current += self.step
+        self.current = self.end
+
+    def simulated_seconds(self) -> float:
+        """시작 이후 진행한 시뮬레이션 시간 (초)"""
+        return (self.current - self.start).total_seconds()
+
+    def progress(self) -> float:
+        """진행률 (0.0 ~ 1.0)"""
+        return self.simulated_seconds() / (self.end - self.start).total_seconds()
+
+    def describe(self) -> str:
+        return (f"{self.start.isoformat()} → {self.end.isoformat()}, "
+                f"{self.step.total_seconds():g}초 간격 {self.total_ticks:,}틱")
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import json
+import multiprocessing
+import platform
+import queue
+import sys
+import time
+import tracemalloc
+from typing import Dict, Any, Callable, List, Optional
+
+from generator_engine import GeneratorEngine
+from sensor_types import SENSOR_TYPE_CODES
+from payload_codecs import make_timestamp
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 결과 JSON 형식 버전 (필드가 바뀌면 올림)
+SUITE_FORMAT_VERSION = 1
+
+DEFAULT_FLEETS = (100, 10000, 1000000)
+PIPELINES = ("v1", "v2")
+
+# 단계별 최소 측정 건수 (작은 센서 집합은 틱을 반복해 채움)
+MIN_OPS_PER_STAGE = 200000
+
+# 기준 대비 이 비율 미만이면 성능 저하로 표시
+REGRESSION_THRESHOLD = 0.9
+
+
+class NullMessageInfo:
+    __slots__ = ("rc", "mid")
+
+    def __init__(self, mid: int):
+        self.rc = 0
+        self.mid = mid
+
+
+class NullClient:
+    """브로커 없이 publish를 받아 버리는 루프백 클라이언트 (즉시 PUBACK 콜백 호출)"""
+
+    def __init__(self, on_publish: Optional[Callable] = None):
+        self.on_publish = on_publish
+        self.published = 0
+        self._mid = 0
+
+    def publish(self, topic, payload=None, qos=0, retain=False, properties=None) -> NullMessageInfo:
+        self.published += 1
+        self._mid = self._mid % 65535 + 1
+        if self.on_publish:
+            self.on_publish(self, None, self._mid)
+        return NullMessageInfo(self._mid)
+
+
+def peak_rss_kb() -> Optional[int]:
+    """프로세스 최대 RSS (KB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure_stage(run: Callable[[], int], repeat: int) -> Dict[str, Any]:
+    """단계 하나 측정: repeat번 실행한 처리량 + 별도 1회 실행의 tracemalloc 할당량
+
+    run()은 처리한 건수를 돌려준다. 할당 측정은 속도 측정과 분리해 tracemalloc 오버헤드가 섞이지 않게 한다.
+    """
+    ops = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        ops += run()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    once_ops = run()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "seconds": elapsed,
+        "ops_per_sec": ops / elapsed if elapsed > 0 else float("inf"),
+        "alloc_peak_bytes": peak,
+        "alloc_retained_bytes": current,
+        "alloc_bytes_per_op": peak / once_ops if once_ops else 0.0
+    }
+
+
+def _fleet_sensors(sensor_count: int):
+    """(센서 ID, 타입 이름, 이름) 목록 (타입을 번갈아 배정)"""
+    type_names = list(SENSOR_TYPE_CODES)
+    return [(sensor_id, type_names[sensor_id % len(type_names)], f"{type_names[sensor_id % len(type_names)]}센서{sensor_id}")
+            for sensor_id in range(sensor_count)]
+
+
+def bench_v2(sensor_count: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """V2 엔진 단계별 측정 (GeneratorEngine, 배치 값 계산 + 템플릿 인코더)"""
+    engine = GeneratorEngine(log_callback=lambda message: None)
+    engine.message_log_callback = lambda description: None
+    for sensor_id, sensor_type, name in _fleet_sensors(sensor_count):
+        engine.add_sensor(sensor_type, sensor_id, name)
+    engine.mqtt_client = NullClient(engine.on_publish)
+    engine.is_connected = True
+
+    registry = engine.registry
+    encoder = engine.payload_encoder
+    timestamp = make_timestamp(datetime.datetime.now())
+    codec, topic_suffix = engine.resolve_codec()
+    tick = engine.take_tick()
+    values = tick.values.tolist()
+    rounded = [encoder.round_value(type_code, value) for type_code, value in zip(tick.type_codes, values)]
+    messages, _ = engine.build_tick_messages(timestamp, tick)
+
+    def value_generation():
+        with registry.lock:
+            return len(engine.tick_engine.step(registry))
+
+    def payload_building():
+        # 스냅샷 + 타입별 반올림 (페이로드에 들어갈 값 확정)
+        snapshot = engine.take_tick()
+        round_value = encoder.round_value
+        for type_code, value in zip(snapshot.type_codes, snapshot.values.tolist()):
+            round_value(type_code, value)
+        return len(snapshot)
+
+    def serialization():
+        encode = codec.encode
+        for sensor_id, type_code, head, value in zip(tick.sensor_ids, tick.type_codes, tick.heads, rounded):
+            encode(sensor_id, type_code, head, value, timestamp)
+        return len(tick)
+
+    def topic_formatting():
+        prefix = engine.topic_prefix
+        for sensor_id in tick.sensor_ids:
+            f"{prefix}/{sensor_id}/data{topic_suffix}"
+        return len(tick)
+
+    def publish_null():
+        engine.publish_messages(messages)
+        return len(messages)
+
+    def end_to_end():
+        engine.send_all_sensor_data()
+        return len(registry)
+
+    stages = {
+        "value_generation": value_generation,
+        "payload_building": payload_building,
+        "serialization": serialization,
+        "topic_formatting": topic_formatting,
+        "publish_null": publish_null,
+        "end_to_end": end_to_end
+    }
+    return {name: measure_stage(run, repeat) for name, run in stages.items()}
+
+
+def _load_v1_class():
+    """V1 앱 클래스 로드 (python -m 실행 시 패키지 이름과 겹치므로 파일 경로로 직접 로드)"""
+    import importlib.util
+    import os
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mqtt_data_generator.py")
+    spec = importlib.util.spec_from_file_location("mqtt_data_generator_v1", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MqttDataGenerator
+
+
+def bench_v1(sensor_count: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """V1 (mqtt_data_generator.py) 단계별 측정 - Tk 위젯 없이 생성/발행 메서드만 사용"""
+    import json as json_module
+    MqttDataGenerator = _load_v1_class()
+
+    app = MqttDataGenerator.__new__(MqttDataGenerator)
+    type_codes = {"current": 1, "temperature": 2, "humidity": 3}
+    app.sensors = [{"id": sensor_id, "type": type_codes[sensor_type], "name": name}
+                   for sensor_id, sensor_type, name in _fleet_sensors(sensor_count)]
+    app.sensor_types = {1: "전류", 2: "온도", 3: "습도"}
+    app.sensor_last_values = {}
+    app.init_sensor_values()
+    app.mqtt_client = NullClient()
+    app.log = lambda message: None
+
+    # 타입별 대표 필드 범위 (create_sensor_data와 같은 값)
+    value_fields = {1: ("current", 1.0, 12.0, 0.3), 2: ("temperature", 25.0, 40.0, 0.5), 3: ("humidity", 45.0, 70.0, 1.0)}
+    records = [app.create_sensor_data(sensor) for sensor in app.sensors]
+    payloads = [json_module.dumps(record, ensure_ascii=False) for record in records]
+    topics = [f"HS/{sensor['id']}/data" for sensor in app.sensors]
+
+    def value_generation():
+        get_stable_value = app.get_stable_value
+        for sensor in app.sensors:
+            field, low, high, change = value_fields[sensor["type"]]
+            get_stable_value(sensor["id"], field, low, high, change)
+        return len(app.sensors)
+
+    def payload_building():
+        for sensor in app.sensors:
+            app.create_sensor_data(sensor)
+        return len(app.sensors)
+
+    def serialization():
+        dumps = json_module.dumps
+        for record in records:
+            dumps(record, ensure_ascii=False)
+        return len(records)
+
+    def topic_formatting():
+        for sensor in app.sensors:
+            f"HS/{sensor['id']}/data"
+        return len(app.sensors)
+
+    def publish_null():
+        publish = app.mqtt_client.publish
+        for topic, payload in zip(topics, payloads):
+            publish(topic, payload, qos=1)
+        return len(payloads)
+
+    def end_to_end():
+        app.generate_sensor_data()
+        return len(app.sensors)
+
+    stages = {
+        "value_generation": value_generation,
+        "payload_building": payload_building,
+        "serialization": serialization,
+        "topic_formatting": topic_formatting,
+        "publish_null": publish_null,
+        "end_to_end": end_to_end
+    }
+    return {name: measure_stage(run, repeat) for name, run in stages.items()}
+
+
+def run_fleet(pipeline: str, sensor_count: int) -> Dict[str, Any]:
+    """센서 집합 하나 × 파이프라인 하나 측정 (별도 프로세스에서 실행해 RSS를 분리)"""
+    repeat = max(1, MIN_OPS_PER_STAGE // sensor_count)
+    started = time.perf_counter()
+    try:
+        stages = bench_v1(sensor_count, repeat) if pipeline == "v1" else bench_v2(sensor_count, repeat)
+    except ImportError as e:
+        return {"skipped": f"{type(e).__name__}: {e}"}
+    return {
+        "repeat": repeat,
+        "stages": stages,
+        "peak_rss_kb": peak_rss_kb(),
+        "wall_seconds": time.perf_counter() - started
+    }
+
+
+def _fleet_worker(pipeline: str, sensor_count: int, results):
+    results.put(run_fleet(pipeline, sensor_count))
+
+
+def _wait_result(process: multiprocessing.Process, results) -> Dict[str, Any]:
+    """측정 프로세스 결과 대기 (메모리 부족 등으로 죽으면 건너뜀으로 기록)"""
+    while True:
+        try:
+            return results.get(timeout=1.0)
+        except queue.Empty:
+            if not process.is_alive():
+                return {"skipped": f"측정 프로세스 종료 (코드 {process.exitcode})"}
+
+
+def run_suite(fleets=DEFAULT_FLEETS, pipelines=PIPELINES, log: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """모든 (센서 수 × 파이프라인) 조합 측정 → JSON 직렬화 가능한 결과"""
+    log = log or (lambda message: None)
+    suite = {
+        "format": SUITE_FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "min_ops_per_stage": MIN_OPS_PER_STAGE,
+        "fleets": []
+    }
+    for sensor_count in fleets:
+        fleet = {"sensors": sensor_count, "pipelines": {}}
+        for pipeline in pipelines:
+            if pipeline not in PIPELINES:
+                raise ValueError(f"알 수 없는 파이프라인입니다: {pipeline} (사용 가능: {', '.join(PIPELINES)})")
+            log(f"⏱️ 측정 중: {pipeline} × 센서 {sensor_count:,}개")
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=_fleet_worker, args=(pipeline, sensor_count, results))
+            process.start()
+            fleet["pipelines"][pipeline] = _wait_result(process, results)
+            process.join()
+        suite["fleets"].append(fleet)
+    return suite
+
+
+def format_suite(suite: Dict[str, Any]) -> str:
+    """스위트 결과 표 (센서 수 × 단계별 ops/s, 할당 bytes/op, 최대 RSS)"""
+    lines = []
+    for fleet in suite["fleets"]:
+        lines.append(f"센서 {fleet['sensors']:,}개")
+        lines.append(f"  {'파이프라인':<8}{'단계':<18}{'ops/s':>14}{'alloc B/op':>12}")
+        for pipeline, result in fleet["pipelines"].items():
+            if "skipped" in result:
+                lines.append(f"  {pipeline:<8}건너뜀 ({result['skipped']})")
+                continue
+            for stage, r in result["stages"].items():
+                lines.append(f"  {pipeline:<8}{stage:<18}{r['ops_per_sec']:>14,.0f}{r['alloc_bytes_per_op']:>12,.0f}")
+            rss = result["peak_rss_kb"]
+            lines.append(f"  {pipeline:<8}{'peak RSS':<18}{(f'{rss / 1024:,.1f} MiB' if rss else '-'):>14}")
+    return "\n".join(lines)
+
+
+def compare_suites(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """기준 결과 대비 단계별 처리량 비율 (REGRESSION_THRESHOLD 미만은 ⚠️ 표시)"""
+    baseline_fleets = {fleet["sensors"]: fleet for fleet in baseline.get("fleets", [])}
+    lines = []
+    for fleet in current["fleets"]:
+        base_fleet = baseline_fleets.get(fleet["sensors"])
+        if not base_fleet:
+            continue
+        for pipeline, result in fleet["pipelines"].items():
+            base_result = base_fleet["pipelines"].get(pipeline, {})
+            if "stages" not in result or "stages" not in base_result:
+                continue
+            for stage, r in result["stages"].items():
+                base = base_result["stages"].get(stage)
+                if not base or not base["ops_per_sec"]:
+                    continue
+                ratio = r["ops_per_sec"] / base["ops_per_sec"]
+                mark = "⚠️" if ratio < REGRESSION_THRESHOLD else "  "
+                lines.append(f"{mark} 센서 {fleet['sensors']:>9,} {pipeline} {stage:<18}{ratio:>7.2f}x")
+    return lines
+
+
+def load_suite(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import json
+import statistics
+import time
+import tracemalloc
+from typing import Dict, Any, List, Tuple
+
+from generator_engine import GeneratorEngine
+from sensor_registry import SensorRegistry
+from sensor_types import SENSOR_TYPE_CODES
+from payload_codecs import CODEC_NAMES, StructCodec, make_timestamp
+
+
+def _quiet_engine() -> GeneratorEngine:
+    """로그를 출력하지 않는 벤치마크용 엔진"""
+    return GeneratorEngine(log_callback=lambda message: None)
+
+
+def bench_scalar_values(engine: GeneratorEngine, sensor_type: str, sensor_count: int, ticks: int) -> Tuple[List[float], float]:
+    """기존 경로: 센서마다 generate_realistic_value 호출 (값 목록, 소요 시간)"""
+    values = []
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for _ in range(sensor_count):
+            values.append(engine.generate_realistic_value(sensor_type, sensor_type))
+    return values, time.perf_counter() - started
+
+
+def bench_vector_values(engine: GeneratorEngine, sensor_type: str, sensor_count: int, ticks: int) -> Tuple[List[float], float]:
+    """배치 경로: 틱당 한 번의 VectorTickEngine.step 호출 (값 목록, 소요 시간)"""
+    for sensor_id in range(sensor_count):
+        engine.add_sensor(sensor_type, sensor_id, f"{sensor_type}-{sensor_id}")
+
+    values = []
+    elapsed = 0.0
+    for _ in range(ticks):
+        started = time.perf_counter()
+        tick_values = engine.tick_engine.step(engine.registry)
+        elapsed += time.perf_counter() - started
+        values.extend(tick_values.tolist())
+    return values, elapsed
+
+
+def run_tick_benchmark(sensor_count: int = 50000, ticks: int = 5) -> Dict[str, Any]:
+    """센서 타입별 값 생성 속도(values/sec)와 분포 통계 비교"""
+    results = {"sensor_count": sensor_count, "ticks": ticks, "types": {}}
+
+    for sensor_type in ("current", "temperature", "humidity"):
+        type_result = {}
+        for path, func in (("scalar", bench_scalar_values), ("vector", bench_vector_values)):
+            engine = _quiet_engine()
+            values, elapsed = func(engine, sensor_type, sensor_count, ticks)
+            type_result[path] = {
+                "values_per_sec": len(values) / elapsed if elapsed > 0 else float("inf"),
+                "mean": statistics.fmean(values),
+                "stdev": statistics.pstdev(values),
+                "min": min(values),
+                "max": max(values)
+            }
+        type_result["speedup"] = type_result["vector"]["values_per_sec"] / type_result["scalar"]["values_per_sec"]
+        results["types"][sensor_type] = type_result
+
+    return results
+
+
+def format_tick_benchmark(results: Dict[str, Any]) -> str:
+    """벤치마크 결과를 표 형식 문자열로 변환"""
+    lines = [f"센서 {results['sensor_count']:,}개 × {results['ticks']}틱"]
+    lines.append(f"{'타입':<12}{'경로':<8}{'values/sec':>14}{'평균':>10}{'표준편차':>10}{'최소':>10}{'최대':>10}")
+    for sensor_type, type_result in results["types"].items():
+        for path in ("scalar", "vector"):
+            r = type_result[path]
+            lines.append(f"{sensor_type:<12}{path:<8}{r['values_per_sec']:>14,.0f}"
+                         f"{r['mean']:>10.3f}{r['stdev']:>10.3f}{r['min']:>10.3f}{r['max']:>10.3f}")
+        lines.append(f"{'':<12}{'speedup':<8}{type_result['speedup']:>13.1f}x")
+    return "\n".join(lines)
+
+
+def run_registry_benchmark(sensor_count: int = 1000000) -> Dict[str, Any]:
+    """센서 저장 메모리 비교: 기존 dict 리스트 vs 배열 레지스트리"""
+    type_names = list(SENSOR_TYPE_CODES)
+
+    # 기존 방식: {"current": [{"id":.., "name":..}, ...], ...} + 타입별 값
+    tracemalloc.start()
+    sensors = {sensor_type: [] for sensor_type in type_names}
+    for sensor_id in range(sensor_count):
+        sensor_type = type_names[sensor_id % len(type_names)]
+        sensors[sensor_type].append({"id": sensor_id, "name": f"{sensor_type}센서"})
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sensors
+
+    # 배열 레지스트리: 센서별 기준값/트렌드/마지막 값까지 포함
+    tracemalloc.start()
+    registry = SensorRegistry()
+    started = time.perf_counter()
+    for sensor_id in range(sensor_count):
+        sensor_type = type_names[sensor_id % len(type_names)]
+        registry.add(sensor_id, SENSOR_TYPE_CODES[sensor_type], f"{sensor_type}센서", 0.0)
+    add_elapsed = time.perf_counter() - started
+    registry_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # 조회/삭제 (O(1))
+    started = time.perf_counter()
+    for sensor_id in range(0, sensor_count, 10):
+        registry.get(sensor_id)
+    lookup_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    for sensor_id in range(0, sensor_count, 10):
+        registry.remove(sensor_id)
+    remove_elapsed = time.perf_counter() - started
+    operations = len(range(0, sensor_count, 10))
+
+    return {
+        "sensor_count": sensor_count,
+        "dict_bytes": dict_bytes,
+        "registry_bytes": registry_bytes,
+        "ratio": registry_bytes / dict_bytes if dict_bytes else 0.0,
+        "add_per_sec": sensor_count / add_elapsed if add_elapsed > 0 else float("inf"),
+        "lookup_per_sec": operations / lookup_elapsed if lookup_elapsed > 0 else float("inf"),
+        "remove_per_sec": operations / remove_elapsed if remove_elapsed > 0 else float("inf")
+    }
+
+
+def format_registry_benchmark(results: Dict[str, Any]) -> str:
+    """레지스트리 벤치마크 결과 문자열"""
+    return "\n".join([
+        f"센서 {results['sensor_count']:,}개 저장 메모리",
+        f"  dict 리스트   : {results['dict_bytes'] / 1048576:>8.1f} MiB",
+        f"  배열 레지스트리: {results['registry_bytes'] / 1048576:>8.1f} MiB ({results['ratio'] * 100:.0f}%)",
+        f"  추가 {results['add_per_sec']:,.0f}/s, 조회 {results['lookup_per_sec']:,.0f}/s, 삭제 {results['remove_per_sec']:,.0f}/s"
+    ])
+
+
+def run_payload_benchmark(sensor_count: int = 10000, ticks: int = 5) -> Dict[str, Any]:
+    """페이로드 생성 속도 비교: dict + json.dumps vs 미리 인코딩한 템플릿 (바이트 동일성 검사 포함)"""
+    engine = _quiet_engine()
+    type_names = list(SENSOR_TYPE_CODES)
+    for sensor_id in range(sensor_count):
+        sensor_type = type_names[sensor_id % len(type_names)]
+        engine.add_sensor(sensor_type, sensor_id, f"{sensor_type}센서{sensor_id}")
+
+    registry = engine.registry
+    values = engine.tick_engine.step(registry).tolist()
+    rows = list(zip(registry.ids.tolist(), registry.type_codes.tolist(), registry.names,
+                    registry.payload_heads, values))
+    type_names_by_code = {code: name for name, code in SENSOR_TYPE_CODES.items()}
+    encoder = engine.payload_encoder
+
+    # 기존 경로: 메시지마다 dict 생성 + datetime.now() + json.dumps
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for sensor_id, type_code, name, _, value in rows:
+            data = engine.create_sensor_data({"id": sensor_id, "name": name}, type_names_by_code[type_code], value)
+            json.dumps(data, ensure_ascii=False).encode("utf-8")
+    legacy_elapsed = time.perf_counter() - started
+
+    # 템플릿 경로: 틱당 타임스탬프 한 번, 메시지마다 값만 끼워 넣음
+    started = time.perf_counter()
+    for _ in range(ticks):
+        timestamp = datetime.datetime.now().isoformat().encode("ascii")
+        for _, type_code, _, head, value in rows:
+            encoder.encode(head, type_code, encoder.round_value(type_code, value), timestamp)
+    template_elapsed = time.perf_counter() - started
+
+    # 같은 타임스탬프로 두 경로 결과 비교
+    timestamp_text = datetime.datetime.now().isoformat()
+    mismatches = 0
+    for sensor_id, type_code, name, head, value in rows:
+        data = engine.create_sensor_data({"id": sensor_id, "name": name}, type_names_by_code[type_code], value)
+        data["timestamp"] = timestamp_text
+        expected = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        actual = encoder.encode(head, type_code, encoder.round_value(type_code, value), timestamp_text.encode("ascii"))
+        if expected != actual:
+            mismatches += 1
+
+    messages = sensor_count * ticks
+    return {
+        "sensor_count": sensor_count,
+        "ticks": ticks,
+        "legacy_per_sec": messages / legacy_elapsed if legacy_elapsed > 0 else float("inf"),
+        "template_per_sec": messages / template_elapsed if template_elapsed > 0 else float("inf"),
+        "speedup": legacy_elapsed / template_elapsed if template_elapsed > 0 else float("inf"),
+        "mismatches": mismatches
+    }
+
+
+def format_payload_benchmark(results: Dict[str, Any]) -> str:
+    """페이로드 벤치마크 결과 문자열"""
+    identical = "동일" if results["mismatches"] == 0 else f"불일치 {results['mismatches']}건"
+    return "\n".join([
+        f"페이로드 {results['sensor_count']:,}개 × {results['ticks']}틱 (바이트 비교: {identical})",
+        f"  dict + json.dumps : {results['legacy_per_sec']:>12,.0f} msg/s",
+        f"  템플릿 인코더     : {results['template_per_sec']:>12,.0f} msg/s ({results['speedup']:.1f}x)"
+    ])
+
+
+def _decode_check(codec_name: str, payload: bytes):
+    """설치된 표준 라이브러리로 디코딩해 내용 확인 (없으면 None)"""
+    try:
+        if codec_name == "json":
+            return json.loads(payload)
+        if codec_name == "msgpack":
+            import msgpack
+            return msgpack.unpackb(payload)
+        if codec_name == "cbor":
+            import cbor2
+            return cbor2.loads(payload)
+        if codec_name == "struct":
+            return StructCodec.layout.unpack(payload)
+    except ImportError:
+        return None
+    return None
+
+
+def run_codec_benchmark(sensor_count: int = 10000, ticks: int = 5) -> Dict[str, Any]:
+    """코덱별 메시지 크기(bytes/msg)와 인코딩 시간(ns/msg, 반올림 포함)"""
+    engine = _quiet_engine()
+    type_names = list(SENSOR_TYPE_CODES)
+    for sensor_id in range(sensor_count):
+        sensor_type = type_names[sensor_id % len(type_names)]
+        engine.add_sensor(sensor_type, sensor_id, f"{sensor_type}센서{sensor_id}")
+
+    registry = engine.registry
+    values = engine.tick_engine.step(registry).tolist()
+    rows = list(zip(registry.ids.tolist(), registry.type_codes.tolist(), registry.payload_heads, values))
+    encoder = engine.payload_encoder
+    timestamp = make_timestamp(datetime.datetime.now())
+
+    results = {"sensor_count": sensor_count, "ticks": ticks, "codecs": {}}
+    for codec_name in CODEC_NAMES:
+        codec = engine.codec_selector.codecs[codec_name]
+        encode, round_value = codec.encode, encoder.round_value
+        total_bytes = 0
+        started = time.perf_counter_ns()
+        for _ in range(ticks):
+            for sensor_id, type_code, head, value in rows:
+                total_bytes += len(encode(sensor_id, type_code, head, round_value(type_code, value), timestamp))
+        elapsed_ns = time.perf_counter_ns() - started
+
+        sensor_id, type_code, head, value = rows[0]
+        sample = encode(sensor_id, type_code, head, round_value(type_code, value), timestamp)
+        messages = sensor_count * ticks
+        results["codecs"][codec_name] = {
+            "bytes_per_msg": total_bytes / messages,
+            "ns_per_msg": elapsed_ns / messages,
+            "decoded": _decode_check(codec_name, sample)
+        }
+    return results
+
+
+def format_codec_benchmark(results: Dict[str, Any]) -> str:
+    """코덱 벤치마크 결과 표"""
+    lines = [f"코덱별 페이로드 (센서 {results['sensor_count']:,}개 × {results['ticks']}틱)",
+             f"{'코덱':<10}{'bytes/msg':>12}{'ns/msg':>10}  디코딩 확인"]
+    json_bytes = results["codecs"]["json"]["bytes_per_msg"]
+    for codec_name, r in results["codecs"].items():
+        decoded = "-" if r["decoded"] is None else "OK"
+        lines.append(f"{codec_name:<10}{r['bytes_per_msg']:>12.1f}{r['ns_per_msg']:>10.0f}  {decoded}"
+                     f"  ({r['bytes_per_msg'] / json_bytes * 100:.0f}% of json)")
+    return "\n".join(lines)
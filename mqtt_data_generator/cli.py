@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import copy
+import json
+import os
+import sys
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+
+import startup_profile
+from defaults import (
+    DEFAULT_BROKER, DEFAULT_PORT, DEFAULT_CLIENT_ID, DEFAULT_TOPIC_PREFIX, DEFAULT_INTERVAL,
+    DEFAULT_SENSORS, OUTPUT_MODES, SINK_FORMATS, FAULT_KINDS, DEFAULT_CHECKPOINT_INTERVAL
+)
+from payload_codecs import CODEC_NAMES, CODEC_TAG_MODES
+from stream_replay import RecordingReader, StreamReplayer, parse_speed
+from inflight_window import WINDOW_POLICIES
+
+# 엔진(NumPy/paho)과 로그 파이프라인은 명령을 실행할 때 불러옴 (--help/broker 등은 바로 시작)
+if TYPE_CHECKING:
+    from generator_engine import GeneratorEngine
+    from log_pipeline import LogPipeline
+
+
+def parse_sensor_arg(text: str):
+    """--sensor 인자 파싱 (형식: 타입:ID:이름)"""
+    try:
+        sensor_type, sensor_id, sensor_name = text.split(":", 2)
+        return sensor_type.strip(), int(sensor_id), sensor_name.strip()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"센서 형식은 '타입:ID:이름' 이어야 합니다: {text}")
+
+
+def parse_codec_map_arg(text: str):
+    """--codec-map 인자 파싱 (형식: 프리픽스=코덱)"""
+    prefix, _, codec_name = text.partition("=")
+    if not prefix or codec_name not in CODEC_NAMES:
+        raise argparse.ArgumentTypeError(f"코덱 지정 형식은 '프리픽스=코덱({'|'.join(CODEC_NAMES)})' 이어야 합니다: {text}")
+    return prefix.strip(), codec_name
+
+
+def parse_fault_spec_arg(text: str) -> str:
+    """--fault 인자 검사 (형식: 종류:대상:시작초:지속초[:크기[:반복주기[:횟수]]])
+
+    대상 타입 이름은 설정 파일의 사용자 정의 타입을 등록한 뒤 엔진에서 다시 검사한다.
+    """
+    from fault_injection import parse_faults
+
+    try:
+        parse_faults([text], check_types=False)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return text
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog="python -m mqtt_data_generator",
+        description="HDMS MQTT 센서 데이터 생성기 (헤드리스 모드)"
+    )
+    # 진입점(__main__)이 argparse보다 먼저 찾아서 빼므로 여기서는 도움말 표시용
+    parser.add_argument(startup_profile.PROFILE_OPTION, metavar="PATH", nargs="?", const="-",
+                        help="시작 시간/모듈별 import 시간 보고 (PATH 지정 시 파일로 저장, 위치 무관)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="GUI 없이 데이터 생성")
+    run_parser.add_argument("--config", help="JSON 설정 파일 경로")
+    run_parser.add_argument("--broker", help=f"브로커 주소 (기본값: {DEFAULT_BROKER})")
+    run_parser.add_argument("--port", type=int, help=f"브로커 포트 (기본값: {DEFAULT_PORT})")
+    run_parser.add_argument("--client-id", help=f"클라이언트 ID (기본값: {DEFAULT_CLIENT_ID})")
+    run_parser.add_argument("--connections", type=int,
+                            help="브로커 연결 수 (2 이상이면 asyncio 연결 풀, 센서 ID로 연결 분배)")
+    run_parser.add_argument("--workers", type=int, metavar="N",
+                            help=f"워커 프로세스 수 (2 이상이면 센서를 샤드로 나눠 병렬 생성, CPU 코어: {os.cpu_count()})")
+    run_parser.add_argument("--control", action="store_true",
+                            help="워커 실행 중 표준 입력 명령을 모든 워커에 전달 "
+                                 "(start, stop, base TYPE VALUE, prefix PREFIX, status, quit)")
+    run_parser.add_argument("--prefix", help=f"토픽 프리픽스 (기본값: {DEFAULT_TOPIC_PREFIX})")
+    run_parser.add_argument("--interval", type=float, help=f"발행 주기 초 (기본값: {DEFAULT_INTERVAL})")
+    run_parser.add_argument("--sensor", action="append", type=parse_sensor_arg, default=[],
+                            metavar="TYPE:ID:NAME", help="센서 추가 (반복 가능, 예: current:21:전류센서TEST)")
+    run_parser.add_argument("--fleet", metavar="PATH",
+                            help="센서 목록 파일 (CSV/JSON/YAML, 열: id,type,name[,base_value,variation])")
+    run_parser.add_argument("--prefetch-ticks", type=int, metavar="N",
+                            help="센서 값을 백그라운드 스레드에서 N틱씩 블록으로 미리 계산 (기본값: 0, 틱마다 계산)")
+    run_parser.add_argument("--seed", type=int, help="실행 시드 (지정 시 센서별 난수 스트림으로 같은 값 재현)")
+    run_parser.add_argument("--start-tick", type=int, metavar="N",
+                            help="시드 모드에서 틱 N의 값부터 바로 시작 (이전 실행 이어 가기/일부 구간 재생성)")
+    run_parser.add_argument("--aux-fields", action="store_true",
+                            help="JSON/ndjson 페이로드에 ADC/부가 필드 추가 (v1과 같은 전압/전력/주파수/주변 온습도 등)")
+    run_parser.add_argument("--duration", type=float, help="실행 시간 초 (미지정 시 Ctrl+C까지)")
+    run_parser.add_argument("--log-sample", type=int, metavar="N",
+                            help="전송 로그를 N건당 1건만 출력 (0: 초당 요약만, 기본값: 1)")
+    run_parser.add_argument("--log-file", metavar="PATH", help="JSON 줄 형식 회전 파일 로그 경로")
+    run_parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                            help="Prometheus 메트릭 엔드포인트 포트 (http://127.0.0.1:PORT/metrics, 0: 임의 포트)")
+    run_parser.add_argument("--record", metavar="PATH", help="발행한 메시지(토픽/페이로드/발행 시각) 녹화 파일 경로")
+    run_parser.add_argument("--loopback", action="store_true",
+                            help="프로세스 안 루프백 브로커(127.0.0.1 임의 포트)로 발행 (--broker/--port 무시, 오프라인 한계 측정)")
+
+    load_group = run_parser.add_argument_group("개방 루프 부하 모드 (--interval 대신 목표 발행률 사용)")
+    load_group.add_argument("--rate", type=float, help="고정 목표 발행률 (msg/s)")
+    load_group.add_argument("--profile",
+                            help="부하 프로파일: constant:RATE | ramp:START:END:SECONDS | step:T=RATE,... | "
+                                 "spike:BASE:PEAK:AT:LENGTH | diurnal:MIN:MAX[:PERIOD]")
+    load_group.add_argument("--arrival", choices=["uniform", "poisson"], default="uniform",
+                            help="메시지 도착 분포 (기본값: uniform)")
+    load_group.add_argument("--miss-threshold", type=float, default=0.01,
+                            help="마감 초과로 집계할 지연 초 (기본값: 0.01)")
+    load_group.add_argument("--report-interval", type=float, default=5.0,
+                            help="발행률/지연 보고 주기 초 (기본값: 5)")
+
+    window_group = run_parser.add_argument_group("발행 창 (QoS1 확인 대기 메시지 수 제한)")
+    window_group.add_argument("--max-in-flight", type=int, metavar="N",
+                              help="PUBACK 대기 메시지 최대 수 (미지정 시 제한 없음)")
+    window_group.add_argument("--window-policy", choices=WINDOW_POLICIES,
+                              help="창이 가득 찼을 때: block (대기, 기본값) | drop (버림) | slow (생성 속도 감소)")
+
+    codec_group = run_parser.add_argument_group("페이로드 코덱")
+    codec_group.add_argument("--codec", choices=CODEC_NAMES,
+                             help="기본 페이로드 코덱 (기본값: json)")
+    codec_group.add_argument("--codec-map", action="append", type=parse_codec_map_arg, default=[],
+                             metavar="PREFIX=CODEC", help="토픽 프리픽스별 코덱 (반복 가능, 예: BHS=struct)")
+    codec_group.add_argument("--codec-tag", choices=CODEC_TAG_MODES,
+                             help="코덱 표시 방식: none | suffix (토픽 끝 /코덱) | content-type (MQTT v5 속성)")
+
+    fault_group = run_parser.add_argument_group("장애 주입 (예약한 시각에 센서 값/연결 상태 조작)")
+    fault_group.add_argument("--fault", action="append", type=parse_fault_spec_arg, default=[],
+                             metavar="KIND:TARGET:AT:DURATION[:MAG[:EVERY[:COUNT]]]",
+                             help=f"장애 예약 (반복 가능, 종류: {'|'.join(FAULT_KINDS)}, "
+                                  "대상: all|타입|random:N|21,25,100-199, 시각/주기는 첫 틱 기준 초)")
+    fault_group.add_argument("--fault-report", metavar="PATH", help="적용한 장애 기록 파일 (JSON 줄, 종료 시 저장)")
+
+    checkpoint_group = run_parser.add_argument_group("상태 체크포인트 (재시작 후 값 계열을 끊김 없이 이어 가기)")
+    checkpoint_group.add_argument("--checkpoint", metavar="PATH",
+                                  help="센서 구성/값 상태/틱/난수 상태를 주기적으로 저장할 파일 (중지할 때도 저장)")
+    checkpoint_group.add_argument("--checkpoint-interval", type=float, metavar="SECONDS",
+                                  help=f"체크포인트 저장 주기 초 (기본값: {DEFAULT_CHECKPOINT_INTERVAL:g})")
+    checkpoint_group.add_argument("--resume", action="store_true",
+                                  help="--checkpoint 파일이 있으면 그 상태에서 이어서 시작 (센서 구성/시드/틱도 체크포인트 값)")
+
+    backfill_group = run_parser.add_argument_group("백필 모드 (가상 시계로 과거 데이터를 최대한 빠르게 발행)")
+    backfill_group.add_argument("--backfill-start", metavar="ISO",
+                                help="시뮬레이션 시작 시각 (예: 2026-09-01T00:00:00)")
+    backfill_group.add_argument("--backfill-end", metavar="ISO", help="시뮬레이션 종료 시각 (미포함)")
+    backfill_group.add_argument("--backfill-step", default="60s",
+                                help="틱 간격 (예: 30s, 5m, 1h, 기본값: 60s)")
+
+    sink_group = run_parser.add_argument_group("파일 출력 (브로커 대신/함께 파일로 기록)")
+    sink_group.add_argument("--output", choices=OUTPUT_MODES, help="출력 대상 (기본값: mqtt)")
+    sink_group.add_argument("--sink-path", metavar="PATH",
+                            help="출력 파일 경로 접두사 (예: out/readings → out/readings-<시각>-0001.ndjson)")
+    sink_group.add_argument("--sink-format", choices=SINK_FORMATS, help="파일 형식 (기본값: ndjson)")
+    sink_group.add_argument("--sink-gzip", action="store_true", help="NDJSON을 gzip으로 압축")
+    sink_group.add_argument("--sink-max-mb", type=float, help="파일당 최대 크기 MB (기본값: 256)")
+    sink_group.add_argument("--sink-max-seconds", type=float, help="파일당 최대 기록 시간 초 (기본값: 3600)")
+
+    replay_parser = subparsers.add_parser("replay", help="녹화한 발행 스트림 재생")
+    replay_parser.add_argument("recording", help="run --record로 만든 녹화 파일")
+    replay_parser.add_argument("--config", help="JSON 설정 파일 경로 (브로커/연결 설정만 사용)")
+    replay_parser.add_argument("--broker", help=f"브로커 주소 (기본값: {DEFAULT_BROKER})")
+    replay_parser.add_argument("--port", type=int, help=f"브로커 포트 (기본값: {DEFAULT_PORT})")
+    replay_parser.add_argument("--client-id", help=f"클라이언트 ID (기본값: {DEFAULT_CLIENT_ID})")
+    replay_parser.add_argument("--connections", type=int, help="브로커 연결 수 (2 이상이면 asyncio 연결 풀)")
+    replay_parser.add_argument("--prefix", help="토픽 프리픽스 변경 (예: HS 녹화를 THS로 재생)")
+    replay_parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                               help="Prometheus 메트릭 엔드포인트 포트")
+    replay_parser.add_argument("--speed", type=parse_speed, default=1.0,
+                               help="재생 속도 배율 (1 = 원래 간격, 10 = 10배, max = 대기 없이, 기본값: 1)")
+
+    broker_parser = subparsers.add_parser("broker", help="로컬 루프백 브로커 실행 (메시지를 세고 버림)")
+    broker_parser.add_argument("--host", default="127.0.0.1", help="수신 주소 (기본값: 127.0.0.1)")
+    broker_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"수신 포트 (기본값: {DEFAULT_PORT})")
+    broker_parser.add_argument("--checksum", action="store_true", help="토픽+페이로드 CRC32 합 계산 (녹화 재생 검증용)")
+    broker_parser.add_argument("--duration", type=float, help="실행 시간 초 (미지정 시 Ctrl+C까지)")
+    broker_parser.add_argument("--report-interval", type=float, default=5.0, help="수신률 보고 주기 초 (기본값: 5)")
+
+    golden_parser = subparsers.add_parser("golden", help="시드 재현성 검증 (골든 해시)")
+    golden_parser.add_argument("--seed", type=int, default=0, help="실행 시드 (기본값: 0)")
+    golden_parser.add_argument("--ticks", type=int, default=100, help="계산할 틱 수 (기본값: 100)")
+    golden_parser.add_argument("--sensors", type=int, default=1000, help="센서 타입당 센서 수 (기본값: 1000)")
+    golden_parser.add_argument("--fleet", metavar="PATH", help="센서 목록 파일 (지정 시 --sensors 무시)")
+    golden_parser.add_argument("--jump", type=int, metavar="N", help="틱 이동 검사 시작 틱 (기본값: 틱 수의 절반)")
+    golden_parser.add_argument("--expect", metavar="HEX", help="기대 골든 해시 (다르면 실패)")
+
+    bench_parser = subparsers.add_parser("bench", help="값 생성 경로 벤치마크 (기존 vs 배치)")
+    bench_parser.add_argument("--sensors", type=int, default=50000, help="센서 타입당 센서 수 (기본값: 50000)")
+    bench_parser.add_argument("--ticks", type=int, default=5, help="측정할 틱 수 (기본값: 5)")
+    bench_parser.add_argument("--registry", type=int, metavar="N",
+                              help="센서 N개 저장 메모리 비교 (dict 리스트 vs 배열 레지스트리)")
+    bench_parser.add_argument("--payload", type=int, metavar="N",
+                              help="센서 N개 페이로드 생성 비교 (dict + json.dumps vs 템플릿 인코더)")
+    bench_parser.add_argument("--suite", action="store_true",
+                              help="단계별(값 생성/페이로드/직렬화/토픽/널 발행/전체) v1·v2 스위트, JSON은 표준 출력")
+    bench_parser.add_argument("--fleets", default="100,10000,1000000",
+                              help="스위트 센서 수 목록 (기본값: 100,10000,1000000)")
+    bench_parser.add_argument("--pipelines", default="v1,v2", help="스위트 대상 (기본값: v1,v2)")
+    bench_parser.add_argument("--json", metavar="PATH", help="스위트 결과 JSON 파일 경로 (지정 시 표준 출력 대신)")
+    bench_parser.add_argument("--compare", metavar="PATH", help="기준 스위트 JSON과 단계별 처리량 비교")
+    bench_parser.add_argument("--codecs", type=int, metavar="N",
+                              help="센서 N개로 코덱별 bytes/메시지, 인코딩 ns/메시지 비교")
+    return parser
+
+
+def build_config(args) -> Dict[str, Any]:
+    """설정 파일 + 명령행 인자를 하나의 설정 딕셔너리로 병합 (명령행 인자가 우선)"""
+    config: Dict[str, Any] = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    overrides = {
+        "broker": args.broker,
+        "port": args.port,
+        "client_id": args.client_id,
+        "connections": args.connections,
+        "topic_prefix": args.prefix,
+        "interval": args.interval,
+        "rate": args.rate,
+        "profile": args.profile,
+        "log_file": args.log_file,
+        "record": args.record,
+        "fleet": args.fleet,
+        "prefetch_ticks": args.prefetch_ticks,
+        "max_in_flight": args.max_in_flight,
+        "window_policy": args.window_policy,
+        "checkpoint": args.checkpoint,
+        "checkpoint_interval": args.checkpoint_interval
+    }
+    # 0 같은 거짓 값도 설정 파일을 덮어쓰도록 미지정(None)만 건너뜀
+    config.update({key: value for key, value in overrides.items() if value is not None})
+    if args.log_sample is not None:
+        config["log_sample"] = args.log_sample
+    if args.metrics_port is not None:
+        config["metrics_port"] = args.metrics_port
+    if args.fault:
+        config["faults"] = list(config.get("faults", [])) + args.fault
+    if args.fault_report:
+        config["fault_report"] = args.fault_report
+    if args.seed is not None:
+        config["seed"] = args.seed
+    if args.start_tick is not None:
+        config["start_tick"] = args.start_tick
+    if args.aux_fields:
+        config["aux_fields"] = True
+    if args.resume:
+        config["resume"] = True
+    if args.codec or args.codec_map:
+        codecs = config.setdefault("codecs", {})
+        if args.codec:
+            codecs["*"] = args.codec
+        codecs.update(dict(args.codec_map))
+    if args.codec_tag:
+        config["codec_tag"] = args.codec_tag
+    if args.backfill_start or args.backfill_end:
+        if not (args.backfill_start and args.backfill_end):
+            raise ValueError("백필 모드에는 --backfill-start와 --backfill-end가 모두 필요합니다.")
+        config["backfill"] = {"start": args.backfill_start, "end": args.backfill_end,
+                              "step": args.backfill_step}
+    if args.output:
+        config["output"] = args.output
+    sink_overrides = {
+        "path": args.sink_path,
+        "format": args.sink_format,
+        "gzip": args.sink_gzip or None,  # store_true: 지정하지 않으면 설정 파일 값 유지
+        "max_mb": args.sink_max_mb,
+        "max_seconds": args.sink_max_seconds
+    }
+    sink_overrides = {key: value for key, value in sink_overrides.items() if value is not None}
+    if sink_overrides:
+        config.setdefault("sink", {}).update(sink_overrides)
+    config.setdefault("arrival", args.arrival)
+    config.setdefault("miss_threshold", args.miss_threshold)
+    config.setdefault("report_interval", args.report_interval)
+
+    # 센서가 어디에도 지정되지 않으면 기본 센서 사용
+    if "sensors" not in config and not config.get("fleet") and not args.sensor:
+        config["sensors"] = copy.deepcopy(DEFAULT_SENSORS)
+    sensors = config.setdefault("sensors", {})
+    for sensor_type, sensor_id, sensor_name in args.sensor:
+        sensors.setdefault(sensor_type, []).append({"id": sensor_id, "name": sensor_name})
+
+    return config
+
+
+def build_engine(config: Dict[str, Any], log_pipeline: Optional["LogPipeline"] = None) -> "GeneratorEngine":
+    """설정 딕셔너리로 엔진 구성 (로그 파이프라인이 주어지면 로그를 그쪽으로 전달)"""
+    from generator_engine import GeneratorEngine
+
+    if log_pipeline:
+        engine = GeneratorEngine(log_callback=log_pipeline.log)
+        engine.message_log_callback = log_pipeline.log_message
+    else:
+        engine = GeneratorEngine()
+    engine.apply_config(config)
+    return engine
+
+
+def cmd_run(args) -> int:
+    """run 명령 실행"""
+    config = build_config(args)
+    if args.control and not (args.workers and args.workers > 1):
+        raise ValueError("--control은 --workers 2 이상일 때만 사용할 수 있습니다.")
+    loopback = None
+    if args.loopback:
+        from loopback_broker import LoopbackBroker
+
+        loopback = LoopbackBroker(port=0)
+        loopback.start()
+        config["broker"] = loopback.host
+        config["port"] = loopback.port
+    try:
+        if args.workers and args.workers > 1:
+            from sharded_runner import ShardSupervisor
+
+            ShardSupervisor(config, args.workers, control=args.control).run_forever(duration=args.duration)
+            return 0
+
+        from log_pipeline import pipeline_from_config
+
+        log_pipeline = pipeline_from_config(config)
+        log_pipeline.start_console()
+        try:
+            engine = build_engine(config, log_pipeline)
+            startup_profile.finish("설정/엔진 생성", log=log_pipeline.log)
+            engine.run_forever(duration=args.duration)
+        finally:
+            log_pipeline.close()
+        return 0
+    finally:
+        if loopback:
+            loopback.stop()
+            print(f"🔁 루프백 브로커 {loopback.describe()}")
+
+
+def cmd_broker(args) -> int:
+    """broker 명령 실행 (단독 루프백 브로커)"""
+    from loopback_broker import LoopbackBroker
+
+    LoopbackBroker(args.host, args.port, checksum=args.checksum).run_forever(
+        duration=args.duration, report_interval=args.report_interval)
+    return 0
+
+
+def cmd_replay(args) -> int:
+    """replay 명령 실행 (녹화 파일을 메모리 맵으로 순회하며 발행)"""
+    config: Dict[str, Any] = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    overrides = {
+        "broker": args.broker,
+        "port": args.port,
+        "client_id": args.client_id,
+        "connections": args.connections,
+        "metrics_port": args.metrics_port
+    }
+    config.update({key: value for key, value in overrides.items() if value is not None})
+    engine_config = {key: config[key] for key in ("broker", "port", "client_id", "connections", "metrics_port")
+                     if key in config}
+
+    reader = RecordingReader(args.recording)
+    engine = build_engine(engine_config)
+    if args.prefix:
+        engine.set_topic_prefix(args.prefix)
+    engine.connect()
+    try:
+        if not engine.wait_until_connected():
+            raise ConnectionError(f"MQTT 브로커 연결 시간 초과: {engine.broker}:{engine.port}")
+        speed = f"{args.speed:g}배" if args.speed else "최대 속도"
+        engine.log(f"🔁 재생 시작: {args.recording} ({len(reader) / (1024 * 1024):,.1f}MB, {speed})")
+        engine.start_metrics_server()
+        StreamReplayer(engine, reader, args.speed, args.prefix).run()
+    except KeyboardInterrupt:
+        engine.log("⛔ 사용자 중단 요청")
+    finally:
+        engine.disconnect()
+        engine.stop_metrics_server()
+        engine.report_latency()
+        reader.close()
+    return 0
+
+
+def cmd_golden(args) -> int:
+    """golden 명령 실행 (검사 하나라도 실패하면 종료 코드 1)"""
+    from golden_check import run_golden_check, format_golden_check
+
+    result = run_golden_check(args.seed, args.ticks, args.sensors, args.fleet, args.jump, expect=args.expect)
+    print(format_golden_check(result))
+    return 0 if result["passed"] else 1
+
+
+def cmd_bench_suite(args) -> int:
+    """bench --suite 실행 (표는 표준 오류, JSON은 표준 출력 또는 --json 파일)"""
+    from bench_suite import run_suite, format_suite, compare_suites, load_suite
+
+    try:
+        fleets = [int(text) for text in args.fleets.split(",") if text.strip()]
+    except ValueError:
+        raise ValueError(f"센서 수 목록 형식이 잘못되었습니다: {args.fleets} (예: 100,10000)")
+    pipelines = [text.strip() for text in args.pipelines.split(",") if text.strip()]
+    baseline = load_suite(args.compare) if args.compare else None
+
+    suite = run_suite(fleets, pipelines, log=lambda message: print(message, file=sys.stderr))
+    print(format_suite(suite), file=sys.stderr)
+    if baseline:
+        print("기준 대비 처리량", file=sys.stderr)
+        for line in compare_suites(suite, baseline):
+            print(line, file=sys.stderr)
+
+    text = json.dumps(suite, ensure_ascii=False, indent=2)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def cmd_bench(args) -> int:
+    """bench 명령 실행"""
+    if args.suite:
+        return cmd_bench_suite(args)
+    from benchmark import (run_tick_benchmark, format_tick_benchmark,
+                           run_registry_benchmark, format_registry_benchmark,
+                           run_payload_benchmark, format_payload_benchmark,
+                           run_codec_benchmark, format_codec_benchmark)
+
+    print(format_tick_benchmark(run_tick_benchmark(args.sensors, args.ticks)))
+    if args.registry:
+        print(format_registry_benchmark(run_registry_benchmark(args.registry)))
+    if args.payload:
+        print(format_payload_benchmark(run_payload_benchmark(args.payload, args.ticks)))
+    if args.codecs:
+        print(format_codec_benchmark(run_codec_benchmark(args.codecs, args.ticks)))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    args = build_parser().parse_args(argv)
+    startup_profile.mark("명령행 해석")
+    if args.command != "run":
+        startup_profile.finish("명령 준비")
+    try:
+        if args.command == "run":
+            return cmd_run(args)
+        if args.command == "replay":
+            return cmd_replay(args)
+        if args.command == "broker":
+            return cmd_broker(args)
+        if args.command == "golden":
+            return cmd_golden(args)
+        if args.command == "bench":
+            return cmd_bench(args)
+    except (ValueError, OSError) as e:
+        print(f"❌ 오류: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 엔진/CLI 공용 기본값과 선택지 (명령행 파서가 NumPy/paho 같은 무거운 모듈 없이 만들어지도록 분리)
+
+# 기본 연결 설정
+DEFAULT_BROKER = "139.150.72.51"
+DEFAULT_PORT = 1883
+DEFAULT_CLIENT_ID = "hdms_data_generator_v2"
+DEFAULT_TOPIC_PREFIX = "HS"
+DEFAULT_INTERVAL = 2.0
+
+# 기본 센서 (GUI 초기 목록과 동일)
+DEFAULT_SENSORS = {
+    "current": [{"id": 21, "name": "전류센서TEST"}],
+    "temperature": [{"id": 25, "name": "온도센서TEST"}],
+    "humidity": [{"id": 26, "name": "습도센서TEST"}]
+}
+
+# 상태 체크포인트 저장 주기 (초)
+DEFAULT_CHECKPOINT_INTERVAL = 10.0
+
+# 출력 대상: MQTT 브로커 / 파일 / 둘 다
+OUTPUT_MODES = ("mqtt", "file", "both")
+
+# 파일 출력 형식 (FileSink)
+SINK_FORMATS = ("ndjson", "columnar")
+
+# 장애 종류 (FaultInjector)
+# - spike: 값에 magnitude만큼 더함 (기본값: 센서 변동 범위 × 10)
+# - stuck: 시작 시점 값에 고정
+# - dropout: 메시지를 보내지 않음
+# - offline: is_connected false, status "offline"로 보냄 (JSON 페이로드)
+# - drift: 시작 후 경과 초 × magnitude만큼 계속 벗어남 (기본값: 초당 변동 범위 / 60)
+FAULT_KINDS = ("spike", "stuck", "dropout", "offline", "drift")
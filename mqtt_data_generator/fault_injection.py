@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import heapq
+import json
+import random
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from sensor_registry import SensorRegistry
+from sensor_types import SENSOR_TYPE_CODES
+from defaults import FAULT_KINDS
+from payload_encoder import STATUS_OFFLINE
+from payload_codecs import Timestamp
+
+# 타이머 힙 이벤트 종류
+_START = 0
+_END = 1
+
+
+class FaultSpec(NamedTuple):
+    """장애 일정 하나 (시각은 첫 틱 기준 초, count 0이면 every마다 무한 반복)"""
+    kind: str
+    target: str
+    at: float
+    duration: float
+    magnitude: Optional[float] = None
+    every: Optional[float] = None
+    count: int = 1
+
+
+def parse_target(text: str, check_types: bool = True) -> Tuple[str, Any]:
+    """대상 문자열 → (종류, 값)
+
+    all | 센서 타입(current/temperature/humidity/사용자 정의) | random:N (시작할 때 N개 무작위) | ID 목록 (21,25,100-199)
+    check_types가 False면 아직 등록되지 않은 타입 이름도 통과 (설정의 사용자 정의 타입을 등록하기 전 인자 검사)
+    """
+    text = str(text).strip()
+    if text == "all":
+        return "all", None
+    if text in SENSOR_TYPE_CODES:
+        return "type", SENSOR_TYPE_CODES[text]
+    if text.isidentifier() and not text.startswith("random"):
+        if check_types:
+            raise ValueError(f"알 수 없는 센서 타입입니다: '{text}' (사용 가능: {', '.join(SENSOR_TYPE_CODES)})")
+        return "type", None
+    if text.startswith("random:"):
+        count = text.partition(":")[2]
+        if not count.isdigit() or int(count) < 1:
+            raise ValueError(f"무작위 대상 수는 1 이상의 정수여야 합니다: {text}")
+        return "random", int(count)
+    ranges: List[Tuple[int, int]] = []
+    for part in text.split(","):
+        first, dash, last = part.strip().partition("-")
+        if not first.isdigit() or (dash and not last.isdigit()):
+            raise ValueError(f"장애 대상 형식이 잘못되었습니다: '{text}' (all | 타입 | random:N | 21,25,100-199)")
+        low, high = int(first), int(last) if dash else int(first)
+        if high < low:
+            raise ValueError(f"장애 대상 ID 범위의 끝이 시작보다 작습니다: '{part.strip()}'")
+        ranges.append((low, high))
+    return "ids", merge_ranges(ranges)
+
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> np.ndarray:
+    """(시작, 끝) 닫힌 구간 목록 → 정렬 후 겹치거나 이어지는 구간을 합친 (k, 2) 배열
+
+    1-1000000000 같은 큰 범위도 펼치지 않고 구간 두 값만 보관한다.
+    """
+    merged: List[List[int]] = []
+    for low, high in sorted(ranges):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], high)
+        else:
+            merged.append([low, high])
+    return np.array(merged, dtype=np.int64).reshape(-1, 2)
+
+
+def ranges_mask(ids: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+    """ID 배열 중 정렬된 구간 (k, 2)에 드는 것 (구간 시작을 이진 탐색, ID당 O(log k))"""
+    if not len(ranges) or not len(ids):
+        return np.zeros(len(ids), dtype=bool)
+    slots = np.searchsorted(ranges[:, 0], ids, side="right") - 1
+    return (slots >= 0) & (ids <= ranges[np.maximum(slots, 0), 1])
+
+
+def parse_fault_arg(text: str) -> Dict[str, Any]:
+    """--fault 인자 → 설정 딕셔너리 (형식: 종류:대상:시작초:지속초[:크기[:반복주기[:횟수]]])"""
+    parts = text.split(":")
+    # random:N 대상은 콜론을 포함하므로 다시 붙임
+    if len(parts) > 2 and parts[1] == "random":
+        parts[1:3] = [f"random:{parts[2]}"]
+    if len(parts) < 4:
+        raise ValueError(f"장애 형식은 '종류:대상:시작초:지속초[:크기[:반복주기[:횟수]]]' 이어야 합니다: {text}")
+    fault: Dict[str, Any] = {"kind": parts[0], "target": parts[1], "at": parts[2], "duration": parts[3]}
+    for key, value in zip(("magnitude", "every", "count"), parts[4:]):
+        if value:
+            fault[key] = value
+    return fault
+
+
+def parse_faults(items: List[Any], check_types: bool = True) -> List[FaultSpec]:
+    """설정 목록(딕셔너리 또는 --fault 문자열) 검사 후 FaultSpec 목록 (잘못되면 ValueError)"""
+    specs = []
+    for position, item in enumerate(items):
+        fault = parse_fault_arg(item) if isinstance(item, str) else item
+        try:
+            kind = fault["kind"]
+            if kind not in FAULT_KINDS:
+                raise ValueError(f"알 수 없는 장애 종류입니다: {kind} (사용 가능: {', '.join(FAULT_KINDS)})")
+            target = str(fault.get("target", "all"))
+            parse_target(target, check_types)
+            at = float(fault.get("at", 0))
+            duration = float(fault.get("duration", 0))
+            magnitude = fault.get("magnitude")
+            magnitude = float(magnitude) if magnitude is not None else None
+            every = fault.get("every")
+            every = float(every) if every is not None else None
+            count = int(fault.get("count", 1 if every is None else 0))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"장애 설정 {position + 1}번 형식이 잘못되었습니다: {e}")
+        if at < 0 or duration < 0 or count < 0:
+            raise ValueError(f"장애 설정 {position + 1}번: 시작/지속 시간과 횟수는 0 이상이어야 합니다.")
+        if every is not None and every <= duration:
+            raise ValueError(f"장애 설정 {position + 1}번: 반복 주기는 지속 시간보다 길어야 합니다.")
+        if every is None and count != 1:
+            raise ValueError(f"장애 설정 {position + 1}번: 여러 번 반복하려면 반복 주기(every)가 필요합니다.")
+        specs.append(FaultSpec(kind, target, at, duration, magnitude, every, count))
+    return specs
+
+
+def format_ms(epoch_ms: int) -> str:
+    return datetime.datetime.fromtimestamp(epoch_ms / 1000).isoformat(timespec="milliseconds")
+
+
+class ActiveFault:
+    """진행 중인 장애 (대상 위치는 레지스트리 version이 바뀔 때만 다시 구함)"""
+
+    __slots__ = ("spec", "occurrence", "ids", "ranges", "scheduled_ms", "positions", "version", "frozen_ids",
+                 "frozen", "started_ms", "last_ms", "ticks", "messages", "ended")
+
+    def __init__(self, spec: FaultSpec, occurrence: int, scheduled_ms: Tuple[int, int],
+                 ids: Optional[np.ndarray] = None, ranges: Optional[np.ndarray] = None):
+        self.spec = spec
+        self.occurrence = occurrence
+        # 무작위 대상은 뽑은 ID 배열, ID 목록 대상은 (k, 2) 구간 배열
+        self.ids = ids
+        self.ranges = ranges
+        # 예정 (시작, 종료) 시각 ms
+        self.scheduled_ms = scheduled_ms
+        self.positions = np.empty(0, dtype=np.int64)
+        self.version = -1
+        self.frozen_ids: Optional[np.ndarray] = None
+        self.frozen: Optional[np.ndarray] = None
+        self.started_ms = 0
+        self.last_ms = 0
+        self.ticks = 0
+        self.messages = 0
+        self.ended = False
+
+
+class FaultInjector:
+    """예약한 장애를 타이머 힙으로 시작/종료하고 진행 중인 장애만 틱 값에 적용
+
+    메시지마다 확률을 검사하지 않고, 장애 시작/종료 이벤트만 힙에서 꺼내므로(이벤트당 O(log n))
+    장애가 없는 틱의 비용은 힙 맨 앞 시각 비교 한 번이다. 시각은 첫 틱 타임스탬프 기준이라
+    백필 모드에서는 가상 시각으로 동작한다. 장애는 최소 한 틱은 적용되며, 적용 기록은 records에 남는다.
+    """
+
+    def __init__(self, specs: List[FaultSpec], seed: Optional[int] = None,
+                 log: Optional[Callable[[str], None]] = None):
+        self.specs = specs
+        self.rng = random.Random(seed)
+        self.log = log or print
+        self.records: List[Dict[str, Any]] = []
+        self.reset()
+
+    def reset(self):
+        """다음 틱을 새 기준 시각으로 일정 다시 시작 (진행 중인 장애는 버림)"""
+        self.origin_ms: Optional[int] = None
+        self._heap: List[Tuple[int, int, int, int, int]] = []
+        self._sequence = 0
+        self.active: Dict[Tuple[int, int], ActiveFault] = {}
+
+    def _push(self, due_ms: int, event: int, spec_index: int, occurrence: int):
+        self._sequence += 1
+        heapq.heappush(self._heap, (due_ms, self._sequence, event, spec_index, occurrence))
+
+    def _start(self, spec_index: int, occurrence: int, registry: SensorRegistry):
+        spec = self.specs[spec_index]
+        target_kind, target = parse_target(spec.target)
+        start_ms = self.origin_ms + int((spec.at + occurrence * (spec.every or 0)) * 1000)
+        end_ms = start_ms + int(spec.duration * 1000)
+        fault = ActiveFault(spec, occurrence, (start_ms, end_ms))
+        if target_kind == "ids":
+            fault.ranges = target
+        elif target_kind == "random":
+            count = min(target, len(registry))
+            fault.ids = np.sort(np.array(self.rng.sample(registry.ids.tolist(), count), dtype=np.int64))
+            fault.ranges = np.repeat(fault.ids[:, None], 2, axis=1)
+        self.active[(spec_index, occurrence)] = fault
+
+        self._push(end_ms, _END, spec_index, occurrence)
+        if spec.every is not None and (spec.count == 0 or occurrence + 1 < spec.count):
+            self._push(start_ms + int(spec.every * 1000), _START, spec_index, occurrence + 1)
+
+    def _positions(self, fault: ActiveFault, registry: SensorRegistry) -> np.ndarray:
+        if fault.version == registry.version:
+            return fault.positions
+        target_kind, target = parse_target(fault.spec.target)
+        if target_kind == "all":
+            positions = np.arange(len(registry))
+        elif target_kind == "type":
+            positions = np.flatnonzero(np.frombuffer(registry.type_codes, dtype=np.int8) == target) \
+                if len(registry) else np.empty(0, dtype=np.int64)
+        else:
+            ids = np.frombuffer(registry.ids, dtype=np.int64) if len(registry) else np.empty(0, dtype=np.int64)
+            positions = np.flatnonzero(ranges_mask(ids, fault.ranges))
+        fault.positions = positions
+        fault.version = registry.version
+        return positions
+
+    def _frozen_values(self, fault: ActiveFault, values: np.ndarray, positions: np.ndarray,
+                       registry: SensorRegistry) -> np.ndarray:
+        """stuck: 센서별 고정값 (센서 구성이 바뀌면 ID로 다시 맞추고 새 센서는 현재 값으로 고정)"""
+        ids = np.frombuffer(registry.ids, dtype=np.int64)[positions]
+        if fault.frozen is None:
+            fault.frozen_ids = ids.copy()
+            fault.frozen = values[positions].copy()
+        elif len(fault.frozen_ids) != len(ids) or not np.array_equal(fault.frozen_ids, ids):
+            order = np.argsort(fault.frozen_ids)
+            sorted_ids = fault.frozen_ids[order]
+            slots = np.minimum(np.searchsorted(sorted_ids, ids), max(len(sorted_ids) - 1, 0))
+            known = sorted_ids[slots] == ids if len(sorted_ids) else np.zeros(len(ids), dtype=bool)
+            frozen = values[positions].copy()
+            frozen[known] = fault.frozen[order][slots[known]]
+            fault.frozen_ids = ids.copy()
+            fault.frozen = frozen
+        return fault.frozen
+
+    def apply(self, values: np.ndarray, registry: SensorRegistry,
+              timestamp: Timestamp) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """틱 값에 진행 중인 장애 적용 (registry.lock 안에서 호출, values는 제자리 변경)
+
+        (센서별 상태 코드 또는 None, 보낼 센서 마스크 또는 None) 반환.
+        """
+        now_ms = timestamp[1]
+        if self.origin_ms is None:
+            self.origin_ms = now_ms
+            for spec_index, spec in enumerate(self.specs):
+                self._push(now_ms + int(spec.at * 1000), _START, spec_index, 0)
+
+        heap = self._heap
+        while heap and heap[0][0] <= now_ms:
+            _, _, event, spec_index, occurrence = heapq.heappop(heap)
+            if event == _START:
+                self._start(spec_index, occurrence, registry)
+            else:
+                fault = self.active.get((spec_index, occurrence))
+                if fault is not None:
+                    fault.ended = True
+                    if fault.ticks:
+                        self._finish((spec_index, occurrence))
+
+        if not self.active:
+            return None, None
+
+        statuses = None
+        keep = None
+        variations = np.frombuffer(registry.variations) if len(registry) else np.empty(0)
+        for key, fault in list(self.active.items()):
+            positions = self._positions(fault, registry)
+            spec = fault.spec
+            if not fault.ticks:
+                fault.started_ms = now_ms
+                self.log(f"💥 장애 시작: {self.describe_fault(fault)}, 센서 {len(positions):,}개")
+            fault.ticks += 1
+            fault.last_ms = now_ms
+            fault.messages += len(positions)
+
+            if spec.kind == "spike":
+                values[positions] += spec.magnitude if spec.magnitude is not None else variations[positions] * 10
+            elif spec.kind == "drift":
+                elapsed = (now_ms - fault.started_ms) / 1000
+                rate = spec.magnitude if spec.magnitude is not None else variations[positions] / 60
+                values[positions] += rate * elapsed
+            elif spec.kind == "stuck":
+                values[positions] = self._frozen_values(fault, values, positions, registry)
+            elif spec.kind == "dropout":
+                if keep is None:
+                    keep = np.ones(len(values), dtype=bool)
+                keep[positions] = False
+            elif spec.kind == "offline":
+                if statuses is None:
+                    statuses = np.zeros(len(values), dtype=np.int8)
+                statuses[positions] = STATUS_OFFLINE
+
+            # 종료 시각이 지났지만 아직 적용 전이었던 장애는 이번 틱만 적용하고 종료
+            if fault.ended:
+                self._finish(key)
+        return statuses, keep
+
+    def _finish(self, key: Tuple[int, int]):
+        fault = self.active.pop(key)
+        spec = fault.spec
+        record = {
+            "kind": spec.kind,
+            "target": spec.target,
+            "occurrence": fault.occurrence,
+            "scheduled_start": format_ms(fault.scheduled_ms[0]),
+            "scheduled_end": format_ms(fault.scheduled_ms[1]),
+            "first_tick": format_ms(fault.started_ms),
+            "last_tick": format_ms(fault.last_ms),
+            "sensors": len(fault.positions),
+            "ticks": fault.ticks,
+            "messages": fault.messages
+        }
+        if spec.magnitude is not None:
+            record["magnitude"] = spec.magnitude
+        if fault.ids is not None:
+            record["sensor_ids"] = fault.ids.tolist()
+        elif fault.ranges is not None:
+            record["sensor_ranges"] = fault.ranges.tolist()
+        self.records.append(record)
+        self.log(f"✅ 장애 종료: {self.describe_fault(fault)}, {fault.ticks:,}틱 / 메시지 {fault.messages:,}건")
+
+    @staticmethod
+    def describe_fault(fault: ActiveFault) -> str:
+        spec = fault.spec
+        text = f"{spec.kind} → {spec.target}"
+        if spec.every is not None:
+            text += f" ({fault.occurrence + 1}회차)"
+        return text
+
+    def finish_all(self):
+        """실행 종료 시 진행 중인 장애 기록 마감"""
+        for key in [key for key, fault in self.active.items() if fault.ticks]:
+            self._finish(key)
+        self.active.clear()
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """종류별 (횟수, 영향 메시지 수)"""
+        result: Dict[str, Dict[str, int]] = {}
+        for record in self.records:
+            kind = result.setdefault(record["kind"], {"count": 0, "messages": 0})
+            kind["count"] += 1
+            kind["messages"] += record["messages"]
+        return result
+
+    def describe(self) -> str:
+        summary = self.summary()
+        if not summary:
+            return "주입한 장애 없음"
+        return ", ".join(f"{kind} {item['count']}회 (메시지 {item['messages']:,}건)" for kind, item in summary.items())
+
+    def write_report(self, path: str):
+        """적용 기록을 JSON 줄 형식으로 저장 (백엔드 경보와 시각/센서 대조용)"""
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import gzip
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from payload_codecs import Timestamp
+from payload_encoder import PayloadEncoder, PAYLOAD_FIELDS, STATUS_NORMAL
+from defaults import SINK_FORMATS
+
+# 파일 쓰기 버퍼 크기
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+class SensorTick:
+    """한 틱의 센서 스냅샷 (값 배열 + 레지스트리 열 복사본, 장애 주입 시 센서별 상태 코드, 부가 필드 사용 시 센서 × 부가 필드 행렬)"""
+
+    __slots__ = ("values", "sensor_ids", "type_codes", "names", "heads", "statuses", "aux")
+
+    def __init__(self, values: np.ndarray, sensor_ids: List[int], type_codes: List[int],
+                 names: List[str], heads: List[bytes], statuses: Optional[np.ndarray] = None,
+                 aux: Optional[np.ndarray] = None):
+        self.values = values
+        self.sensor_ids = sensor_ids
+        self.type_codes = type_codes
+        self.names = names
+        self.heads = heads
+        # None이면 모두 정상 (STATUS_NORMAL)
+        self.statuses = statuses
+        # None이면 부가 필드 없음 (AuxFieldEngine.step 결과)
+        self.aux = aux
+
+    def __len__(self) -> int:
+        return len(self.sensor_ids)
+
+    def status_list(self) -> List[int]:
+        if self.statuses is None:
+            return [STATUS_NORMAL] * len(self.sensor_ids)
+        return self.statuses.tolist()
+
+    def aux_list(self) -> List[Optional[List[float]]]:
+        if self.aux is None:
+            return [None] * len(self.sensor_ids)
+        return self.aux.tolist()
+
+    def select(self, mask: np.ndarray) -> "SensorTick":
+        """mask가 True인 센서만 남긴 스냅샷 (dropout 장애)"""
+        positions = np.flatnonzero(mask).tolist()
+        return SensorTick(
+            self.values[mask],
+            [self.sensor_ids[idx] for idx in positions],
+            [self.type_codes[idx] for idx in positions],
+            [self.names[idx] for idx in positions],
+            [self.heads[idx] for idx in positions],
+            self.statuses[mask] if self.statuses is not None else None,
+            self.aux[mask] if self.aux is not None else None
+        )
+
+
+class FileSink:
+    """생성 데이터를 회전 파일로 기록하는 출력 (브로커를 거치지 않는 대량 적재용)
+
+    생성 스레드는 틱 스냅샷을 제한 큐에 넣기만 하고, 쓰기 스레드가 포맷 변환과 파일 쓰기를 맡는다.
+    큐가 가득 차면 생성 쪽이 기다리므로 디스크 속도가 곧 생성 속도가 된다.
+
+    - ndjson: 한 줄에 MQTT JSON 페이로드와 같은 레코드 하나 (gzip 선택)
+    - columnar: NumPy .npz 청크 (sensor_id, sensor_type, ts_ms, value, status 열, 부가 필드는 싣지 않음)
+
+    파일은 max_bytes(ndjson) / chunk_rows(columnar) 또는 max_seconds가 지나면 새 파일로 넘어간다.
+    """
+
+    def __init__(self, path: str, fmt: str = "ndjson", use_gzip: bool = False,
+                 max_bytes: int = 256 * 1024 * 1024, max_seconds: float = 3600.0,
+                 chunk_rows: int = 1000000, queue_ticks: int = 64,
+                 encoder: Optional[PayloadEncoder] = None, log=None):
+        if fmt not in SINK_FORMATS:
+            raise ValueError(f"알 수 없는 파일 형식입니다: {fmt} (사용 가능: {', '.join(SINK_FORMATS)})")
+        self.path = path
+        self.format = fmt
+        self.use_gzip = use_gzip
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.chunk_rows = chunk_rows
+        self.encoder = encoder or PayloadEncoder()
+        self.log = log or print
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_ticks)
+        self._thread: Optional[threading.Thread] = None
+
+        # 쓰기 스레드 상태
+        self._file = None
+        self._file_path: Optional[str] = None
+        self._file_bytes = 0
+        self._file_opened = 0.0
+        self._sequence = 0
+        self._columns: Dict[str, List[np.ndarray]] = {}
+        self._column_rows = 0
+
+        # 통계 (쓰기 스레드에서 갱신)
+        self.rows_written = 0
+        self.bytes_written = 0
+        self.files_written = 0
+        self.error: Optional[Exception] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], encoder: Optional[PayloadEncoder] = None, log=None) -> "FileSink":
+        """{"path", "format", "gzip", "max_mb", "max_seconds", "chunk_rows"} 설정으로 생성"""
+        return cls(
+            config["path"],
+            config.get("format", "ndjson"),
+            bool(config.get("gzip", False)),
+            int(float(config.get("max_mb", 256)) * 1024 * 1024),
+            float(config.get("max_seconds", 3600)),
+            int(config.get("chunk_rows", 1000000)),
+            encoder=encoder,
+            log=log
+        )
+
+    def start(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._writer_loop, name="file-sink", daemon=True)
+        self._thread.start()
+
+    def write_tick(self, tick: SensorTick, timestamp: Timestamp):
+        """틱 스냅샷 기록 요청 (큐가 가득 차면 대기)"""
+        if self.error:
+            raise RuntimeError(f"파일 출력 오류: {self.error}")
+        if len(tick):
+            self._queue.put((tick, timestamp))
+
+    def close(self):
+        """남은 데이터를 모두 기록하고 파일 닫기"""
+        if not self._thread:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def describe(self) -> str:
+        kind = "NDJSON" + (".gz" if self.use_gzip else "") if self.format == "ndjson" else "columnar .npz"
+        return f"{self.path}* ({kind})"
+
+    # ------------------------------------------------------------------
+    # 쓰기 스레드
+    # ------------------------------------------------------------------
+    def _writer_loop(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                tick, timestamp = item
+                if self.format == "ndjson":
+                    self._write_ndjson(tick, timestamp)
+                else:
+                    self._write_columnar(tick, timestamp)
+        except Exception as e:
+            self.error = e
+            self.log(f"❌ 파일 출력 오류: {str(e)}")
+            # 생산자가 막히지 않도록 남은 항목 비우기
+            while self._queue.get() is not None:
+                pass
+        finally:
+            if self.format == "columnar":
+                self._flush_columns()
+            self._close_file()
+
+    def _next_path(self, extension: str) -> str:
+        self._sequence += 1
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        return f"{self.path}-{stamp}-{self._sequence:04d}{extension}"
+
+    def _open_file(self):
+        if self.use_gzip:
+            self._file_path = self._next_path(".ndjson.gz")
+            # 처리량 우선 (압축 수준 1)
+            self._file = gzip.open(self._file_path, "wb", compresslevel=1)
+        else:
+            self._file_path = self._next_path(".ndjson")
+            self._file = open(self._file_path, "wb", buffering=WRITE_BUFFER_SIZE)
+        self._file_bytes = 0
+        self._file_opened = time.monotonic()
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+            self.files_written += 1
+
+    def _write_ndjson(self, tick: SensorTick, timestamp: Timestamp):
+        encoder = self.encoder
+        ts = timestamp[0]
+        if tick.aux is None:
+            lines = [
+                encoder.encode(head, type_code, encoder.round_value(type_code, value), ts, status)
+                for type_code, head, value, status in zip(tick.type_codes, tick.heads, tick.values.tolist(),
+                                                          tick.status_list())
+            ]
+        else:
+            lines = [
+                encoder.encode_aux(head, type_code, encoder.round_value(type_code, value), aux, ts, status)
+                for type_code, head, value, status, aux in zip(tick.type_codes, tick.heads, tick.values.tolist(),
+                                                               tick.status_list(), tick.aux_list())
+            ]
+        # 틱 단위로 한 번에 기록 (줄마다 write 호출 없음)
+        block = b"\n".join(lines) + b"\n"
+
+        if self._file is None or self._file_bytes >= self.max_bytes or \
+                time.monotonic() - self._file_opened >= self.max_seconds:
+            self._close_file()
+            self._open_file()
+        self._file.write(block)
+        self._file_bytes += len(block)
+        self.rows_written += len(lines)
+        self.bytes_written += len(block)
+
+    def _write_columnar(self, tick: SensorTick, timestamp: Timestamp):
+        rows = len(tick)
+        columns = self._columns
+        if not columns:
+            self._file_opened = time.monotonic()
+            columns.update({"sensor_id": [], "sensor_type": [], "ts_ms": [], "value": [], "status": []})
+        columns["sensor_id"].append(np.asarray(tick.sensor_ids, dtype=np.int64))
+        columns["sensor_type"].append(np.asarray(tick.type_codes, dtype=np.int8))
+        columns["ts_ms"].append(np.full(rows, timestamp[1], dtype=np.int64))
+        columns["value"].append(self._round_values(tick))
+        columns["status"].append(tick.statuses if tick.statuses is not None else np.zeros(rows, dtype=np.int8))
+        self._column_rows += rows
+        self.rows_written += rows
+
+        if self._column_rows >= self.chunk_rows or time.monotonic() - self._file_opened >= self.max_seconds:
+            self._flush_columns()
+
+    @staticmethod
+    def _round_values(tick: SensorTick) -> np.ndarray:
+        """타입별 자릿수로 반올림 (페이로드 값과 같은 정밀도)"""
+        codes = np.asarray(tick.type_codes, dtype=np.int8)
+        values = tick.values.copy()
+        for type_code, (_, digits, _) in PAYLOAD_FIELDS.items():
+            mask = codes == type_code
+            values[mask] = np.round(values[mask], digits)
+        return values
+
+    def _flush_columns(self):
+        """모인 열을 .npz 청크 파일 하나로 기록"""
+        if not self._column_rows:
+            return
+        path = self._next_path(".npz")
+        arrays = {name: np.concatenate(parts) for name, parts in self._columns.items()}
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            np.savez(f, **arrays)
+        self.bytes_written += os.path.getsize(path)
+        self.files_written += 1
+        self._columns.clear()
+        self._column_rows = 0
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sensor_types import SENSOR_TYPE_CODES, SENSOR_TYPE_NAMES
+
+# 확장자 → 파일 형식
+FLEET_FORMATS = {
+    ".csv": "csv",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml"
+}
+
+# 오류 메시지에 보여줄 최대 행 수
+MAX_REPORTED_ERRORS = 10
+
+
+class SensorDefinition(NamedTuple):
+    """가져온 센서 정의 (기준값/변동 범위가 None이면 타입 기본값 사용)"""
+    sensor_type: str
+    sensor_id: int
+    name: str
+    base_value: Optional[float] = None
+    variation: Optional[float] = None
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return float(value)
+
+
+def parse_sensor_type(value: Any) -> str:
+    """센서 타입 이름 또는 코드(1/2/3) → 타입 이름"""
+    text = str(value).strip()
+    if text in SENSOR_TYPE_CODES:
+        return text
+    if text.isdigit() and int(text) in SENSOR_TYPE_NAMES:
+        return SENSOR_TYPE_NAMES[int(text)]
+    raise ValueError(f"알 수 없는 센서 타입 '{text}'")
+
+
+def _rows_from_mapping(data: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    """설정 파일 형식 {"sensors": {타입: [{id, name, ...}]}} 또는 {타입: [...]} → (위치, 행)"""
+    sensors = data.get("sensors", data)
+    if isinstance(sensors, list):
+        for position, row in enumerate(sensors):
+            yield f"sensors[{position}]", row
+        return
+    for sensor_type, rows in sensors.items():
+        if not isinstance(rows, list):
+            raise ValueError(f"'{sensor_type}' 항목은 센서 목록이어야 합니다.")
+        for position, row in enumerate(rows):
+            if isinstance(row, dict):
+                row = dict(row)
+                row.setdefault("type", sensor_type)
+            yield f"{sensor_type}[{position}]", row
+
+
+def _structured_rows(data: Any) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    if isinstance(data, list):
+        return ((f"[{position}]", row) for position, row in enumerate(data))
+    if isinstance(data, dict):
+        return _rows_from_mapping(data)
+    raise ValueError("센서 목록은 배열 또는 {타입: [센서...]} 객체여야 합니다.")
+
+
+def _read_rows(path: str, fleet_format: str) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    """파일 → (오류 표시용 위치, 행 딕셔너리)"""
+    if fleet_format == "csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            missing = {"id", "type", "name"} - set(reader.fieldnames or [])
+            if missing:
+                raise ValueError(f"CSV 헤더에 필요한 열이 없습니다: {', '.join(sorted(missing))}")
+            # 헤더가 1행이므로 데이터는 2행부터
+            return [(f"{line}행", row) for line, row in enumerate(reader, start=2)]
+
+    with open(path, "r", encoding="utf-8") as f:
+        if fleet_format == "json":
+            data = json.load(f)
+        else:
+            # PyYAML은 YAML 파일을 가져올 때만 불러옴 (미설치 시 YAML 가져오기만 사용 불가)
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML 파일을 가져오려면 PyYAML이 필요합니다 (pip install pyyaml).")
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"YAML 형식 오류: {e}")
+    return list(_structured_rows(data))
+
+
+def parse_definitions(rows: Iterable[Tuple[str, Dict[str, Any]]]) -> List[SensorDefinition]:
+    """행 목록을 한 번 순회하며 형식 검사 + 파일 안 중복 ID 검출 (오류는 모아서 한 번에 ValueError)"""
+    definitions: List[SensorDefinition] = []
+    errors: List[str] = []
+    first_seen: Dict[int, str] = {}
+    for position, row in rows:
+        try:
+            if not isinstance(row, dict):
+                raise ValueError("센서 정의는 객체여야 합니다")
+            id_text = str(row.get("id", "")).strip()
+            if not id_text.lstrip("-").isdigit():
+                raise ValueError(f"센서 ID가 정수가 아닙니다: '{id_text}'")
+            sensor_id = int(id_text)
+            sensor_type = parse_sensor_type(row.get("type", ""))
+            name = str(row.get("name") or "").strip()
+            if not name:
+                raise ValueError("센서 이름이 비어 있습니다")
+            base_value = _optional_float(row.get("base_value"))
+            variation = _optional_float(row.get("variation"))
+            if variation is not None and variation < 0:
+                raise ValueError("변동 범위는 0 이상이어야 합니다")
+        except (TypeError, ValueError) as e:
+            errors.append(f"{position}: {e}")
+            continue
+        if sensor_id in first_seen:
+            errors.append(f"{position}: 센서 ID {sensor_id} 중복 (처음 나온 위치: {first_seen[sensor_id]})")
+            continue
+        first_seen[sensor_id] = position
+        definitions.append(SensorDefinition(sensor_type, sensor_id, name, base_value, variation))
+
+    if errors:
+        more = f"\n... 외 {len(errors) - MAX_REPORTED_ERRORS}건" if len(errors) > MAX_REPORTED_ERRORS else ""
+        raise ValueError(f"센서 정의 오류 {len(errors)}건:\n" + "\n".join(errors[:MAX_REPORTED_ERRORS]) + more)
+    return definitions
+
+
+def load_fleet(path: str) -> List[SensorDefinition]:
+    """CSV/JSON/YAML 센서 목록 파일 읽기 (열/키: id, type, name, 선택 base_value, variation)"""
+    fleet_format = FLEET_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fleet_format is None:
+        raise ValueError(f"지원하지 않는 센서 목록 형식입니다: {path} (사용 가능: {', '.join(FLEET_FORMATS)})")
+    return parse_definitions(_read_rows(path, fleet_format))
@@ -0,0 +1,1048 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+import time
+import datetime
+import random
+from typing import Dict, Any, Optional, Callable, List, Tuple, Iterator, TYPE_CHECKING
+
+from sensor_registry import SensorRegistry
+from sensor_types import (SENSOR_TYPES, SENSOR_TYPE_CODES, SENSOR_BOUNDS, MESSAGE_DESCRIPTIONS,
+                          register_sensor_type, sensor_type_from_config)
+from tick_engine import VectorTickEngine
+from load_profile import RateScheduler, ConstantProfile, parse_profile
+from mqtt_connection import create_mqtt_client, is_connect_failure, MQTTv311, MQTTv5, MQTT_ERR_SUCCESS
+from publish_stats import PublishStats
+from payload_encoder import PayloadEncoder
+from backfill import VirtualClock
+from payload_codecs import CodecSelector, Timestamp, make_timestamp, STRUCT_MAX_SENSOR_ID
+from file_sink import FileSink, SensorTick
+from fleet_import import SensorDefinition, load_fleet
+from stream_replay import StreamRecorder
+from inflight_window import InFlightWindow
+from latency_metrics import LatencyTracker, format_latency
+from value_prefetch import ValuePrefetcher
+from fault_injection import FaultInjector, parse_faults
+from aux_fields import AuxFieldEngine
+from payload_encoder import STATUS_NORMAL, STATUS_OFFLINE
+from defaults import (DEFAULT_BROKER, DEFAULT_PORT, DEFAULT_CLIENT_ID, DEFAULT_TOPIC_PREFIX, DEFAULT_INTERVAL,
+                      DEFAULT_SENSORS, OUTPUT_MODES, DEFAULT_CHECKPOINT_INTERVAL)
+
+# 연결 풀(asyncio)/메트릭 엔드포인트(http.server)는 쓸 때만 불러옴 (시작 시간 단축)
+if TYPE_CHECKING:
+    import paho.mqtt.client as mqtt
+    from async_publisher import AsyncPublisherPool
+    from metrics_server import MetricsServer
+    from state_checkpoint import StateCheckpointer
+
+
+
+def default_log(message: str):
+    """헤드리스 실행용 기본 로그 출력"""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"[{timestamp}] {message}")
+
+
+class GeneratorEngine:
+    """Tk 위젯과 분리된 센서 데이터 생성 엔진 (GUI/CLI 공용)"""
+
+    # 헤드리스 실행 시 연결 풀/발행 창/지연 보고 주기 (초)
+    POOL_REPORT_INTERVAL = 5.0
+    # 헤드리스 종료 시 마지막 발행의 브로커 확인을 기다리는 최대 시간 (초)
+    SHUTDOWN_DRAIN_TIMEOUT = 5.0
+
+    # 백필 진행 보고 주기 (초) 및 발행을 멈추고 확인을 기다리는 미확인 메시지 수
+    BACKFILL_REPORT_INTERVAL = 5.0
+    BACKFILL_MAX_IN_FLIGHT = 10000
+
+    def __init__(self, broker: str = DEFAULT_BROKER, port: int = DEFAULT_PORT,
+                 client_id: str = DEFAULT_CLIENT_ID, topic_prefix: str = DEFAULT_TOPIC_PREFIX,
+                 interval: float = DEFAULT_INTERVAL,
+                 log_callback: Optional[Callable[[str], None]] = None):
+        # MQTT 설정
+        self.broker = broker
+        self.port = port
+        self.client_id = client_id
+        self.mqtt_client: Optional["mqtt.Client"] = None
+        self.is_connected = False
+        self.is_running = False
+        self.generator_thread: Optional[threading.Thread] = None
+
+        # 연결 수 (2 이상이면 asyncio 연결 풀 사용, 클라이언트 ID는 {client_id}-0..N-1)
+        self.connection_count = 1
+        self.publisher_pool: Optional["AsyncPublisherPool"] = None
+
+        # 발행 주기 (초)
+        self.interval = interval
+
+        # 개방 루프 부하 모드 스케줄러 (None이면 주기 모드)
+        self.rate_scheduler: Optional[RateScheduler] = None
+
+        # 백필 모드 가상 시계 (지정 시 가상 시각으로 최대한 빠르게 발행)
+        self.backfill_clock: Optional[VirtualClock] = None
+        self.backfill_done = False
+
+        # 출력 대상 (mqtt/file/both) 및 파일 출력 설정 (시작할 때마다 새 파일 묶음 생성)
+        self.output = "mqtt"
+        self.sink_config: Optional[Dict[str, Any]] = None
+        self.file_sink: Optional[FileSink] = None
+
+        # 발행 스트림 녹화 경로 (지정 시 시작할 때마다 토픽/페이로드/발행 시각을 그대로 기록, replay로 재생)
+        self.record_path: Optional[str] = None
+        self.recorder: Optional[StreamRecorder] = None
+
+        # 토픽 프리픽스 설정 (환경별 분리용)
+        self.topic_prefix = topic_prefix  # 기본값: HS, 개발환경: AHS, 테스트환경: THS 등
+
+        # 이벤트 콜백 (GUI 등 클라이언트가 연결)
+        self.log_callback = log_callback or default_log
+        # 메시지별 전송 로그 (미지정 시 log_callback으로 전달, LogPipeline.log_message로 샘플링)
+        self.message_log_callback: Optional[Callable[[str], None]] = None
+        self.on_connection_change: Optional[Callable[[bool], None]] = None
+
+        # 센서 설정 (동적 설정 가능, 센서별 기준값/트렌드/마지막 값 포함)
+        self.registry = SensorRegistry()
+
+        # 센서 타입별 기준값 (새로 추가되는 센서의 초기 기준값), 변동 범위/트렌드 변화 확률,
+        # 타입 공통 트렌드 (단일 값 경로 generate_realistic_value 전용, 배치 경로는 센서별 트렌드 사용)
+        # 모두 센서 타입 표(sensor_types)에서 채움
+        self.sensor_values: Dict[str, Dict[str, float]] = {}
+        self.sensor_variations: Dict[str, Dict[str, float]] = {}
+        self.sensor_trends: Dict[str, float] = {}
+        self.load_sensor_types()
+
+        # 타입 단위 배치 값 계산 엔진
+        self.tick_engine = VectorTickEngine(self.sensor_variations)
+
+        # 단일 값 경로 난수 생성기 (set_seed로 실행 시드 지정 시 재현 가능)
+        self.rng = random.Random()
+
+        # ADC/부가 필드 계산 엔진 (None이면 주 값만, 지정 시 JSON/ndjson 페이로드에 v1과 같은 다중 필드)
+        self.aux_engine: Optional[AuxFieldEngine] = None
+
+        # 값 선계산 틱 수 (0이면 틱마다 생성 스레드에서 계산, 지정 시 백그라운드 스레드가 블록 단위로 미리 계산)
+        self.prefetch_ticks = 0
+        self.value_prefetcher: Optional[ValuePrefetcher] = None
+
+        # 미리 인코딩한 조각으로 페이로드 조립, 토픽 프리픽스별 코덱(JSON/MessagePack/CBOR/struct) 선택
+        self.payload_encoder = PayloadEncoder()
+        self.codec_selector = CodecSelector(self.payload_encoder)
+        self.publish_properties = None  # MQTT v5 content-type 태그 (태그 방식이 content-type일 때)
+
+        # 예약 장애 주입 (None이면 사용 안 함) 및 적용 기록 파일 경로
+        self.fault_injector: Optional[FaultInjector] = None
+        self.fault_report_path: Optional[str] = None
+
+        # 상태 체크포인트 경로/저장 주기 (None이면 사용 안 함, 지정 시 생성 중 주기적으로 저장하고 중지할 때 한 번 더)
+        self.checkpoint_path: Optional[str] = None
+        self.checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+        self.checkpointer: Optional["StateCheckpointer"] = None
+
+        # QoS1 발행 창 (None이면 제한 없음, 지정 시 mid별로 PUBACK까지 추적하고 block/drop/slow 정책 적용)
+        self.in_flight_window: Optional[InFlightWindow] = None
+
+        # 발행 → PUBACK 지연 히스토그램 (센서 타입 × 연결별) 및 Prometheus 엔드포인트 포트 (None이면 사용 안 함)
+        self.latency = LatencyTracker(self.registry)
+        self.metrics_port: Optional[int] = None
+        self.metrics_server: Optional["MetricsServer"] = None
+
+        # 발행 통계 (스레드별 누적기, GUI는 주기적으로 sample()만 읽음)
+        self.stats = PublishStats()
+        self.error_count = 0
+
+    def log(self, message: str):
+        """로그 메시지 전달"""
+        self.log_callback(message)
+
+    def log_message(self, description: str):
+        """메시지별 전송 로그 전달"""
+        if self.message_log_callback:
+            self.message_log_callback(description)
+        else:
+            self.log_callback(description)
+
+    # ------------------------------------------------------------------
+    # 센서 타입
+    # ------------------------------------------------------------------
+    def load_sensor_types(self):
+        """센서 타입 표에 있는데 아직 없는 타입의 기준값/변동 범위/트렌드 채우기 (기존 설정은 유지)"""
+        for name, sensor_type in SENSOR_TYPES.items():
+            self.sensor_values.setdefault(name, {name: sensor_type.default_value})
+            self.sensor_variations.setdefault(name, {"range": sensor_type.variation,
+                                                     "trend_probability": sensor_type.trend_probability})
+            self.sensor_trends.setdefault(name, 0.0)
+
+    def reload_sensor_types(self):
+        """센서 타입 표가 바뀐 뒤 타입별 조회 테이블/페이로드 조각 다시 만들기"""
+        self.load_sensor_types()
+        self.tick_engine.build_tables(self.sensor_variations)
+        self.payload_encoder.compile()
+        if self.aux_engine:
+            self.aux_engine.compile()
+        if self.value_prefetcher:
+            self.value_prefetcher.invalidate()
+
+    def register_sensor_types(self, definitions: List[Dict[str, Any]]):
+        """설정의 사용자 정의 센서 타입 등록 (형식은 sensor_type_from_config, 잘못되면 ValueError)"""
+        for definition in definitions:
+            sensor_type = register_sensor_type(sensor_type_from_config(definition))
+            self.log(f"🧩 센서 타입 등록: {sensor_type.name} (코드 {sensor_type.code}, {sensor_type.label}, "
+                     f"{sensor_type.unit})")
+        self.reload_sensor_types()
+
+    def set_aux_fields(self, enabled: bool):
+        """ADC/부가 필드 사용 여부 (JSON 코덱과 ndjson 파일 출력에만 실림)"""
+        if enabled and not self.aux_engine:
+            self.aux_engine = AuxFieldEngine()
+            self.aux_engine.set_seed(self.tick_engine.seed)
+        elif not enabled:
+            self.aux_engine = None
+
+    # ------------------------------------------------------------------
+    # 센서 관리
+    # ------------------------------------------------------------------
+    def add_default_sensors(self):
+        """기본 센서 추가"""
+        self.registry.clear()
+        for sensor_type, sensors in DEFAULT_SENSORS.items():
+            for sensor in sensors:
+                self.add_sensor(sensor_type, sensor["id"], sensor["name"])
+
+    def add_sensor(self, sensor_type: str, sensor_id: int, sensor_name: str,
+                   base_value: Optional[float] = None, variation: Optional[float] = None):
+        """센서 추가 (잘못된 입력이면 ValueError, 기준값/변동 범위 미지정 시 타입 기본값)"""
+        if sensor_type not in SENSOR_TYPE_CODES:
+            raise ValueError(f"알 수 없는 센서 타입입니다: {sensor_type}")
+        if not sensor_name:
+            raise ValueError("센서 이름을 입력하세요.")
+
+        # 중복 ID 체크는 레지스트리 해시로 O(1) 처리, 페이로드 고정부는 등록 시 한 번만 인코딩
+        type_code = SENSOR_TYPE_CODES[sensor_type]
+        if base_value is None:
+            base_value = self.sensor_values[sensor_type][sensor_type]
+        if variation is None:
+            variation = self.sensor_variations[sensor_type]["range"]
+        self.check_codec_ids([sensor_id])
+        payload_head = self.payload_encoder.render_head(sensor_id, type_code, sensor_name)
+        self.registry.add(sensor_id, type_code, sensor_name, base_value, payload_head=payload_head,
+                          variation=variation)
+
+    def add_sensors(self, definitions: List[SensorDefinition], replace: bool = False) -> int:
+        """센서 일괄 추가 (검사/중복 확인은 한 번 순회, 레지스트리에는 열 단위로 한 번에 추가)
+
+        하나라도 잘못되면 아무것도 추가하지 않고 ValueError. replace면 모두 검사한 뒤에 기존 센서를 바꿔치기한다.
+        추가한 센서 수 반환.
+        """
+        ids, type_codes, names, base_values, variations, heads = [], [], [], [], [], []
+        render_head = self.payload_encoder.render_head
+        for sensor_type, sensor_id, sensor_name, base_value, variation in definitions:
+            if sensor_type not in SENSOR_TYPE_CODES:
+                raise ValueError(f"알 수 없는 센서 타입입니다: {sensor_type} (센서 ID {sensor_id})")
+            if not sensor_name:
+                raise ValueError(f"센서 이름이 비어 있습니다 (센서 ID {sensor_id})")
+            type_code = SENSOR_TYPE_CODES[sensor_type]
+            ids.append(sensor_id)
+            type_codes.append(type_code)
+            names.append(sensor_name)
+            base_values.append(self.sensor_values[sensor_type][sensor_type] if base_value is None else base_value)
+            variations.append(self.sensor_variations[sensor_type]["range"] if variation is None else variation)
+            heads.append(render_head(sensor_id, type_code, sensor_name))
+        self.check_codec_ids(ids)
+        return self.registry.add_many(ids, type_codes, names, base_values, variations, heads, replace=replace)
+
+    def check_codec_ids(self, ids):
+        """struct 코덱을 쓰는 프리픽스가 있으면 센서 ID가 uint32 범위인지 확인 (벗어나면 ValueError)"""
+        if not len(ids) or not self.codec_selector.uses("struct"):
+            return
+        low, high = min(ids), max(ids)
+        if low < 0 or high > STRUCT_MAX_SENSOR_ID:
+            bad = low if low < 0 else high
+            raise ValueError(f"struct 코덱은 센서 ID 0~{STRUCT_MAX_SENSOR_ID}만 담을 수 있습니다: {bad}")
+
+    def import_fleet(self, path: str, replace: bool = False) -> int:
+        """CSV/JSON/YAML 센서 목록 파일 가져오기 (replace면 파일 검사가 끝난 뒤 기존 센서를 모두 바꿈, 실패하면 그대로)"""
+        definitions = load_fleet(path)
+        count = self.add_sensors(definitions, replace=replace)
+        self.log(f"📂 센서 {count:,}개를 가져왔습니다: {path} (전체 {len(self.registry):,}개)")
+        return count
+
+    def remove_sensor(self, sensor_id: int):
+        """센서 삭제 (없는 ID면 KeyError)"""
+        self.registry.remove(sensor_id)
+
+    def sensors_of_type(self, sensor_type: str) -> List[Dict[str, Any]]:
+        """타입별 센서 목록 (id, name)"""
+        return list(self.registry.iter_type(SENSOR_TYPE_CODES[sensor_type]))
+
+    def set_base_value(self, sensor_type: str, value: float):
+        """센서 타입별 기준값 설정 (해당 타입의 모든 센서에 적용)"""
+        value = float(value)
+        self.sensor_values[sensor_type][sensor_type] = value
+        self.registry.set_base_for_type(SENSOR_TYPE_CODES[sensor_type], value)
+        if self.value_prefetcher:
+            self.value_prefetcher.invalidate()
+
+    def set_seed(self, seed: Optional[int], start_tick: int = 0):
+        """실행 시드 지정 (None이면 매 실행 다른 값, 지정 시 센서별 스트림으로 같은 값 재현)
+
+        start_tick부터 시작하면 앞선 틱을 계산하지 않고 그 틱의 값부터 바로 이어서 생성한다.
+        """
+        if seed is not None:
+            seed = int(seed)
+        self.tick_engine.set_seed(seed)
+        self.tick_engine.seek(int(start_tick))
+        self.rng.seed(seed)
+        if self.aux_engine:
+            self.aux_engine.set_seed(seed)
+        if self.value_prefetcher:
+            self.value_prefetcher.invalidate()
+
+    def set_topic_prefix(self, new_prefix: str):
+        """토픽 프리픽스 변경 (잘못된 입력이면 ValueError)"""
+        new_prefix = new_prefix.strip()
+        if not new_prefix:
+            raise ValueError("토픽 프리픽스를 입력하세요.")
+
+        # 영문자와 숫자만 허용 (보안 강화)
+        if not new_prefix.replace('_', '').isalnum():
+            raise ValueError("토픽 프리픽스는 영문자, 숫자, 언더스코어(_)만 사용 가능합니다.")
+
+        self.topic_prefix = new_prefix
+
+    # ------------------------------------------------------------------
+    # MQTT 연결
+    # ------------------------------------------------------------------
+    def connect(self):
+        """MQTT 브로커에 연결 (실패 시 예외 발생)"""
+        if not self.broker or not self.client_id:
+            raise ValueError("브로커 주소와 클라이언트 ID를 입력하세요.")
+
+        if self.connection_count > 1:
+            from async_publisher import AsyncPublisherPool
+            self.log(f"🔗 MQTT 브로커 연결 시도: {self.broker}:{self.port} (연결 {self.connection_count}개)")
+            self.publisher_pool = AsyncPublisherPool(
+                self.broker, self.port, self.client_id, self.connection_count,
+                protocol=self.mqtt_protocol(), log=self.log, on_connection_change=self.on_pool_connection_change,
+                on_publish=self.on_pool_publish,
+                on_publish_failed=self.on_pool_publish_failed,
+                on_publish_sent=self.on_pool_publish_sent
+            )
+            self.publisher_pool.start()
+            return
+
+        self.mqtt_client = create_mqtt_client(self.client_id, self.mqtt_protocol())
+        self.mqtt_client.on_connect = self.on_connect
+        self.mqtt_client.on_disconnect = self.on_disconnect
+        self.mqtt_client.on_publish = self.on_publish
+
+        self.log(f"🔗 MQTT 브로커 연결 시도: {self.broker}:{self.port}")
+        self.mqtt_client.connect(self.broker, self.port, 60)
+        self.mqtt_client.loop_start()
+
+    def mqtt_protocol(self) -> int:
+        """코덱 태그를 content-type 속성으로 보내려면 MQTT v5, 그 외에는 기존 3.1.1"""
+        if self.codec_selector.tag_mode == "content-type":
+            return MQTTv5
+        return MQTTv311
+
+    def disconnect(self):
+        """MQTT 브로커 연결 해제"""
+        if self.is_running:
+            self.stop()
+        if self.in_flight_window:
+            self.in_flight_window.reset()
+        self.latency.reset_pending()
+        if self.publisher_pool:
+            self.publisher_pool.stop()
+            self.publisher_pool = None
+        if self.mqtt_client:
+            self.mqtt_client.loop_stop()
+            self.mqtt_client.disconnect()
+
+    def on_connect(self, client, userdata, flags, reason_code=None, properties=None):
+        """MQTT 연결 성공 콜백 (paho-mqtt v2 API)"""
+        if not is_connect_failure(reason_code):
+            self.is_connected = True
+            self.log("✅ MQTT 브로커에 연결되었습니다.")
+            if self.on_connection_change:
+                self.on_connection_change(True)
+        else:
+            self.log(f"❌ MQTT 연결 실패: {reason_code}")
+
+    def on_pool_connection_change(self, connected: bool):
+        """연결 풀 전체 상태 변경 콜백 (모든 연결이 붙어야 연결됨)"""
+        if connected:
+            self.on_connect(None, None, None, 0)
+        else:
+            self.on_disconnect(None, None)
+
+    def on_disconnect(self, client, userdata, flags=None, reason_code=None, properties=None):
+        """MQTT 연결 해제 콜백 (paho-mqtt v2 API)"""
+        self.is_connected = False
+        self.log("❌ MQTT 브로커 연결이 해제되었습니다.")
+        if self.on_connection_change:
+            self.on_connection_change(False)
+
+    def on_publish(self, client, userdata, mid, reason_codes=None, properties=None):
+        """메시지 발행 완료 콜백 (paho-mqtt v2 API, 네트워크 스레드 누적기만 갱신)"""
+        self.stats.add_acked()
+        self.latency.acked((0, mid))
+        if self.in_flight_window:
+            self.in_flight_window.release((0, mid))
+
+    # 연결 풀 콜백 (루프 스레드, 발행 창 키는 (연결 번호, mid))
+    def on_pool_publish(self, index: int, mid: int):
+        self.stats.add_acked()
+        self.latency.acked((index, mid))
+        if self.in_flight_window:
+            self.in_flight_window.release((index, mid))
+
+    def on_pool_publish_sent(self, index: int, mid: int, sensor_id: int, sent_ns: int):
+        self.latency.stamp((index, mid), sensor_id, sent_ns)
+        if self.in_flight_window:
+            self.in_flight_window.track((index, mid))
+
+    def on_pool_publish_failed(self, index: int, rc: int):
+        self.stats.add_failed()
+        if self.in_flight_window:
+            self.in_flight_window.cancel()
+
+    def status(self) -> Dict[str, Any]:
+        """현재 상태/누적 카운터 (다중 프로세스 집계용)"""
+        totals = self.stats.totals()
+        return {
+            "connected": self.is_connected,
+            "running": self.is_running,
+            "sensors": len(self.registry),
+            "published": totals["sent"],
+            "acked": totals["acked"],
+            "failed": totals["failed"],
+            "bytes": totals["bytes"],
+            "errors": self.error_count,
+            "dropped": self.in_flight_window.dropped if self.in_flight_window else 0,
+            "backfill_done": self.backfill_done,
+            "sink_rows": self.file_sink.rows_written if self.file_sink else 0
+        }
+
+    def wait_until_connected(self, timeout: float = 10.0) -> bool:
+        """연결 완료까지 대기"""
+        deadline = time.monotonic() + timeout
+        while not self.is_connected and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return self.is_connected
+
+    # ------------------------------------------------------------------
+    # 데이터 생성
+    # ------------------------------------------------------------------
+    @property
+    def uses_broker(self) -> bool:
+        """MQTT 브로커로 발행하는지 (파일 전용 출력이면 연결 불필요)"""
+        return self.output != "file"
+
+    def start(self):
+        """데이터 생성 스레드 시작"""
+        if self.uses_broker and not self.is_connected:
+            raise RuntimeError("먼저 MQTT 브로커에 연결하세요.")
+        if self.is_running:
+            return
+
+        if self.backfill_clock:
+            target = self.backfill_loop
+        elif self.rate_scheduler:
+            target = self.rate_loop
+        else:
+            target = self.generate_data_loop
+        if self.output != "mqtt":
+            self.open_file_sink()
+        if self.record_path and self.uses_broker:
+            self.recorder = StreamRecorder(self.record_path)
+            self.log(f"⏺️ 발행 녹화: {self.record_path}")
+
+        if self.in_flight_window:
+            self.in_flight_window.resume()
+        if self.fault_injector:
+            self.fault_injector.reset()
+        if self.prefetch_ticks:
+            self.value_prefetcher = ValuePrefetcher(self.tick_engine, self.registry, self.prefetch_ticks)
+            self.value_prefetcher.start()
+        if self.checkpoint_path and self.value_prefetcher and not self.tick_engine.streams:
+            # 시드 없는 선계산은 작업 스레드가 난수를 소비한 틱보다 앞서 뽑아 두므로 저장한 난수 상태로는
+            # 정확히 이어서 시작할 수 없음
+            self.log("⚠️ 시드 없이 선계산을 쓰면 정확히 이어서 시작할 수 없어 체크포인트를 저장하지 않습니다 "
+                     "(--seed를 지정하거나 --prefetch-ticks 없이 실행하세요)")
+        elif self.checkpoint_path:
+            from state_checkpoint import StateCheckpointer
+            self.checkpointer = StateCheckpointer(self, self.checkpoint_path, self.checkpoint_interval, log=self.log)
+            self.checkpointer.start()
+        self.is_running = True
+        self.generator_thread = threading.Thread(target=self.run_generation, args=(target,), daemon=True)
+        self.generator_thread.start()
+        self.log("▶️ 데이터 생성을 시작합니다.")
+
+    def run_generation(self, target: Callable[[], None]):
+        """생성 루프 실행 후 파일 출력/녹화 마무리 (생성 스레드가 유일한 기록자)"""
+        try:
+            target()
+        finally:
+            self.stop_checkpointer()
+            self.close_file_sink()
+            self.close_recorder()
+            self.stop_prefetcher()
+            self.finish_faults()
+
+    def stop_prefetcher(self):
+        prefetcher = self.value_prefetcher
+        if not prefetcher:
+            return
+        prefetcher.stop()
+        self.value_prefetcher = None
+        self.log(f"🧮 {prefetcher.describe()}")
+
+    def stop_checkpointer(self):
+        """체크포인트 저장 스레드 종료 후 마지막 상태 저장 (생성 루프가 끝난 뒤라 마지막으로 보낸 틱까지 반영)"""
+        checkpointer = self.checkpointer
+        if not checkpointer:
+            return
+        checkpointer.stop()
+        self.checkpointer = None
+        self.log(f"📍 체크포인트 {checkpointer.describe()}")
+
+    def resume_checkpoint(self, path: str) -> bool:
+        """체크포인트에서 센서 구성/값 상태/틱/난수 상태를 이어받음 (파일이 없으면 False, 형식이 잘못되면 ValueError)
+
+        시드와 틱도 체크포인트 값을 따르므로 중지 전 마지막 틱의 다음 값부터 같은 계열이 이어진다.
+        """
+        from state_checkpoint import restore_engine_state, describe_checkpoint
+
+        if not os.path.exists(path):
+            self.log(f"📍 체크포인트가 없어 처음부터 시작합니다: {path}")
+            return False
+        started = time.perf_counter()
+        meta = restore_engine_state(self, path)
+        self.log(f"📍 체크포인트에서 이어서 시작: {describe_checkpoint(meta)}, "
+                 f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        return True
+
+    def finish_faults(self):
+        """장애 주입 요약 로그 + 적용 기록 파일 저장 (실행할 때마다 그때까지의 전체 기록)"""
+        injector = self.fault_injector
+        if not injector:
+            return
+        injector.finish_all()
+        self.log(f"💥 장애 주입 요약: {injector.describe()}")
+        if self.fault_report_path:
+            try:
+                injector.write_report(self.fault_report_path)
+                self.log(f"💥 장애 기록 저장: {self.fault_report_path} ({len(injector.records)}건)")
+            except OSError as e:
+                self.log(f"❌ 장애 기록 저장 실패: {e}")
+
+    def next_values(self):
+        """다음 틱의 전체 센서 값 (registry.lock 안에서 호출, 선계산 단계가 있으면 준비된 블록에서 꺼냄)"""
+        if self.value_prefetcher:
+            return self.value_prefetcher.next_values()
+        return self.tick_engine.step(self.registry)
+
+    def open_file_sink(self):
+        if not self.sink_config or not self.sink_config.get("path"):
+            raise ValueError("파일 출력 경로(sink.path)를 지정하세요.")
+        self.file_sink = FileSink.from_config(self.sink_config, self.payload_encoder, self.log)
+        self.file_sink.start()
+        self.log(f"💾 파일 출력: {self.file_sink.describe()}")
+
+    def close_file_sink(self):
+        sink = self.file_sink
+        if not sink:
+            return
+        sink.close()
+        self.log(f"💾 파일 출력 종료: {sink.rows_written:,}행, 파일 {sink.files_written}개, "
+                 f"{sink.bytes_written / (1024 * 1024):,.1f}MB")
+
+    def close_recorder(self):
+        recorder = self.recorder
+        if not recorder:
+            return
+        recorder.close()
+        self.recorder = None
+        self.log(f"⏺️ 녹화 종료: {recorder.records:,}건, {recorder.bytes_written / (1024 * 1024):,.1f}MB")
+
+    def join_generator(self):
+        """생성 스레드 종료 대기 (파일 출력이 있으면 남은 기록이 끝날 때까지)"""
+        if self.generator_thread:
+            self.generator_thread.join(timeout=None if self.file_sink or self.recorder else self.interval + 1)
+
+    def stop(self):
+        """데이터 생성 중지"""
+        self.is_running = False
+        if self.in_flight_window:
+            self.in_flight_window.interrupt()
+        self.log("⏹️ 데이터 생성을 중지합니다.")
+
+    def generate_data_loop(self):
+        """데이터 생성 루프"""
+        while self.is_running:
+            try:
+                self.send_all_sensor_data()
+                time.sleep(self.interval / self.slow_factor())
+            except Exception as e:
+                self.error_count += 1
+                self.log(f"❌ 데이터 생성 중 오류: {str(e)}")
+                time.sleep(1)
+
+    def backfill_loop(self):
+        """백필 모드: 가상 시계의 틱마다 전체 센서를 발행 (대기 없이, 미확인 메시지 수로만 조절)"""
+        clock = self.backfill_clock
+        self.backfill_done = False
+        self.log(f"⏩ 백필 시작: {clock.describe()}")
+
+        started = time.monotonic()
+        next_report = started + self.BACKFILL_REPORT_INTERVAL
+        last_simulated, last_time = 0.0, started
+        try:
+            for tick_time in clock.ticks():
+                if not self.is_running:
+                    break
+                self.emit_tick(make_timestamp(tick_time))
+                self.wait_for_in_flight(self.BACKFILL_MAX_IN_FLIGHT)
+
+                now = time.monotonic()
+                if now >= next_report:
+                    simulated = clock.simulated_seconds()
+                    speed = (simulated - last_simulated) / (now - last_time)
+                    self.log(f"⏩ 백필 진행: {tick_time.isoformat()} ({clock.progress() * 100:.1f}%), "
+                             f"시뮬레이션 {speed:,.0f}초/초 ({self.emitted_count():,}건 {'기록' if not self.uses_broker else '발행'})")
+                    last_simulated, last_time = simulated, now
+                    next_report += self.BACKFILL_REPORT_INTERVAL
+            else:
+                # 끝까지 진행한 경우 남은 확인을 기다린 뒤 종료 (연결 해제 시 유실 방지)
+                self.wait_for_in_flight(0, timeout=30.0)
+                self.backfill_done = True
+        except Exception as e:
+            self.error_count += 1
+            self.log(f"❌ 백필 중 오류: {str(e)}")
+
+        elapsed = time.monotonic() - started
+        simulated = clock.simulated_seconds()
+        self.log(f"📊 백필 {'완료' if self.backfill_done else '중단'}: 시뮬레이션 {simulated / 3600:,.1f}시간 / "
+                 f"실제 {elapsed:.1f}초 ({simulated / elapsed if elapsed > 0 else 0:,.0f}초/초)")
+        self.is_running = False
+
+    def wait_for_in_flight(self, limit: int, timeout: Optional[float] = None):
+        """브로커 미확인(in-flight) 메시지가 limit 이하가 될 때까지 대기"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self.uses_broker and self.is_connected and self.stats.totals()["in_flight"] > limit:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.001)
+
+    def rate_loop(self):
+        """개방 루프 부하 모드: 목표 발행률에 맞춰 센서를 순환하며 한 건씩 발행"""
+        scheduler = self.rate_scheduler
+        messages = self.iter_rate_messages()
+        pending = []
+
+        def emit():
+            message = next(messages)
+            if message:
+                pending.append(message[:3])
+
+        def flush():
+            # 마감 시각이 된 메시지를 모아 한 번에 발행 (연결 풀은 배치당 한 번만 스레드 전환)
+            if pending:
+                self.publish_messages(pending[:])
+                pending.clear()
+                scheduler.throttle = self.slow_factor()
+
+        self.log(f"📈 부하 모드 시작: {scheduler.profile.describe()} ({scheduler.arrival})")
+        try:
+            scheduler.run(emit, lambda: self.is_running, self.report_load, flush)
+        except Exception as e:
+            self.error_count += 1
+            self.log(f"❌ 부하 생성 중 오류: {str(e)}")
+            self.is_running = False
+
+        summary = scheduler.stats.summary()
+        self.log(f"📊 부하 모드 종료: {summary['sent']}건 / {summary['elapsed']:.1f}초, "
+                 f"평균 {summary['achieved_rate']:.0f} msg/s, 지연 평균 {summary['lag_avg_ms']:.2f}ms "
+                 f"최대 {summary['lag_max_ms']:.2f}ms, 마감 초과 {summary['missed']}건")
+
+    def report_load(self, window: Dict[str, Any]):
+        """부하 모드 구간 보고"""
+        self.log(f"📈 목표 {window['target_rate']:.0f} msg/s, 실제 {window['achieved_rate']:.0f} msg/s, "
+                 f"지연 평균 {window['lag_avg_ms']:.2f}ms 최대 {window['lag_max_ms']:.2f}ms, "
+                 f"마감 초과 {window['missed']}건{self.describe_window()}")
+
+    def describe_window(self) -> str:
+        """발행 창 상태 (보고 로그 꼬리말)"""
+        window = self.in_flight_window
+        if not window:
+            return ""
+        text = f", 창 {window.depth:,}/{window.max_in_flight:,}"
+        if window.policy == "drop":
+            text += f" 드롭 {window.dropped:,}건"
+        elif window.policy == "slow":
+            text += f" 속도 {window.slow_factor * 100:.0f}%"
+        return text
+
+    def iter_rate_messages(self) -> Iterator[Optional[Tuple[int, str, str, str]]]:
+        """센서를 순환하며 메시지 생성 (한 바퀴마다 전체 값을 배치 계산, 장애는 바퀴 시작 시각 기준, 센서가 없으면 None)"""
+        while True:
+            tick = self.take_tick(make_timestamp(datetime.datetime.now()))
+            if not len(tick):
+                yield None
+                continue
+            codec, topic_suffix = self.resolve_codec()
+            for sensor_id, type_code, name, head, value, status, aux in zip(tick.sensor_ids, tick.type_codes,
+                                                                            tick.names, tick.heads,
+                                                                            tick.values.tolist(), tick.status_list(),
+                                                                            tick.aux_list()):
+                timestamp = make_timestamp(datetime.datetime.now())
+                yield (sensor_id,) + self.build_message(sensor_id, type_code, name, value, head, timestamp,
+                                                        codec, topic_suffix, status, aux)
+
+    def report_pool(self):
+        """연결 풀의 연결별 처리량/미확인 메시지 수 로그"""
+        for stats in self.publisher_pool.connection_stats():
+            self.log(f"🔌 {stats['client_id']}: {stats['rate']:.0f} msg/s, 발행 {stats['published']}건, "
+                     f"확인 {stats['acked']}건, in-flight {stats['in_flight']}건")
+
+    def run_forever(self, duration: Optional[float] = None, connect_timeout: float = 10.0):
+        """헤드리스 실행: 연결 → 생성 → (duration 경과 또는 Ctrl+C) → 종료"""
+        if self.uses_broker:
+            self.connect()
+            if not self.wait_until_connected(connect_timeout):
+                self.disconnect()
+                raise ConnectionError(f"MQTT 브로커 연결 시간 초과: {self.broker}:{self.port}")
+
+        self.start_metrics_server()
+        self.start()
+        started = time.monotonic()
+        next_report = started + self.POOL_REPORT_INTERVAL
+        try:
+            while self.is_running:
+                now = time.monotonic()
+                if duration is not None and now - started >= duration:
+                    break
+                if now >= next_report:
+                    if self.publisher_pool:
+                        self.report_pool()
+                    if self.in_flight_window and not self.rate_scheduler:
+                        self.log(f"🪟 발행 {self.stats.totals()['sent']:,}건{self.describe_window()}")
+                    if self.uses_broker:
+                        self.log(f"⏱️ 발행→확인 지연 {format_latency(self.latency.combined().summary())}")
+                    next_report += self.POOL_REPORT_INTERVAL
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            self.log("⛔ 사용자 중단 요청")
+        finally:
+            # 생성 스레드의 마지막 발행/파일 기록이 끝나고 확인까지 받은 뒤 연결 해제
+            if self.is_running:
+                self.stop()
+            self.join_generator()
+            self.wait_for_in_flight(0, timeout=self.SHUTDOWN_DRAIN_TIMEOUT)
+            self.disconnect()
+            self.stop_metrics_server()
+            if self.uses_broker:
+                self.report_latency()
+
+    def report_latency(self):
+        """센서 타입별/전체 발행→확인 지연 요약 (SLO 확인용)"""
+        for sensor_type in sorted({type_name for type_name, _, _ in self.latency.snapshots()}):
+            self.log(f"⏱️ {sensor_type}: {format_latency(self.latency.combined(sensor_type).summary())}")
+        self.log(f"⏱️ 전체: {format_latency(self.latency.combined().summary())}")
+
+    def start_metrics_server(self):
+        if self.metrics_port is not None and not self.metrics_server:
+            from metrics_server import MetricsServer
+            self.metrics_server = MetricsServer(self, self.metrics_port, log=self.log)
+            self.metrics_server.start()
+
+    def stop_metrics_server(self):
+        if self.metrics_server:
+            self.metrics_server.stop()
+            self.metrics_server = None
+
+    def publish_messages(self, messages: List[Tuple[int, str, bytes]]):
+        """(센서 ID, 토픽, 페이로드) 목록 발행 - 발행 창이 있으면 창에 들어가는 만큼씩 나눠 발행"""
+        window = self.in_flight_window
+        if not window:
+            self.send_messages(messages)
+            return
+        while messages:
+            admitted = window.admit(len(messages), lambda: self.is_connected)
+            batch, messages = messages[:admitted], messages[admitted:]
+            if window.policy == "drop":
+                messages = []
+            if batch:
+                self.send_messages(batch)
+
+    def send_messages(self, messages: List[Tuple[int, str, bytes]]):
+        """메시지 묶음 발행 - 연결 풀이면 배치 한 번으로 넘김"""
+        self.stats.add_sent(len(messages), sum(len(message[2]) for message in messages))
+        properties = self.publish_properties
+        window = self.in_flight_window
+        if self.publisher_pool:
+            self.publisher_pool.publish_batch(messages, properties)
+        else:
+            failed = 0
+            latency = self.latency
+            for sensor_id, topic, payload in messages:
+                sent_ns = time.monotonic_ns()
+                info = self.mqtt_client.publish(topic, payload, qos=1, properties=properties)
+                if info.rc != MQTT_ERR_SUCCESS:
+                    failed += 1
+                    continue
+                latency.stamp((0, info.mid), sensor_id, sent_ns)
+                if window:
+                    window.track((0, info.mid))
+            if failed:
+                self.stats.add_failed(failed)
+                if window:
+                    window.cancel(failed)
+        if self.recorder:
+            self.recorder.write(messages)
+
+    def slow_factor(self) -> float:
+        """발행 창 slow 정책의 생성 속도 배율 (그 외 1.0)"""
+        window = self.in_flight_window
+        if window and window.policy == "slow":
+            return window.slow_factor
+        return 1.0
+
+    def send_all_sensor_data(self):
+        """모든 센서 데이터 전송"""
+        if self.uses_broker and not self.mqtt_client and not self.publisher_pool:
+            return
+
+        descriptions = self.emit_tick(make_timestamp(datetime.datetime.now()))
+        for description in descriptions:
+            self.log_message(description)
+
+    def emit_tick(self, timestamp: Timestamp) -> List[str]:
+        """한 틱을 출력 대상(MQTT/파일)으로 내보내고 로그 문구 반환 (파일 전용이면 문구 없음)"""
+        tick = self.take_tick(timestamp)
+        if self.file_sink:
+            self.file_sink.write_tick(tick, timestamp)
+        if not self.uses_broker:
+            return []
+        messages, descriptions = self.build_tick_messages(timestamp, tick)
+        self.publish_messages(messages)
+        return descriptions
+
+    def emitted_count(self) -> int:
+        """출력한 레코드 수 (파일 전용이면 파일 기록 행 수, 그 외 MQTT 발행 건수)"""
+        if not self.uses_broker and self.file_sink:
+            return self.file_sink.rows_written
+        return self.stats.totals()["sent"]
+
+    def take_tick(self, timestamp: Optional[Timestamp] = None) -> SensorTick:
+        """모든 센서 값을 한 번에 계산하고 전송용 스냅샷 확보 (타임스탬프가 있으면 예약 장애 적용)
+
+        부가 필드는 장애를 적용한 값으로 계산한다 (ADC가 주 값을 따라가도록).
+        """
+        registry = self.registry
+        with registry.lock:
+            values = self.next_values()
+            tick = SensorTick(values, registry.ids.tolist(), registry.type_codes.tolist(),
+                              list(registry.names), list(registry.payload_heads))
+            keep = None
+            if self.fault_injector and timestamp is not None:
+                tick.statuses, keep = self.fault_injector.apply(values, registry, timestamp)
+            if self.aux_engine and len(values):
+                # 방금 계산한 주 값의 틱 번호 (시드 모드 부가 필드 난수 카운터)
+                tick.aux = self.aux_engine.step(registry, values, self.tick_engine.tick - 1)
+            if keep is not None:
+                tick = tick.select(keep)
+            return tick
+
+    def build_tick_messages(self, timestamp: Timestamp,
+                            tick: Optional[SensorTick] = None) -> Tuple[List[Tuple[int, str, bytes]], List[str]]:
+        """한 틱의 전체 센서 메시지와 로그 문구 (같은 틱은 같은 타임스탬프)"""
+        if tick is None:
+            tick = self.take_tick(timestamp)
+
+        codec, topic_suffix = self.resolve_codec()
+        messages = []
+        descriptions = []
+        for sensor_id, type_code, name, head, value, status, aux in zip(tick.sensor_ids, tick.type_codes, tick.names,
+                                                                        tick.heads, tick.values.tolist(),
+                                                                        tick.status_list(), tick.aux_list()):
+            topic, payload, description = self.build_message(sensor_id, type_code, name, value, head, timestamp,
+                                                             codec, topic_suffix, status, aux)
+            messages.append((sensor_id, topic, payload))
+            descriptions.append(description)
+        return messages, descriptions
+
+    def resolve_codec(self):
+        """현재 토픽 프리픽스의 (코덱, 토픽 접미사), 발행 속성도 함께 갱신"""
+        codec = self.codec_selector.codec_for(self.topic_prefix)
+        self.publish_properties = self.codec_selector.publish_properties(codec)
+        return codec, self.codec_selector.topic_suffix(codec)
+
+    def build_message(self, sensor_id: int, type_code: int, name: str, value: float,
+                      payload_head: bytes, timestamp: Timestamp, codec, topic_suffix: str = "",
+                      status: int = STATUS_NORMAL,
+                      aux: Optional[List[float]] = None) -> Tuple[str, bytes, str]:
+        """센서 한 건의 (토픽, 페이로드, 로그 문구) 생성
+
+        JSON 코덱의 페이로드는 create_sensor_data + json.dumps(ensure_ascii=False) 결과와 바이트 단위로 같다.
+        """
+        topic = f"{self.topic_prefix}/{sensor_id}/data{topic_suffix}"
+        value = self.payload_encoder.round_value(type_code, value)
+        payload = codec.encode(sensor_id, type_code, payload_head, value, timestamp, status, aux)
+
+        icon, label, unit = MESSAGE_DESCRIPTIONS[type_code]
+        description = f"{icon} 전송: {topic} -> {name} ({label}: {value}{unit})"
+        if status == STATUS_OFFLINE:
+            description += " [오프라인]"
+        return topic, payload, description
+
+    def create_sensor_data(self, sensor: Dict[str, Any], sensor_type: str,
+                           value: Optional[float] = None) -> Dict[str, Any]:
+        """센서 데이터 생성 (필드명/반올림/단위는 센서 타입 표)"""
+        spec = SENSOR_TYPES[sensor_type]
+        # 값이 주어지지 않으면 실제와 유사한 변동값 생성
+        if value is None:
+            value = self.generate_realistic_value(sensor_type, sensor_type)
+
+        return {
+            "sensor_id": sensor["id"],
+            "sensor_type": spec.code,
+            "sensor_name": sensor["name"],
+            "timestamp": datetime.datetime.now().isoformat(),
+            "is_connected": True,
+            "status": "normal",
+            sensor_type: round(value, spec.digits),
+            "value": round(value, spec.digits),
+            "unit": spec.unit
+        }
+
+    def generate_realistic_value(self, sensor_type: str, value_key: str) -> float:
+        """실제와 유사한 센서 값 생성 (단일 값 경로, 배치 경로는 VectorTickEngine)"""
+        base_value = self.sensor_values[sensor_type][value_key]
+        variation_config = self.sensor_variations[sensor_type]
+
+        # 트렌드 변화 확률 체크
+        if self.rng.random() < variation_config["trend_probability"]:
+            # 새로운 트렌드 설정 (-1: 하강, 0: 유지, 1: 상승)
+            self.sensor_trends[sensor_type] = self.rng.choice([-0.3, -0.1, 0.0, 0.1, 0.3])
+
+        # 기본 랜덤 변동 (-range ~ +range)
+        random_variation = self.rng.uniform(-variation_config["range"], variation_config["range"])
+
+        # 트렌드 적용 (작은 값으로 지속적인 변화)
+        trend_variation = self.sensor_trends[sensor_type] * variation_config["range"] * 0.1
+
+        # 최종 값 계산
+        new_value = base_value + random_variation + trend_variation
+
+        # 센서별 합리적인 범위 제한
+        low, high = SENSOR_BOUNDS[sensor_type]
+        return max(low, min(high, new_value))
+
+    # ------------------------------------------------------------------
+    # 설정 파일
+    # ------------------------------------------------------------------
+    def apply_config(self, config: Dict[str, Any]):
+        """설정 딕셔너리 적용 (CLI --config JSON 파일 형식)"""
+        self.broker = config.get("broker", self.broker)
+        self.port = int(config.get("port", self.port))
+        self.client_id = config.get("client_id", self.client_id)
+        self.connection_count = int(config.get("connections", self.connection_count))
+        self.interval = float(config.get("interval", self.interval))
+        self.prefetch_ticks = int(config.get("prefetch_ticks", self.prefetch_ticks))
+        # 사용자 정의 센서 타입 (기준값/센서 목록보다 먼저 등록) 및 ADC/부가 필드
+        if config.get("sensor_types"):
+            self.register_sensor_types(config["sensor_types"])
+        if "aux_fields" in config:
+            self.set_aux_fields(bool(config["aux_fields"]))
+        # 실행 시드 (지정 시 센서별 난수 스트림, start_tick부터 이어서 생성)
+        if config.get("seed") is not None:
+            self.set_seed(config["seed"], config.get("start_tick", 0))
+        elif config.get("start_tick"):
+            raise ValueError("시작 틱(start_tick)은 시드(seed)와 함께 지정해야 합니다.")
+        if "topic_prefix" in config:
+            self.set_topic_prefix(config["topic_prefix"])
+
+        # 기준값을 먼저 적용해야 새 센서가 해당 기준값으로 시작
+        for sensor_type, value in config.get("values", {}).items():
+            self.set_base_value(sensor_type, value)
+
+        if "sensors" in config:
+            self.registry.clear()
+            self.add_sensors([
+                SensorDefinition(sensor_type, int(sensor["id"]), sensor["name"],
+                                 sensor.get("base_value"), sensor.get("variation"))
+                for sensor_type, sensors in config["sensors"].items() for sensor in sensors
+            ])
+        # 센서 목록 파일 (sensors와 함께 쓰면 뒤에 추가)
+        if config.get("fleet"):
+            self.add_sensors(load_fleet(config["fleet"]))
+
+        # 상태 체크포인트 (resume이면 위의 센서 구성/시드/시작 틱 대신 체크포인트 상태로 이어서 시작)
+        if config.get("checkpoint"):
+            self.checkpoint_path = config["checkpoint"]
+            self.checkpoint_interval = float(config.get("checkpoint_interval", self.checkpoint_interval))
+            if self.checkpoint_interval <= 0:
+                raise ValueError("체크포인트 저장 주기는 0보다 커야 합니다.")
+            if config.get("resume"):
+                self.resume_checkpoint(self.checkpoint_path)
+        elif config.get("resume"):
+            raise ValueError("이어서 시작(resume)하려면 체크포인트 경로(checkpoint)를 지정하세요.")
+
+        # 개방 루프 부하 모드 (profile 문자열 또는 고정 rate)
+        profile = None
+        if config.get("profile"):
+            profile = parse_profile(config["profile"])
+        elif config.get("rate"):
+            profile = ConstantProfile(float(config["rate"]))
+        if profile:
+            self.rate_scheduler = RateScheduler(
+                profile,
+                config.get("arrival", "uniform"),
+                float(config.get("miss_threshold", 0.01)),
+                float(config.get("report_interval", 5.0)),
+                rate_scale=float(config.get("rate_scale", 1.0))
+            )
+
+        # 페이로드 코덱 {"HS": "json", "*": "msgpack"} 및 태그 방식 (none/suffix/content-type)
+        if "codecs" in config:
+            self.codec_selector.set_rules(config["codecs"])
+            self.check_codec_ids(self.registry.ids)
+        if "codec_tag" in config:
+            self.codec_selector.set_tag_mode(config["codec_tag"])
+
+        # 백필 모드 {"start": ..., "end": ..., "step": ...}
+        if config.get("backfill"):
+            self.backfill_clock = VirtualClock.from_config(config["backfill"])
+
+        # 출력 대상 및 파일 출력 {"path", "format", "gzip", "max_mb", "max_seconds", "chunk_rows"}
+        if "sink" in config:
+            self.sink_config = dict(config["sink"])
+        if "output" in config:
+            if config["output"] not in OUTPUT_MODES:
+                raise ValueError(f"알 수 없는 출력 대상입니다: {config['output']} (사용 가능: {', '.join(OUTPUT_MODES)})")
+            self.output = config["output"]
+        # 발행 창 (max_in_flight 0 또는 미지정 시 제한 없음)
+        if config.get("max_in_flight"):
+            self.in_flight_window = InFlightWindow(int(config["max_in_flight"]),
+                                                   config.get("window_policy", "block"))
+
+        if config.get("metrics_port") is not None:
+            self.metrics_port = int(config["metrics_port"])
+
+        if config.get("record"):
+            self.record_path = config["record"]
+
+        # 예약 장애 [{"kind", "target", "at", "duration", "magnitude", "every", "count"} 또는 --fault 문자열]
+        if config.get("faults"):
+            self.fault_injector = FaultInjector(parse_faults(config["faults"]), config.get("seed"), log=self.log)
+        if config.get("fault_report"):
+            self.fault_report_path = config["fault_report"]
+        if self.output != "mqtt":
+            if not self.sink_config or not self.sink_config.get("path"):
+                raise ValueError("파일 출력 경로(sink.path)를 지정하세요.")
+            if self.rate_scheduler and not self.backfill_clock:
+                raise ValueError("파일 출력은 주기 모드와 백필 모드에서만 사용할 수 있습니다.")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from generator_engine import GeneratorEngine
+from fleet_import import SensorDefinition, load_fleet
+from value_prefetch import ValuePrefetcher
+
+# 샤드 검사에 쓰는 샤드 수
+GOLDEN_SHARDS = 3
+
+
+def _seeded_engine(seed: int, definitions: List[SensorDefinition], start_tick: int = 0) -> GeneratorEngine:
+    engine = GeneratorEngine(log_callback=lambda message: None)
+    engine.add_sensors(definitions)
+    engine.set_aux_fields(True)
+    engine.set_seed(seed, start_tick)
+    return engine
+
+
+def _tick_digest(values: np.ndarray, aux: np.ndarray) -> Tuple[bytes, bytes]:
+    """(주 값+ADC/부가 필드 해시, 주 값만의 해시) (float64 바이트의 SHA-256)"""
+    main = hashlib.sha256(values.tobytes())
+    combined = main.copy()
+    combined.update(aux.tobytes())
+    return combined.digest(), main.digest()
+
+
+def _tick_digests(engine: GeneratorEngine, ticks: int, prefetch_ticks: int = 0) -> List[Tuple[bytes, bytes]]:
+    """틱별 (전체 센서 값+부가 필드 해시, 주 값 해시)"""
+    if prefetch_ticks:
+        engine.value_prefetcher = ValuePrefetcher(engine.tick_engine, engine.registry, prefetch_ticks)
+        engine.value_prefetcher.start()
+    digests = []
+    try:
+        for _ in range(ticks):
+            tick = engine.take_tick()
+            digests.append(_tick_digest(tick.values, tick.aux))
+    finally:
+        if engine.value_prefetcher:
+            engine.value_prefetcher.stop()
+            engine.value_prefetcher = None
+    return digests
+
+
+def _sharded_digests(seed: int, definitions: List[SensorDefinition], ticks: int) -> List[Tuple[bytes, bytes]]:
+    """센서를 샤드로 나눠 따로 계산한 뒤 원래 순서로 합친 틱별 해시"""
+    shards = [definitions[index::GOLDEN_SHARDS] for index in range(GOLDEN_SHARDS)]
+    engines = [(index, _seeded_engine(seed, shard)) for index, shard in enumerate(shards) if shard]
+    digests = []
+    for _ in range(ticks):
+        values = np.empty(len(definitions))
+        aux = None
+        for index, engine in engines:
+            tick = engine.take_tick()
+            if aux is None:
+                aux = np.empty((len(definitions), tick.aux.shape[1]))
+            values[index::GOLDEN_SHARDS] = tick.values
+            aux[index::GOLDEN_SHARDS] = tick.aux
+        digests.append(_tick_digest(values, aux))
+    return digests
+
+
+def _combine(digests: List[Tuple[bytes, bytes]]) -> str:
+    return hashlib.sha256(b"".join(combined for combined, _ in digests)).hexdigest()
+
+
+def _main_only(digests: List[Tuple[bytes, bytes]]) -> List[bytes]:
+    return [main for _, main in digests]
+
+
+def default_definitions(sensors_per_type: int) -> List[SensorDefinition]:
+    """타입별 센서 N개 (ID 1부터)"""
+    definitions = []
+    for offset, sensor_type in enumerate(("current", "temperature", "humidity")):
+        for index in range(sensors_per_type):
+            sensor_id = offset * sensors_per_type + index + 1
+            definitions.append(SensorDefinition(sensor_type, sensor_id, f"{sensor_type}-{sensor_id}"))
+    return definitions
+
+
+def run_golden_check(seed: int, ticks: int = 100, sensors_per_type: int = 1000, fleet: Optional[str] = None,
+                     jump: Optional[int] = None, prefetch_ticks: int = 16,
+                     expect: Optional[str] = None) -> Dict[str, Any]:
+    """같은 시드로 여러 방식(반복/선계산/샤드/틱 이동)으로 계산한 값이 모두 같은지 확인
+
+    골든 해시는 틱 0부터 ticks틱 동안의 틱별 (주 값 + ADC/부가 필드) 해시를 이어 붙인 SHA-256이다.
+    부가 필드는 랜덤 워크라 틱 이동 뒤에는 시작값부터 다시 걸으므로, 틱 이동 검사만 주 값끼리 비교한다.
+    """
+    if ticks < 1:
+        raise ValueError("틱 수는 1 이상이어야 합니다.")
+    definitions = load_fleet(fleet) if fleet else default_definitions(sensors_per_type)
+    if jump is None:
+        jump = ticks // 2
+    if not 0 <= jump < ticks:
+        raise ValueError(f"이동할 틱은 0 이상 {ticks} 미만이어야 합니다: {jump}")
+
+    reference = _tick_digests(_seeded_engine(seed, definitions), ticks)
+    golden = _combine(reference)
+    checks = {
+        "repeat": _tick_digests(_seeded_engine(seed, definitions), ticks) == reference,
+        "prefetch": _tick_digests(_seeded_engine(seed, definitions), ticks, prefetch_ticks) == reference,
+        "shards": _sharded_digests(seed, definitions, ticks) == reference,
+        "jump": _main_only(_tick_digests(_seeded_engine(seed, definitions, jump), ticks - jump)) ==
+                _main_only(reference[jump:])
+    }
+    if expect:
+        checks["expected"] = golden == expect.strip().lower()
+    return {
+        "seed": seed,
+        "ticks": ticks,
+        "sensors": len(definitions),
+        "jump": jump,
+        "golden": golden,
+        "checks": checks,
+        "passed": all(checks.values())
+    }
+
+
+def format_golden_check(result: Dict[str, Any]) -> str:
+    labels = {
+        "repeat": "같은 시드 재실행",
+        "prefetch": "블록 선계산",
+        "shards": f"{GOLDEN_SHARDS}개 샤드 분할",
+        "jump": f"틱 {result['jump']}부터 이동",
+        "expected": "기대 해시"
+    }
+    lines = [f"시드 {result['seed']}, 센서 {result['sensors']:,}개 × {result['ticks']}틱",
+             f"골든 해시: {result['golden']}"]
+    for name, passed in result["checks"].items():
+        lines.append(f"{'✅' if passed else '❌'} {labels[name]}")
+    return "\n".join(lines)
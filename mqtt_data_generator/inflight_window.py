@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable
+
+# 창이 가득 찼을 때 처리 방식
+WINDOW_POLICIES = ("block", "drop", "slow")
+
+
+class InFlightWindow:
+    """QoS1 발행 창: 발행한 메시지를 (연결 번호, mid)별로 PUBACK까지 추적
+
+    생성 스레드는 발행 전에 admit()으로 자리를 예약하고, 발행 후 track()으로 mid를 등록한다.
+    PUBACK(on_publish)이 오면 release()로 자리를 돌려준다. 창(max_in_flight)이 가득 차면:
+
+    - block: 자리가 날 때까지 생성 스레드가 기다림
+    - drop: 남는 자리만큼만 발행하고 나머지는 버림 (dropped로 집계)
+    - slow: 발행은 계속하되 slow_factor를 절반씩 낮춰 생성 속도를 줄임 (자리가 반 이상 비면 회복),
+      창의 2배를 넘으면 block과 같이 기다림
+
+    paho mid는 연결마다 16비트이므로 창 크기는 65535 이하로 제한한다.
+    """
+
+    # slow 정책 생성 속도 배율 하한 / 회복 배율 / 조절 주기 (초)
+    MIN_SLOW_FACTOR = 0.05
+    RECOVER_FACTOR = 1.1
+    ADJUST_INTERVAL = 0.1
+
+    # block 대기 중 중단 여부 확인 주기 (초)
+    WAIT_STEP = 0.1
+
+    # 연결별 mid 범위
+    MAX_WINDOW = 65535
+
+    def __init__(self, max_in_flight: int, policy: str = "block"):
+        if policy not in WINDOW_POLICIES:
+            raise ValueError(f"알 수 없는 발행 창 정책입니다: {policy} (사용 가능: {', '.join(WINDOW_POLICIES)})")
+        if not 1 <= max_in_flight <= self.MAX_WINDOW:
+            raise ValueError(f"최대 in-flight 수는 1 ~ {self.MAX_WINDOW} 사이여야 합니다.")
+        self.max_in_flight = max_in_flight
+        self.policy = policy
+
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._mids = set()
+        # 예약했지만 아직 mid를 받지 못한 자리, PUBACK이 track()보다 먼저 온 mid
+        self._reserved = 0
+        self._early_acks = set()
+        self._interrupted = False
+
+        self.dropped = 0
+        self.slow_factor = 1.0
+        self._next_adjust = 0.0
+
+    @property
+    def depth(self) -> int:
+        """확인 대기 중인 메시지 수 (예약 포함)"""
+        return self._reserved + len(self._mids)
+
+    def admit(self, count: int, should_wait: Callable[[], bool] = lambda: True) -> int:
+        """count건 발행 요청 → 지금 발행할 수 있는 건수 (drop 정책에서 나머지는 버림)
+
+        block/slow 정책은 자리가 날 때까지 기다리므로 창보다 큰 배치는 여러 번에 나눠 받는다.
+        should_wait가 False가 되거나 interrupt()되면 기다리지 않고 모두 내보낸다.
+        """
+        limit = self.max_in_flight
+        with self._space:
+            if self.policy == "drop":
+                admitted = max(0, min(count, limit - self.depth))
+                self.dropped += count - admitted
+            else:
+                if self.policy == "slow":
+                    self._adjust_slow_factor()
+                    limit *= 2
+                while self.depth >= limit and should_wait() and not self._interrupted:
+                    self._space.wait(self.WAIT_STEP)
+                if self.depth >= limit:
+                    admitted = count
+                else:
+                    admitted = min(count, limit - self.depth)
+            self._reserved += admitted
+            return admitted
+
+    def _adjust_slow_factor(self):
+        """창이 차 있으면 배율 절반, 반 이상 비어 있으면 10%씩 회복 (ADJUST_INTERVAL마다 한 번)"""
+        now = time.monotonic()
+        if now < self._next_adjust:
+            return
+        self._next_adjust = now + self.ADJUST_INTERVAL
+        depth = self.depth
+        if depth >= self.max_in_flight:
+            self.slow_factor = max(self.MIN_SLOW_FACTOR, self.slow_factor * 0.5)
+        elif depth < self.max_in_flight // 2:
+            self.slow_factor = min(1.0, self.slow_factor * self.RECOVER_FACTOR)
+
+    def track(self, key: Hashable):
+        """예약한 자리를 발행된 메시지 키로 전환 (발행 스레드)"""
+        with self._lock:
+            self._reserved = max(0, self._reserved - 1)
+            if key in self._early_acks:
+                self._early_acks.discard(key)
+                self._space.notify_all()
+            else:
+                self._mids.add(key)
+
+    def cancel(self, count: int = 1):
+        """예약한 자리 반환 (발행 실패)"""
+        with self._space:
+            self._reserved = max(0, self._reserved - count)
+            self._space.notify_all()
+
+    def release(self, key: Hashable):
+        """PUBACK 수신 (네트워크 스레드)"""
+        with self._space:
+            if key in self._mids:
+                self._mids.discard(key)
+            elif self._reserved:
+                # publish()가 mid를 돌려주기 전에 PUBACK이 먼저 처리된 경우
+                self._early_acks.add(key)
+            self._space.notify_all()
+
+    def interrupt(self):
+        """block 대기 중인 생성 스레드를 깨워 대기 없이 진행 (생성 중지 시)"""
+        with self._space:
+            self._interrupted = True
+            self._space.notify_all()
+
+    def resume(self):
+        with self._lock:
+            self._interrupted = False
+
+    def reset(self):
+        """연결 해제 시 추적 상태 초기화 (새 세션에서는 이전 mid의 PUBACK이 오지 않음)"""
+        with self._space:
+            self._mids.clear()
+            self._early_acks.clear()
+            self._reserved = 0
+            self.slow_factor = 1.0
+            self._space.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "max_in_flight": self.max_in_flight,
+            "policy": self.policy,
+            "dropped": self.dropped,
+            "slow_factor": self.slow_factor
+        }
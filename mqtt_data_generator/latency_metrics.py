@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from sensor_types import SENSOR_TYPE_NAMES
+
+# 보고할 백분위
+PERCENTILES = (50.0, 95.0, 99.0)
+
+
+class LatencyHistogram:
+    """HDR 방식 로그-선형 히스토그램 (마이크로초 단위, 상대 오차 약 6%)
+
+    2의 거듭제곱 구간마다 16개 하위 버킷을 두므로 1µs ~ 수 시간을 1,000여 개 정수로 담는다.
+    record()는 한 스레드(ACK를 받는 네트워크/루프 스레드)에서만 호출하고, 읽는 쪽은 snapshot()으로 복사한다.
+    """
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    BUCKET_COUNT = 64 * SUB_BUCKETS
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @classmethod
+    def bucket_index(cls, value: int) -> int:
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return ((shift + 1) << cls.SUB_BUCKET_BITS) + ((value >> shift) & (cls.SUB_BUCKETS - 1))
+
+    @classmethod
+    def bucket_upper(cls, index: int) -> int:
+        """버킷에 들어가는 가장 큰 값"""
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = (index >> cls.SUB_BUCKET_BITS) - 1
+        return ((cls.SUB_BUCKETS + (index & (cls.SUB_BUCKETS - 1))) << shift) + (1 << shift) - 1
+
+    def record(self, value_us: int):
+        if value_us < 0:
+            value_us = 0
+        self.counts[self.bucket_index(value_us)] += 1
+        self.count += 1
+        self.total += value_us
+        if value_us > self.max:
+            self.max = value_us
+
+    def merge(self, other: "LatencyHistogram"):
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def snapshot(self) -> "LatencyHistogram":
+        copy = LatencyHistogram()
+        copy.counts = self.counts[:]
+        copy.count = self.count
+        copy.total = self.total
+        copy.max = self.max
+        return copy
+
+    def percentile(self, percent: float) -> int:
+        """백분위 값 (µs, 버킷 상한, 최댓값을 넘지 않음)"""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_upper(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """{"count", "p50", "p95", "p99", "max", "avg"} (지연은 ms)"""
+        result = {"count": self.count, "max": self.max / 1000, "avg": self.total / self.count / 1000 if self.count else 0.0}
+        for percent in PERCENTILES:
+            result[f"p{percent:g}"] = self.percentile(percent) / 1000
+        return result
+
+
+def format_latency(summary: Dict[str, float]) -> str:
+    """p50/p95/p99/max 한 줄 요약"""
+    if not summary["count"]:
+        return "지연 측정 없음"
+    return (f"p50 {summary['p50']:.2f}ms, p95 {summary['p95']:.2f}ms, p99 {summary['p99']:.2f}ms, "
+            f"max {summary['max']:.2f}ms ({summary['count']:,}건)")
+
+
+class LatencyTracker:
+    """발행 → PUBACK 지연 측정: (연결 번호, mid)마다 단조 시계 발행 시각을 찍고 ACK 시 히스토그램에 기록
+
+    히스토그램은 (센서 타입 코드, 연결 번호)별로 나뉘며, 센서 타입은 센서 ID로 레지스트리에서 찾아 캐시한다.
+    녹화 재생처럼 레지스트리에 없는 센서는 타입 0(unknown)으로 집계한다.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry
+        # (연결 번호, mid) → (발행 시각 ns, 센서 타입 코드)
+        self._pending: Dict[Hashable, Tuple[int, int]] = {}
+        # publish()가 mid를 돌려주기 전에 처리된 PUBACK의 수신 시각
+        self._early_acks: Dict[Hashable, int] = {}
+        # 생성 스레드(stamp)와 네트워크 스레드(acked)가 두 딕셔너리를 함께 바꾸므로 한 잠금으로 보호
+        self._lock = threading.Lock()
+        self.histograms: Dict[Tuple[int, int], LatencyHistogram] = {}
+
+        self._types: Dict[int, int] = {}
+        self._types_version = -1
+
+    def type_code_of(self, sensor_id: int) -> int:
+        """센서 ID → 타입 코드 (레지스트리 버전이 바뀌면 캐시 무효화)"""
+        registry = self.registry
+        if registry is None:
+            return 0
+        if registry.version != self._types_version:
+            self._types.clear()
+            self._types_version = registry.version
+        type_code = self._types.get(sensor_id)
+        if type_code is None:
+            idx = registry.index.get(sensor_id)
+            type_code = registry.type_codes[idx] if idx is not None else 0
+            self._types[sensor_id] = type_code
+        return type_code
+
+    def stamp(self, key: Hashable, sensor_id: int, sent_ns: int):
+        """발행 시각 기록 (sent_ns는 publish 호출 직전에 잰 값)"""
+        type_code = self.type_code_of(sensor_id)
+        with self._lock:
+            acked_ns = self._early_acks.pop(key, None)
+            if acked_ns is not None:
+                self._record(key[0], type_code, acked_ns - sent_ns)
+            else:
+                self._pending[key] = (sent_ns, type_code)
+
+    def acked(self, key: Hashable):
+        """PUBACK 수신 (네트워크/루프 스레드)"""
+        now = time.monotonic_ns()
+        with self._lock:
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                self._early_acks[key] = now
+                return
+            self._record(key[0], pending[1], now - pending[0])
+
+    def _record(self, connection: int, type_code: int, latency_ns: int):
+        histogram = self.histograms.get((type_code, connection))
+        if histogram is None:
+            histogram = self.histograms[(type_code, connection)] = LatencyHistogram()
+        histogram.record(latency_ns // 1000)
+
+    def reset_pending(self):
+        """연결 해제 시 ACK가 오지 않을 발행 기록 정리"""
+        with self._lock:
+            self._pending.clear()
+            self._early_acks.clear()
+
+    def snapshots(self) -> List[Tuple[str, int, LatencyHistogram]]:
+        """(센서 타입 이름, 연결 번호, 히스토그램 복사본) 목록"""
+        return [(SENSOR_TYPE_NAMES.get(type_code, "unknown"), connection, histogram.snapshot())
+                for (type_code, connection), histogram in sorted(list(self.histograms.items()))]
+
+    def combined(self, sensor_type: Optional[str] = None) -> LatencyHistogram:
+        """전체(또는 센서 타입별) 합산 히스토그램"""
+        total = LatencyHistogram()
+        for type_name, _, histogram in self.snapshots():
+            if sensor_type is None or type_name == sensor_type:
+                total.merge(histogram)
+        return total
+
+    def clear(self):
+        self.histograms = {}
+        self.reset_pending()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+import random
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+
+class ConstantProfile:
+    """고정 발행률 (msg/s)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+
+    def rate_at(self, elapsed: float) -> float:
+        return self.rate
+
+    def describe(self) -> str:
+        return f"constant {self.rate:.0f} msg/s"
+
+
+class RampProfile:
+    """duration 동안 start_rate → end_rate 선형 증가 후 end_rate 유지"""
+
+    def __init__(self, start_rate: float, end_rate: float, duration: float):
+        self.start_rate = start_rate
+        self.end_rate = end_rate
+        self.duration = duration
+
+    def rate_at(self, elapsed: float) -> float:
+        if elapsed >= self.duration:
+            return self.end_rate
+        return self.start_rate + (self.end_rate - self.start_rate) * elapsed / self.duration
+
+    def describe(self) -> str:
+        return f"ramp {self.start_rate:.0f}→{self.end_rate:.0f} msg/s / {self.duration:.0f}s"
+
+
+class StepProfile:
+    """지정 시각마다 발행률 변경 [(시작 초, msg/s), ...]"""
+
+    def __init__(self, steps: List[Tuple[float, float]]):
+        if not steps:
+            raise ValueError("step 프로파일에는 최소 한 개의 단계가 필요합니다.")
+        self.steps = sorted(steps)
+
+    def rate_at(self, elapsed: float) -> float:
+        rate = 0.0
+        for start, step_rate in self.steps:
+            if elapsed < start:
+                break
+            rate = step_rate
+        return rate
+
+    def describe(self) -> str:
+        return "step " + ", ".join(f"{start:.0f}s={rate:.0f}" for start, rate in self.steps)
+
+
+class SpikeProfile:
+    """기본 발행률에 at 초부터 length 초 동안 peak 발행률 스파이크"""
+
+    def __init__(self, base_rate: float, peak_rate: float, at: float, length: float):
+        self.base_rate = base_rate
+        self.peak_rate = peak_rate
+        self.at = at
+        self.length = length
+
+    def rate_at(self, elapsed: float) -> float:
+        if self.at <= elapsed < self.at + self.length:
+            return self.peak_rate
+        return self.base_rate
+
+    def describe(self) -> str:
+        return f"spike {self.base_rate:.0f}→{self.peak_rate:.0f} msg/s @ {self.at:.0f}s for {self.length:.0f}s"
+
+
+class DiurnalProfile:
+    """period 주기의 코사인 곡선 (0초에 최소, 반주기에 최대)"""
+
+    def __init__(self, min_rate: float, max_rate: float, period: float = 86400.0):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.period = period
+
+    def rate_at(self, elapsed: float) -> float:
+        phase = 2 * math.pi * elapsed / self.period
+        return self.min_rate + (self.max_rate - self.min_rate) * (1 - math.cos(phase)) / 2
+
+    def describe(self) -> str:
+        return f"diurnal {self.min_rate:.0f}~{self.max_rate:.0f} msg/s / {self.period:.0f}s"
+
+
+def parse_profile(spec: str):
+    """프로파일 문자열 파싱
+
+    constant:RATE | ramp:START:END:SECONDS | step:T=RATE,T=RATE,... |
+    spike:BASE:PEAK:AT:LENGTH | diurnal:MIN:MAX[:PERIOD]
+    """
+    kind, _, rest = spec.partition(":")
+    try:
+        if kind == "step":
+            steps = []
+            for item in rest.split(","):
+                start, rate = item.split("=")
+                steps.append((float(start), float(rate)))
+            return StepProfile(steps)
+
+        args = [float(part) for part in rest.split(":")] if rest else []
+        if kind == "constant" and len(args) == 1:
+            return ConstantProfile(*args)
+        if kind == "ramp" and len(args) == 3:
+            return RampProfile(*args)
+        if kind == "spike" and len(args) == 4:
+            return SpikeProfile(*args)
+        if kind == "diurnal" and len(args) in (2, 3):
+            return DiurnalProfile(*args)
+    except ValueError:
+        pass
+    raise ValueError(f"잘못된 부하 프로파일입니다: {spec}")
+
+
+class LoadStats:
+    """개방 루프 부하 실행 통계 (달성 발행률, 스케줄 지연, 마감 초과)"""
+
+    def __init__(self, miss_threshold: float):
+        self.miss_threshold = miss_threshold
+        self.sent = 0
+        self.missed = 0
+        self.lag_sum = 0.0
+        self.lag_max = 0.0
+        self.target_rate = 0.0
+        self.started = time.monotonic()
+
+        # 보고 구간 누적값
+        self._window_started = self.started
+        self._window_sent = 0
+        self._window_lag_sum = 0.0
+        self._window_lag_max = 0.0
+        self._window_missed = 0
+
+    def record(self, lag: float):
+        """메시지 한 건의 스케줄 지연 기록"""
+        self.sent += 1
+        self.lag_sum += lag
+        self._window_sent += 1
+        self._window_lag_sum += lag
+        if lag > self._window_lag_max:
+            self._window_lag_max = lag
+            if lag > self.lag_max:
+                self.lag_max = lag
+        if lag > self.miss_threshold:
+            self.missed += 1
+            self._window_missed += 1
+
+    def take_window(self) -> Dict[str, Any]:
+        """보고 구간 통계 반환 후 구간 초기화"""
+        now = time.monotonic()
+        elapsed = now - self._window_started
+        sent = self._window_sent
+        window = {
+            "target_rate": self.target_rate,
+            "achieved_rate": sent / elapsed if elapsed > 0 else 0.0,
+            "lag_avg_ms": self._window_lag_sum / sent * 1000 if sent else 0.0,
+            "lag_max_ms": self._window_lag_max * 1000,
+            "missed": self._window_missed,
+            "sent": sent
+        }
+        self._window_started = now
+        self._window_sent = 0
+        self._window_lag_sum = 0.0
+        self._window_lag_max = 0.0
+        self._window_missed = 0
+        return window
+
+    def summary(self) -> Dict[str, Any]:
+        """전체 실행 통계"""
+        elapsed = time.monotonic() - self.started
+        return {
+            "elapsed": elapsed,
+            "sent": self.sent,
+            "achieved_rate": self.sent / elapsed if elapsed > 0 else 0.0,
+            "lag_avg_ms": self.lag_sum / self.sent * 1000 if self.sent else 0.0,
+            "lag_max_ms": self.lag_max * 1000,
+            "missed": self.missed
+        }
+
+
+class RateScheduler:
+    """단조 시계 기반 마감 시각 스케줄러 (개방 루프)
+
+    마감 시각은 시작 시각에서 누적 계산하므로 발행 처리 시간이 주기를 밀어내지 않는다.
+    늦어진 메시지는 건너뛰지 않고 즉시 따라잡으며, 지연은 통계로 보고한다.
+    """
+
+    # 발행률이 0일 때 다음 확인까지 대기 (초)
+    IDLE_STEP = 0.01
+    # 모아 둔 메시지를 발행하는 최대 단위 (건수, 초): 목표를 못 따라가 대기가 없어도 이 단위로 flush
+    FLUSH_MESSAGES = 1000
+    FLUSH_INTERVAL = 0.01
+
+    def __init__(self, profile, arrival: str = "uniform", miss_threshold: float = 0.01,
+                 report_interval: float = 5.0, rng: Optional[random.Random] = None,
+                 rate_scale: float = 1.0):
+        if arrival not in ("uniform", "poisson"):
+            raise ValueError(f"알 수 없는 도착 분포입니다: {arrival}")
+        self.profile = profile
+        # 프로파일 발행률 배율 (다중 프로세스 실행 시 1/워커 수)
+        self.rate_scale = rate_scale
+        # 발행 창 slow 정책이 조절하는 배율 (브로커 확인이 밀리면 1.0보다 작아짐)
+        self.throttle = 1.0
+        self.arrival = arrival
+        self.report_interval = report_interval
+        self.rng = rng or random.Random()
+        self.stats = LoadStats(miss_threshold)
+
+    def _gap(self, rate: float) -> float:
+        """다음 메시지까지 간격 (uniform: 1/rate, poisson: 지수분포)"""
+        if self.arrival == "poisson":
+            return self.rng.expovariate(rate)
+        return 1.0 / rate
+
+    def run(self, emit: Callable[[], None], should_continue: Callable[[], bool],
+            report: Optional[Callable[[Dict[str, Any]], None]] = None,
+            flush: Optional[Callable[[], None]] = None):
+        """should_continue가 False가 될 때까지 마감 시각마다 emit 호출
+
+        flush가 주어지면 emit은 메시지를 모으기만 한다고 보고, 대기에 들어가기 전과 FLUSH_MESSAGES건 또는
+        FLUSH_INTERVAL초마다 flush를 호출한다 (생성이 목표를 못 따라가도 모아 둔 메시지가 쌓이지 않음).
+        스케줄 지연과 달성 발행률은 flush로 실제 발행한 시각 기준이다.
+        """
+        stats = self.stats
+        started = time.monotonic()
+        stats.started = stats._window_started = started
+        deadline = started
+        next_report = started + self.report_interval
+        # 모아 둔 메시지의 마감 시각
+        deadlines: List[float] = []
+        last_flush = started
+
+        def publish():
+            nonlocal last_flush
+            flush()
+            last_flush = time.monotonic()
+            for due in deadlines:
+                stats.record(last_flush - due)
+            deadlines.clear()
+
+        while should_continue():
+            now = time.monotonic()
+            if now >= next_report:
+                if report:
+                    report(stats.take_window())
+                next_report += self.report_interval
+
+            if deadline > now:
+                if flush:
+                    publish()
+                time.sleep(min(deadline - now, self.report_interval))
+                continue
+
+            rate = self.profile.rate_at(deadline - started) * self.rate_scale * self.throttle
+            stats.target_rate = rate
+            if rate <= 0:
+                deadline += self.IDLE_STEP
+                continue
+
+            emit()
+            if flush:
+                deadlines.append(deadline)
+                if len(deadlines) >= self.FLUSH_MESSAGES or now - last_flush >= self.FLUSH_INTERVAL:
+                    publish()
+            else:
+                stats.record(time.monotonic() - deadline)
+            deadline += self._gap(rate)
+
+        if flush:
+            publish()
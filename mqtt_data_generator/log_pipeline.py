@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
+
+# GUI 로그 창에 유지하는 최대 줄 수
+DEFAULT_RING_SIZE = 1000
+
+# 한 번의 after() 콜백에서 처리하는 최대 레코드 수
+DEFAULT_DRAIN_BATCH = 500
+
+# 화면에 아직 반영되지 않은 메시지 로그가 이보다 많으면 새 메시지 로그는 버림
+DEFAULT_MAX_PENDING = 10000
+
+
+class JsonLineFormatter(logging.Formatter):
+    """파일 로그용 구조화 포맷 (한 줄에 JSON 하나)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "kind": getattr(record, "kind", "event"),
+            "message": record.getMessage()
+        }, ensure_ascii=False)
+
+
+class LogPipeline:
+    """생성 스레드 → 화면/파일 로그 전달 파이프라인
+
+    log()/log_message()는 어느 스레드에서 호출해도 되며 큐에 넣기만 한다.
+    화면 출력은 drain()을 호출하는 쪽(Tk after 루프, 콘솔 스레드)이 배치로 처리한다.
+    메시지별 전송 로그는 1/N 샘플링하고, summary_interval마다 전송 건수 요약을 남긴다.
+    화면에 반영되지 않은 레코드가 max_pending을 넘으면 메시지 로그는 버린다 (이벤트 로그는 유지).
+    파일 로그는 QueueListener 스레드가 회전 파일에 JSON 줄로 기록한다.
+    """
+
+    def __init__(self, ring_size: int = DEFAULT_RING_SIZE, sample_every: int = 100,
+                 summary_interval: float = 1.0, file_path: Optional[str] = None,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 max_pending: int = DEFAULT_MAX_PENDING, prefix: str = ""):
+        # SimpleQueue.put은 잠금 없이 C 수준에서 처리
+        self._queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self.lines: Deque[str] = deque(maxlen=ring_size)
+        self.ring_size = ring_size
+        self.max_pending = max_pending
+        self.prefix = prefix  # 줄 앞에 붙는 출처 표시 (예: 워커 "[w0] ")
+        self.summary_interval = summary_interval
+        self.sample_every = 0
+        self.set_sample_every(sample_every)
+
+        # 메시지 로그 집계 (생성 스레드에서만 갱신)
+        self.message_total = 0
+        self._window_messages = 0
+        self._window_started = time.monotonic()
+
+        self.dropped = 0
+        self._file_logger: Optional[logging.Logger] = None
+        self._file_listener: Optional[logging.handlers.QueueListener] = None
+        self._console_thread: Optional[threading.Thread] = None
+        self._console_stop = threading.Event()
+        if file_path:
+            self.open_file(file_path, max_bytes, backup_count)
+
+    def set_sample_every(self, sample_every: int):
+        """메시지 로그 샘플링 (N건당 1건 표시, 0이면 요약만)"""
+        if sample_every < 0:
+            raise ValueError("샘플링 간격은 0 이상이어야 합니다.")
+        self.sample_every = sample_every
+
+    # ------------------------------------------------------------------
+    # 생산자 (임의 스레드)
+    # ------------------------------------------------------------------
+    def log(self, message: str):
+        """일반 이벤트 로그 (연결, 시작/중지, 오류 등은 모두 표시)"""
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._queue.put(f"[{timestamp}] {self.prefix}{message}")
+        if self._file_logger:
+            self._file_logger.info(message, extra={"kind": "event"})
+
+    def log_message(self, description: str):
+        """메시지별 전송 로그 (샘플링 + 구간 요약)"""
+        self.message_total += 1
+        self._window_messages += 1
+        if self.sample_every and self.message_total % self.sample_every == 0:
+            if self._queue.qsize() < self.max_pending:
+                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self._queue.put(f"[{timestamp}] {self.prefix}{description}")
+            else:
+                self.dropped += 1
+            if self._file_logger:
+                self._file_logger.info(description, extra={"kind": "message"})
+
+        now = time.monotonic()
+        if now - self._window_started >= self.summary_interval:
+            self._put_summary(now)
+
+    def _put_summary(self, now: float):
+        elapsed = now - self._window_started
+        count = self._window_messages
+        self._window_messages = 0
+        self._window_started = now
+        summary = f"📨 최근 {elapsed:.1f}초 전송 {count}건 ({count / elapsed:.0f} msg/s), 누적 {self.message_total}건"
+        self.log(summary)
+
+    # ------------------------------------------------------------------
+    # 소비자 (Tk 스레드 또는 콘솔 스레드)
+    # ------------------------------------------------------------------
+    def drain(self, max_batch: int = DEFAULT_DRAIN_BATCH) -> List[str]:
+        """큐에서 최대 max_batch개를 꺼내 링 버퍼에 반영하고 새 줄 목록 반환
+
+        한 배치가 링 크기를 넘으면 오래된 것은 표시하지 않고 버린 수만 센다.
+        """
+        batch = []
+        get = self._queue.get_nowait
+        try:
+            for _ in range(max_batch):
+                batch.append(get())
+        except queue.Empty:
+            pass
+
+        if len(batch) > self.ring_size:
+            self.dropped += len(batch) - self.ring_size
+            batch = batch[-self.ring_size:]
+        self.lines.extend(batch)
+        return batch
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def clear(self):
+        self.lines.clear()
+
+    def start_console(self, interval: float = 0.2):
+        """헤드리스 실행용: 백그라운드 스레드가 주기적으로 drain 후 표준 출력에 기록"""
+        if self._console_thread:
+            return
+        self._console_stop.clear()
+        self._console_thread = threading.Thread(target=self._console_loop, args=(interval,),
+                                                name="log-console", daemon=True)
+        self._console_thread.start()
+
+    def _console_loop(self, interval: float):
+        while not self._console_stop.wait(interval):
+            self._print_pending()
+        self._print_pending()
+
+    def _print_pending(self):
+        while True:
+            batch = self.drain()
+            if not batch:
+                return
+            print("\n".join(batch), flush=True)
+
+    # ------------------------------------------------------------------
+    # 회전 파일 로그
+    # ------------------------------------------------------------------
+    def open_file(self, file_path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        """회전 파일 로그 시작 (파일 쓰기는 QueueListener 스레드에서 수행)"""
+        self.close_file()
+        directory = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+
+        handler = logging.handlers.RotatingFileHandler(
+            file_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        handler.setFormatter(JsonLineFormatter())
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._file_listener = logging.handlers.QueueListener(records, handler)
+        self._file_listener.start()
+
+        logger = logging.getLogger(f"mqtt_data_generator.file.{id(self)}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.handlers = [logging.handlers.QueueHandler(records)]
+        self._file_logger = logger
+
+    def close_file(self):
+        """파일 로그 종료 (대기 중인 레코드를 모두 기록한 뒤 반환)"""
+        if self._file_listener:
+            self._file_logger = None
+            self._file_listener.stop()
+            for handler in self._file_listener.handlers:
+                handler.close()
+            self._file_listener = None
+
+    def close(self):
+        """콘솔 스레드와 파일 로그 정리"""
+        if self._console_thread:
+            self._console_stop.set()
+            self._console_thread.join()
+            self._console_thread = None
+        self.close_file()
+
+
+def pipeline_from_config(config: Dict[str, Any], file_suffix: str = "", prefix: str = "") -> LogPipeline:
+    """설정(log_sample, log_file)으로 헤드리스용 파이프라인 생성
+
+    file_suffix는 워커 프로세스별 파일 구분용 (예: logs/gen.log → logs/gen.w0.log).
+    """
+    file_path = config.get("log_file")
+    if file_path and file_suffix:
+        root, ext = os.path.splitext(file_path)
+        file_path = f"{root}{file_suffix}{ext}"
+    return LogPipeline(sample_every=int(config.get("log_sample", 1)), file_path=file_path, prefix=prefix)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Any, Optional
+
+# MQTT 패킷 타입 (고정 헤더 상위 4비트)
+CONNECT = 1
+PUBLISH = 3
+PUBREL = 6
+SUBSCRIBE = 8
+UNSUBSCRIBE = 10
+PINGREQ = 12
+DISCONNECT = 14
+
+# MQTT v5 프로토콜 레벨 (3.1.1은 4)
+PROTOCOL_V5 = 5
+
+
+def read_varint(buffer, pos: int):
+    """MQTT 가변 길이 정수 → (값, 다음 위치), 바이트가 모자라면 (None, pos)"""
+    value = 0
+    multiplier = 1
+    for offset in range(4):
+        if pos + offset >= len(buffer):
+            return None, pos
+        byte = buffer[pos + offset]
+        value += (byte & 0x7F) * multiplier
+        if not byte & 0x80:
+            return value, pos + offset + 1
+        multiplier *= 128
+    raise ValueError("잘못된 MQTT 가변 길이 정수입니다.")
+
+
+class LoopbackConnection(asyncio.Protocol):
+    """클라이언트 연결 하나: 받은 바이트를 패킷 단위로 잘라 처리하고 응답은 모아서 한 번에 씀"""
+
+    def __init__(self, broker: "LoopbackBroker"):
+        self.broker = broker
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = bytearray()
+        self.protocol_level = 4
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.broker.connections += 1
+        self.broker._transports.add(transport)
+
+    def connection_lost(self, exc):
+        self.broker.connections -= 1
+        self.broker._transports.discard(self.transport)
+
+    def data_received(self, data: bytes):
+        buffer = self.buffer
+        buffer += data
+        replies = bytearray()
+        pos = 0
+        try:
+            while len(buffer) - pos >= 2:
+                length, body_start = read_varint(buffer, pos + 1)
+                if length is None or len(buffer) < body_start + length:
+                    break
+                header = buffer[pos]
+                body = memoryview(buffer)[body_start:body_start + length]
+                try:
+                    if not self.handle_packet(header, body, replies):
+                        self.transport.close()
+                        break
+                finally:
+                    body.release()
+                pos = body_start + length
+        except (ValueError, IndexError):
+            self.broker.malformed += 1
+            self.transport.close()
+            return
+        del buffer[:pos]
+        if replies:
+            self.transport.write(bytes(replies))
+
+    def handle_packet(self, header: int, body: memoryview, replies: bytearray) -> bool:
+        """패킷 하나 처리 (False면 연결 종료)"""
+        packet_type = header >> 4
+        broker = self.broker
+        if packet_type == PUBLISH:
+            qos = (header >> 1) & 0x03
+            topic_end = 2 + int.from_bytes(body[:2], "big")
+            pos = topic_end
+            if qos:
+                packet_id = bytes(body[pos:pos + 2])
+                pos += 2
+            if self.protocol_level == PROTOCOL_V5:
+                properties_length, pos = read_varint(body, pos)
+                pos += properties_length
+            broker.messages += 1
+            broker.bytes += len(body) - pos
+            if broker.checksum is not None:
+                # 연결 간 도착 순서와 무관하도록 메시지별 CRC32 합을 누적
+                broker.checksum = (broker.checksum + zlib.crc32(body[pos:], zlib.crc32(body[2:topic_end]))) & 0xFFFFFFFF
+            if qos == 1:
+                replies += b"\x40\x02"
+                replies += packet_id
+            elif qos == 2:
+                replies += b"\x50\x02"
+                replies += packet_id
+        elif packet_type == PUBREL:
+            replies += b"\x70\x02"
+            replies += body[:2]
+        elif packet_type == CONNECT:
+            protocol_name_end = 2 + int.from_bytes(body[:2], "big")
+            self.protocol_level = body[protocol_name_end]
+            # CONNACK: 세션 없음, 성공 (v5는 속성 길이 0 추가)
+            replies += b"\x20\x03\x00\x00\x00" if self.protocol_level == PROTOCOL_V5 else b"\x20\x02\x00\x00"
+        elif packet_type == PINGREQ:
+            replies += b"\xd0\x00"
+        elif packet_type == DISCONNECT:
+            return False
+        elif packet_type in (SUBSCRIBE, UNSUBSCRIBE):
+            # 발행 전용 싱크: 구독은 받지 않음 (SUBACK/UNSUBACK 없이 연결 종료)
+            broker.rejected += 1
+            return False
+        else:
+            broker.malformed += 1
+            return False
+        return True
+
+
+class LoopbackBroker:
+    """로컬 MQTT 3.1.1/5 싱크 브로커: CONNECT/PUBLISH(QoS 0~2)/PINGREQ를 받아 응답하고 메시지는 세기만 함
+
+    구독/전달 기능은 없으며, 생성기를 네트워크·외부 브로커 없이 최대 속도로 돌려 생성기 자체의 한계를 재는 용도다.
+    start()는 별도 스레드의 asyncio 루프에서 실행하고, run_forever()는 현재 스레드에서 실행한다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 1883, checksum: bool = False,
+                 log: Optional[Callable[[str], None]] = None):
+        self.host = host
+        self.port = port
+        self.log = log or print
+
+        self.messages = 0
+        self.bytes = 0
+        self.connections = 0
+        self.rejected = 0
+        self.malformed = 0
+        self.checksum: Optional[int] = 0 if checksum else None
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._transports = set()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        try:
+            self._server = await self.loop.create_server(lambda: LoopbackConnection(self), self.host, self.port)
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            return
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with self._server:
+            try:
+                await self._server.serve_forever()
+            except asyncio.CancelledError:
+                pass
+
+    def start(self):
+        """백그라운드 스레드에서 시작 (포트가 열릴 때까지 대기, port=0이면 임의 포트)"""
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._serve()), name="loopback-broker", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error:
+            raise self._error
+        self.log(f"🔁 루프백 브로커 시작: {self.host}:{self.port}")
+
+    def _shutdown(self):
+        self._server.close()
+        for transport in list(self._transports):
+            transport.close()
+
+    def stop(self):
+        if self.loop and self._server:
+            self.loop.call_soon_threadsafe(self._shutdown)
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "connections": self.connections,
+            "rejected": self.rejected,
+            "malformed": self.malformed,
+            "checksum": self.checksum
+        }
+
+    def describe(self) -> str:
+        text = f"수신 {self.messages:,}건 ({self.bytes / (1024 * 1024):,.1f}MB), 연결 {self.connections}개"
+        if self.checksum is not None:
+            text += f", 체크섬 {self.checksum:08x}"
+        if self.rejected or self.malformed:
+            text += f", 거부 {self.rejected}건, 잘못된 패킷 {self.malformed}건"
+        return text
+
+    def run_forever(self, duration: Optional[float] = None, report_interval: float = 5.0):
+        """단독 실행: 주기마다 수신률을 보고하고 duration 경과 또는 Ctrl+C에 종료"""
+        self.start()
+        started = time.monotonic()
+        last_time = started
+        last_messages = 0
+        try:
+            while duration is None or time.monotonic() - started < duration:
+                time.sleep(0.2)
+                now = time.monotonic()
+                if now - last_time < report_interval:
+                    continue
+                messages = self.messages
+                self.log(f"📥 {self.describe()}, {(messages - last_messages) / (now - last_time):,.0f} msg/s")
+                last_time = now
+                last_messages = messages
+        except KeyboardInterrupt:
+            self.log("⛔ 사용자 중단 요청")
+        finally:
+            self.stop()
+            elapsed = time.monotonic() - started
+            self.log(f"🏁 루프백 브로커 종료: {self.describe()}, 평균 {self.messages / elapsed if elapsed else 0:,.0f} msg/s")
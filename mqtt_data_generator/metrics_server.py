@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+from latency_metrics import PERCENTILES
+
+# Prometheus 메트릭 이름 접두사
+METRIC_PREFIX = "hdms_generator"
+
+
+def render_metrics(engine) -> str:
+    """엔진 발행 통계/지연 히스토그램을 Prometheus 텍스트 형식으로 변환"""
+    totals = engine.stats.totals()
+    status = engine.status()
+    lines: List[str] = []
+
+    def metric(name: str, kind: str, help_text: str, samples):
+        full_name = f"{METRIC_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{full_name}{labels} {value}")
+
+    metric("published_total", "counter", "PUBLISH calls", [("", totals["sent"])])
+    metric("acked_total", "counter", "PUBACKs received", [("", totals["acked"])])
+    metric("failed_total", "counter", "PUBLISH calls that failed", [("", totals["failed"])])
+    metric("published_bytes_total", "counter", "Payload bytes published", [("", totals["bytes"])])
+    metric("dropped_total", "counter", "Messages dropped by the in-flight window", [("", status["dropped"])])
+    metric("in_flight", "gauge", "Messages waiting for PUBACK", [("", totals["in_flight"])])
+    metric("connected", "gauge", "Broker connection state", [("", int(status["connected"]))])
+    metric("running", "gauge", "Generation state", [("", int(status["running"]))])
+
+    # 발행 → PUBACK 지연 (센서 타입 × 연결별 summary)
+    quantiles = []
+    sums = []
+    counts = []
+    maxima = []
+    for sensor_type, connection, histogram in engine.latency.snapshots():
+        labels = f'sensor_type="{sensor_type}",connection="{connection}"'
+        for percent in PERCENTILES:
+            quantiles.append((f'{{{labels},quantile="{percent / 100:g}"}}', histogram.percentile(percent) / 1e6))
+        sums.append((f"{{{labels}}}", histogram.total / 1e6))
+        counts.append((f"{{{labels}}}", histogram.count))
+        maxima.append((f"{{{labels}}}", histogram.max / 1e6))
+    full_name = f"{METRIC_PREFIX}_ack_latency_seconds"
+    lines.append(f"# HELP {full_name} Publish to PUBACK latency")
+    lines.append(f"# TYPE {full_name} summary")
+    lines.extend(f"{full_name}{labels} {value}" for labels, value in quantiles)
+    lines.extend(f"{full_name}_sum{labels} {value}" for labels, value in sums)
+    lines.extend(f"{full_name}_count{labels} {value}" for labels, value in counts)
+    metric("ack_latency_max_seconds", "gauge", "Largest publish to PUBACK latency", maxima)
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """로컬 Prometheus 스크레이프 엔드포인트 (GET /metrics, 별도 데몬 스레드)"""
+
+    def __init__(self, engine, port: int, host: str = "127.0.0.1",
+                 log: Optional[Callable[[str], None]] = None):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.log = log or print
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        engine = self.engine
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render_metrics(engine).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # 스크레이프마다 콘솔에 찍지 않음
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+        self.log(f"📡 메트릭 엔드포인트: http://{self.host}:{self.port}/metrics")
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
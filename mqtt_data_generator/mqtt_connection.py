@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# paho-mqtt와 같은 값 (paho는 첫 연결 때 불러오므로 시작 시 import 없이 쓰기 위한 사본)
+MQTTv311 = 4
+MQTTv5 = 5
+MQTT_ERR_SUCCESS = 0
+
+
+def create_mqtt_client(client_id: str, protocol: int = MQTTv311):
+    """paho-mqtt 버전에 맞는 클라이언트 생성 (protocol: MQTTv311 또는 MQTTv5)"""
+    import paho.mqtt.client as mqtt
+
+    # paho-mqtt 버전에 따라 Client 생성 방식 분기 (v2.x: CallbackAPIVersion, v1.x: 없음)
+    try:
+        _ = mqtt.CallbackAPIVersion  # 존재 확인
+        return mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id, protocol=protocol)
+    except AttributeError:
+        # paho-mqtt 1.x 호환
+        return mqtt.Client(client_id, protocol=protocol)
+
+
+def is_connect_failure(reason_code) -> bool:
+    """on_connect reason_code 실패 여부"""
+    # reason_code는 MQTT v5에서는 ReasonCode 객체(속성 is_failure/ value), v3에서는 int일 수 있음
+    if hasattr(reason_code, "is_failure"):
+        return bool(getattr(reason_code, "is_failure"))
+    return int(getattr(reason_code, "value", 0 if reason_code is None else reason_code)) != 0
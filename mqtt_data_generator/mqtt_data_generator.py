@@ -5,12 +5,25 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import paho.mqtt.client as mqtt
 import json
+import os
+import sys
 import threading
 import time
 import random
 import datetime
+from array import array
 from typing import Dict, Any, Optional
 
+from sensor_types import SENSOR_TYPES_BY_CODE, SENSOR_TYPE_LABELS
+from state_checkpoint import CheckpointReader, write_checkpoint
+
+# 센서 이전 값/난수 상태 체크포인트 (재시작해도 값이 시작값으로 돌아가지 않고 이어짐)
+# 작업 폴더와 상관없이 프로그램 옆에 저장 (실행 파일로 묶였으면 실행 파일 폴더)
+APP_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, "frozen", False) else __file__))
+CHECKPOINT_PATH = os.path.join(APP_DIR, "sensor_state_v1.ckpt")
+CHECKPOINT_KIND = "v1"
+CHECKPOINT_INTERVAL = 10.0
+
 class MqttDataGenerator:
     def __init__(self, root):
         self.root = root
@@ -44,42 +57,25 @@ class MqttDataGenerator:
             {"id": 8, "building_id": 7, "name": "배전반알림test", "location": "시설알림test"}  # 문제 배전반
         ]
         
-        # 센서 타입 정의 (새로운 방식)
-        self.sensor_types = {
-            1: "전류",
-            2: "온도", 
-            3: "습도"
-        }
+        # 센서 타입 정의 (v2와 같은 센서 타입 표)
+        self.sensor_types = SENSOR_TYPE_LABELS
         
         # 센서 초기값 설정
         self.init_sensor_values()
         
         self.create_widgets()
         
+        # 이전 실행의 체크포인트가 있으면 이어서 시작
+        self.load_sensor_state()
+        
     def init_sensor_values(self):
-        """센서 초기값 설정"""
+        """센서 초기값 설정 (센서 타입 표의 주 값/부가 필드 시작값)"""
         for sensor in self.sensors:
-            sensor_id = sensor["id"]
-            sensor_type = sensor["type"]
-            
-            if sensor_type == 1:  # 전류 센서
-                self.sensor_last_values[sensor_id] = {
-                    "current": 8.5,  # 중간값으로 시작
-                    "voltage": 230.0,
-                    "power": 1500.0,
-                    "frequency": 60.0
-                }
-            elif sensor_type == 2:  # 온도 센서
-                self.sensor_last_values[sensor_id] = {
-                    "temperature": 30.0,
-                    "ambient_temp": 22.0
-                }
-            elif sensor_type == 3:  # 습도 센서
-                self.sensor_last_values[sensor_id] = {
-                    "humidity": 55.0,
-                    "ambient_temp": 25.0,
-                    "ambient_humi": 55.0
-                }
+            sensor_type = SENSOR_TYPES_BY_CODE.get(sensor["type"])
+            if sensor_type:
+                values = {sensor_type.name: sensor_type.walk[2]}
+                values.update((field.name, field.initial) for field in sensor_type.aux_fields)
+                self.sensor_last_values[sensor["id"]] = values
                 
     def get_stable_value(self, sensor_id: int, field: str, min_val: float, max_val: float, max_change: float = 0.5) -> float:
         """안정적인 값 변화 생성"""
@@ -100,6 +96,65 @@ class MqttDataGenerator:
         
         return new_value
         
+    def save_sensor_state(self):
+        """센서 이전 값과 난수 상태를 체크포인트 파일로 저장 (생성 스레드에서 호출)
+
+        값은 (센서 ID, 필드 번호, 값) 열 세 개, 난수 상태는 Mersenne Twister 상태 배열을 이진 구역으로 저장하고
+        메타데이터에는 필드 이름 표와 난수 상태 버전/가우스 값만 둔다 (엔진 체크포인트와 같은 파일 형식).
+        """
+        random_state = random.getstate()
+        fields = []
+        field_numbers = {}
+        ids, numbers, values = array("q"), array("H"), array("d")
+        for sensor_id, sensor_values in list(self.sensor_last_values.items()):
+            for field, value in list(sensor_values.items()):
+                if field not in field_numbers:
+                    field_numbers[field] = len(fields)
+                    fields.append(field)
+                ids.append(sensor_id)
+                numbers.append(field_numbers[field])
+                values.append(value)
+        meta = {
+            "kind": CHECKPOINT_KIND,
+            "saved_at": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "fields": fields,
+            "random_version": random_state[0],
+            "random_gauss": random_state[2]
+        }
+        sections = {
+            "ids": ("q", ids),
+            "field_numbers": ("H", numbers),
+            "values": ("d", values),
+            "random_state": ("q", array("q", random_state[1]))
+        }
+        try:
+            write_checkpoint(CHECKPOINT_PATH, meta, sections)
+        except OSError as e:
+            self.log(f"체크포인트 저장 실패: {str(e)}")
+            
+    def load_sensor_state(self):
+        """체크포인트의 센서 이전 값과 난수 상태 복원 (없거나 읽을 수 없으면 시작값 그대로)"""
+        try:
+            with CheckpointReader(CHECKPOINT_PATH) as reader:
+                meta = reader.meta
+                if meta.get("kind") != CHECKPOINT_KIND:
+                    return
+                ids = reader.array("ids")
+                numbers = reader.array("field_numbers")
+                values = reader.array("values")
+                random_state = tuple(reader.array("random_state"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.log(f"체크포인트를 읽을 수 없어 시작값으로 시작합니다: {str(e)}")
+            return
+        fields = meta["fields"]
+        for sensor_id, number, value in zip(ids, numbers, values):
+            if sensor_id in self.sensor_last_values:
+                self.sensor_last_values[sensor_id][fields[number]] = value
+        random.setstate((meta["random_version"], random_state, meta["random_gauss"]))
+        self.log(f"체크포인트에서 센서 값을 이어서 시작합니다 (저장 {meta['saved_at']})")
+        
     def create_widgets(self):
         # 메인 프레임
         main_frame = ttk.Frame(self.root, padding="10")
@@ -278,16 +333,24 @@ class MqttDataGenerator:
         except ValueError:
             interval = 2.0
             
+        last_saved = time.monotonic()
         while self.is_running:
             try:
                 # 센서 데이터만 생성
                 self.generate_sensor_data()
                 
+                if time.monotonic() - last_saved >= CHECKPOINT_INTERVAL:
+                    self.save_sensor_state()
+                    last_saved = time.monotonic()
+                
                 time.sleep(interval)
                 
             except Exception as e:
                 self.log(f"데이터 생성 중 오류: {str(e)}")
                 time.sleep(1)
+        
+        # 중지할 때 마지막 상태 저장
+        self.save_sensor_state()
                 
     def generate_sensor_data(self):
         """센서 데이터 생성 및 발행"""
@@ -302,7 +365,8 @@ class MqttDataGenerator:
                 # 토픽: HS/{sensor_id}/data
                 topic = f"HS/{sensor['id']}/data"
                 
-                # 메시지 발행
+                # 메시지 발행 (v1 페이로드는 메시지마다 rssi/has_event/is_connected가 무작위라
+                # v2 엔진의 PayloadEncoder 조각을 쓰지 않고 json.dumps로 직렬화)
                 payload = json.dumps(sensor_data, ensure_ascii=False)
                 self.mqtt_client.publish(topic, payload, qos=1)
                 
@@ -327,44 +391,21 @@ class MqttDataGenerator:
             "has_event": random.choice([True, False])
         }
         
-        # 센서 타입별 안정적인 데이터 생성
-        if sensor["type"] == 1:  # 전류 센서
-            current_value = round(self.get_stable_value(sensor_id, "current", 1.0, 12.0, 0.3), 2)
-            voltage_value = round(self.get_stable_value(sensor_id, "voltage", 220.0, 240.0, 1.0), 1)
-            power_value = round(self.get_stable_value(sensor_id, "power", 200.0, 2500.0, 50.0), 1)
-            frequency_value = round(self.get_stable_value(sensor_id, "frequency", 59.8, 60.2, 0.1), 1)
-            
-            base_data.update({
-                "current": current_value,
-                "current_adc": random.randint(int(current_value * 100), int(current_value * 300)),
-                "voltage": voltage_value,
-                "power": power_value,
-                "frequency": frequency_value,
-                "value": current_value,
-                "unit": "A"
-            })
-        elif sensor["type"] == 2:  # 온도 센서
-            temperature_value = round(self.get_stable_value(sensor_id, "temperature", 25.0, 40.0, 0.5), 1)
-            ambient_temp_value = round(self.get_stable_value(sensor_id, "ambient_temp", 18.0, 25.0, 0.3), 1)
-            
-            base_data.update({
-                "temperature": temperature_value,
-                "temperature_adc": random.randint(int(temperature_value * 50), int(temperature_value * 80)),
-                "ambient_temp": ambient_temp_value,
-                "value": temperature_value,
-                "unit": "°C"
-            })
-        elif sensor["type"] == 3:  # 습도 센서
-            humidity_value = round(self.get_stable_value(sensor_id, "humidity", 45.0, 70.0, 1.0), 1)
-            ambient_temp_value = round(self.get_stable_value(sensor_id, "ambient_temp", 20.0, 28.0, 0.5), 1)
-            ambient_humi_value = round(self.get_stable_value(sensor_id, "ambient_humi", 40.0, 65.0, 1.0), 1)
-            
+        # 센서 타입 표의 필드 순서대로 안정적인 데이터 생성 (주 값 → ADC → 부가 필드 → value/unit)
+        sensor_type = SENSOR_TYPES_BY_CODE.get(sensor["type"])
+        if sensor_type:
+            low, high, _, max_change = sensor_type.walk
+            value = round(self.get_stable_value(sensor_id, sensor_type.name, low, high, max_change), sensor_type.digits)
+            base_data[sensor_type.name] = value
+            if sensor_type.adc:
+                adc = sensor_type.adc
+                base_data[adc.name] = random.randint(int(value * adc.scale_low), int(value * adc.scale_high))
+            for field in sensor_type.aux_fields:
+                base_data[field.name] = round(self.get_stable_value(sensor_id, field.name, field.low, field.high,
+                                                                    field.max_change), field.digits)
             base_data.update({
-                "humidity": humidity_value,
-                "ambient_temp": ambient_temp_value,
-                "ambient_humi": ambient_humi_value,
-                "value": humidity_value,
-                "unit": "%"
+                "value": value,
+                "unit": sensor_type.unit
             })
         else:
             # 기본 센서 데이터
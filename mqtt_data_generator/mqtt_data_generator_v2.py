@@ -2,14 +2,20 @@
 # -*- coding: utf-8 -*-
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import paho.mqtt.client as mqtt
-import json
-import threading
-import time
-import datetime
-import random
-from typing import Dict, Any, Optional
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+
+from generator_engine import GeneratorEngine
+from log_pipeline import LogPipeline
+from publish_stats import format_bytes
+from sensor_browser import SensorBrowser
+from sensor_types import SENSOR_TYPES
+import startup_profile
+
+# 로그 큐를 Tk 스레드에서 비우는 주기 (ms)
+LOG_DRAIN_INTERVAL_MS = 100
+
+# 발행 통계 패널 갱신 주기 (ms, 4Hz)
+STATS_REFRESH_INTERVAL_MS = 250
 
 class MqttDataGeneratorV2:
     def __init__(self, root):
@@ -17,48 +23,26 @@ class MqttDataGeneratorV2:
         self.root.title("HDMS MQTT 센서 데이터 생성기 V2")
         self.root.geometry("1200x800")
         
-        # MQTT 설정
-        self.mqtt_client: Optional[mqtt.Client] = None
-        self.is_connected = False
-        self.is_running = False
-        self.generator_thread: Optional[threading.Thread] = None
+        # 로그 파이프라인 (생성 스레드는 큐에 넣기만 하고 Tk 스레드가 배치로 표시)
+        self.log_pipeline = LogPipeline()
         
-        # 토픽 프리픽스 설정 (환경별 분리용)
-        self.topic_prefix = "HS"  # 기본값: HS, 개발환경: AHS, 테스트환경: THS 등
-        
-        # 센서 설정 (동적 설정 가능)
-        self.sensors = {
-            "current": [],
-            "temperature": [],
-            "humidity": []
-        }
+        # 데이터 생성 엔진 (GUI는 엔진의 얇은 클라이언트)
+        self.engine = GeneratorEngine(log_callback=self.log)
+        self.engine.message_log_callback = self.log_pipeline.log_message
+        self.engine.on_connection_change = self.on_connection_change
+        # 연결 상태 (MQTT 네트워크 스레드가 쓰고 Tk 스레드의 refresh_stats가 위젯에 반영)
+        self.connection_state = False
+        self.shown_connection_state = False
         
         # 기본 센서 추가
-        self.add_default_sensors()
+        self.engine.add_default_sensors()
         
-        # 센서별 입력값 저장
-        self.sensor_values = {
-            "current": {"current": 8.5},
-            "temperature": {"temperature": 25.0},
-            "humidity": {"humidity": 55.0}
-        }
-        
-        # 센서별 변동 범위 설정 (실제와 유사한 범위)
-        self.sensor_variations = {
-            "current": {"range": 0.5, "trend_probability": 0.1},      # ±0.5A, 10% 확률로 트렌드 변화
-            "temperature": {"range": 2.0, "trend_probability": 0.05}, # ±2°C, 5% 확률로 트렌드 변화  
-            "humidity": {"range": 3.0, "trend_probability": 0.08}     # ±3%, 8% 확률로 트렌드 변화
-        }
-        
-        # 센서별 현재 트렌드 (상승/하강/유지)
-        self.sensor_trends = {
-            "current": 0.0,      # -1: 하강, 0: 유지, 1: 상승
-            "temperature": 0.0,
-            "humidity": 0.0
-        }
-        
-        self.message_count = 0
         self.create_widgets()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self.drain_log)
+        self.root.after(STATS_REFRESH_INTERVAL_MS, self.refresh_stats)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # 시작 시간 측정 중이면 첫 화면을 그린 뒤 보고 (--profile-startup)
+        self.root.after_idle(lambda: startup_profile.finish("첫 화면", log=self.log))
         
     def create_widgets(self):
         # 메인 프레임
@@ -75,14 +59,11 @@ class MqttDataGeneratorV2:
         sensors_frame = ttk.Frame(main_frame)
         sensors_frame.grid(row=2, column=0, columnspan=3, sticky="ew", pady=(10, 0))
         
-        # 전류센서 프레임
-        self.create_current_sensor_frame(sensors_frame)
-        
-        # 온도센서 프레임
-        self.create_temperature_sensor_frame(sensors_frame)
-        
-        # 습도센서 프레임
-        self.create_humidity_sensor_frame(sensors_frame)
+        # 센서 타입 표의 타입마다 프레임 하나 (타입 이름 → 목록/기준값 입력)
+        self.type_browsers = {}
+        self.type_entries = {}
+        for column, sensor_type in enumerate(SENSOR_TYPES):
+            self.create_type_sensor_frame(sensors_frame, column, sensor_type)
         
         # 제어 버튼
         self.create_control_frame(main_frame)
@@ -123,7 +104,7 @@ class MqttDataGeneratorV2:
         # 두 번째 줄: 토픽 프리픽스 설정
         ttk.Label(connection_frame, text="토픽 프리픽스:").grid(row=1, column=0, sticky="w", pady=(10, 0))
         self.topic_prefix_entry = ttk.Entry(connection_frame, width=15)
-        self.topic_prefix_entry.insert(0, self.topic_prefix)
+        self.topic_prefix_entry.insert(0, self.engine.topic_prefix)
         self.topic_prefix_entry.grid(row=1, column=1, padx=(5, 0), pady=(10, 0))
         
         # 토픽 프리픽스 설명 라벨
@@ -150,18 +131,6 @@ class MqttDataGeneratorV2:
         self.disconnect_btn = ttk.Button(connection_frame, text="연결해제", command=self.disconnect_mqtt, state=tk.DISABLED)
         self.disconnect_btn.grid(row=0, column=7, padx=(5, 0))
         
-    def add_default_sensors(self):
-        """기본 센서 추가"""
-        self.sensors["current"] = [
-            {"id": 21, "name": "전류센서TEST"}
-        ]
-        self.sensors["temperature"] = [
-            {"id": 25, "name": "온도센서TEST"}
-        ]
-        self.sensors["humidity"] = [
-            {"id": 26, "name": "습도센서TEST"}
-        ]
-        
     def create_sensor_management_frame(self, parent):
         """센서 관리 프레임"""
         mgmt_frame = ttk.LabelFrame(parent, text="🔧 센서 관리", padding="10")
@@ -170,7 +139,7 @@ class MqttDataGeneratorV2:
         # 센서 타입 선택
         ttk.Label(mgmt_frame, text="센서 타입:").grid(row=0, column=0, sticky="w")
         self.sensor_type_var = tk.StringVar(value="current")
-        sensor_type_combo = ttk.Combobox(mgmt_frame, textvariable=self.sensor_type_var, values=["current", "temperature", "humidity"], state="readonly", width=12)
+        sensor_type_combo = ttk.Combobox(mgmt_frame, textvariable=self.sensor_type_var, values=list(SENSOR_TYPES), state="readonly", width=12)
         sensor_type_combo.grid(row=0, column=1, padx=(5, 0))
         
         # 센서 ID 입력
@@ -193,14 +162,9 @@ class MqttDataGeneratorV2:
         list_frame = ttk.Frame(mgmt_frame)
         list_frame.grid(row=2, column=0, columnspan=7, sticky="ew", pady=(5, 0))
         
-        # 센서 목록 리스트박스
-        self.sensor_listbox = tk.Listbox(list_frame, height=4, width=80)
-        self.sensor_listbox.grid(row=0, column=0, sticky="ew")
-        
-        # 스크롤바
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.sensor_listbox.yview)
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.sensor_listbox.config(yscrollcommand=scrollbar.set)
+        # 센서 목록 (보이는 행만 채우는 가상화 Treeview, ID/이름/타입 검색)
+        self.sensor_browser = SensorBrowser(list_frame, self.engine.registry, rows=6)
+        self.sensor_browser.grid(row=0, column=0, sticky="ew")
         
         # 센서 삭제 버튼
         ttk.Button(mgmt_frame, text="🗑️ 선택된 센서 삭제", command=self.remove_sensor).grid(row=3, column=0, pady=(5, 0))
@@ -208,97 +172,41 @@ class MqttDataGeneratorV2:
         # 센서 목록 새로고침 버튼
         ttk.Button(mgmt_frame, text="🔄 목록 새로고침", command=self.refresh_sensor_list).grid(row=3, column=1, padx=(10, 0), pady=(5, 0))
         
-        list_frame.columnconfigure(0, weight=1)
-        
-        # 초기 센서 목록 표시
-        self.refresh_sensor_list()
-        
-    def create_current_sensor_frame(self, parent):
-        """⚡ 전류센서 설정 프레임"""
-        self.current_frame = ttk.LabelFrame(parent, text="⚡ 전류센서 (Type 1)", padding="10")
-        self.current_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
-        
-        # 센서 목록 프레임
-        self.current_sensor_list_frame = ttk.Frame(self.current_frame)
-        self.current_sensor_list_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
-        
-        # 센서 목록 업데이트
-        self.update_current_sensor_list()
-        
-        # 구분선
-        ttk.Separator(self.current_frame, orient='horizontal').grid(row=10, column=0, columnspan=2, sticky="ew", pady=10)
-        
-        # 값 입력
-        ttk.Label(self.current_frame, text="⚙️ 값 설정:", font=("", 9, "bold")).grid(row=11, column=0, columnspan=2, sticky="w")
-        
-        ttk.Label(self.current_frame, text="전류 (A):").grid(row=12, column=0, sticky="w", pady=2)
-        self.current_entry = ttk.Entry(self.current_frame, width=15)
-        self.current_entry.insert(0, str(self.sensor_values["current"]["current"]))
-        self.current_entry.grid(row=12, column=1, padx=(5, 0), pady=2)
-        
-        # 업데이트 버튼
-        update_btn = ttk.Button(self.current_frame, text="🔄 값 업데이트", command=self.update_current_values)
-        update_btn.grid(row=13, column=0, columnspan=2, pady=(10, 0))
-        
-        parent.columnconfigure(0, weight=1)
-        
-    def create_temperature_sensor_frame(self, parent):
-        """🌡️ 온도센서 설정 프레임"""
-        self.temperature_frame = ttk.LabelFrame(parent, text="🌡️ 온도센서 (Type 2)", padding="10")
-        self.temperature_frame.grid(row=0, column=1, sticky="nsew", padx=5)
-        
-        # 센서 목록 프레임
-        self.temperature_sensor_list_frame = ttk.Frame(self.temperature_frame)
-        self.temperature_sensor_list_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
-        
-        # 센서 목록 업데이트
-        self.update_temperature_sensor_list()
+        # 센서 목록 파일 가져오기 버튼
+        ttk.Button(mgmt_frame, text="📂 목록 가져오기", command=self.import_sensors).grid(row=3, column=2, padx=(10, 0), pady=(5, 0))
         
-        # 구분선
-        ttk.Separator(self.temperature_frame, orient='horizontal').grid(row=10, column=0, columnspan=2, sticky="ew", pady=10)
-        
-        # 값 입력
-        ttk.Label(self.temperature_frame, text="⚙️ 값 설정:", font=("", 9, "bold")).grid(row=11, column=0, columnspan=2, sticky="w")
-        
-        ttk.Label(self.temperature_frame, text="온도 (°C):").grid(row=12, column=0, sticky="w", pady=2)
-        self.temperature_entry = ttk.Entry(self.temperature_frame, width=15)
-        self.temperature_entry.insert(0, str(self.sensor_values["temperature"]["temperature"]))
-        self.temperature_entry.grid(row=12, column=1, padx=(5, 0), pady=2)
-        
-        # 업데이트 버튼
-        update_btn = ttk.Button(self.temperature_frame, text="🔄 값 업데이트", command=self.update_temperature_values)
-        update_btn.grid(row=13, column=0, columnspan=2, pady=(10, 0))
-        
-        parent.columnconfigure(1, weight=1)
+        list_frame.columnconfigure(0, weight=1)
         
-    def create_humidity_sensor_frame(self, parent):
-        """💧 습도센서 설정 프레임"""
-        self.humidity_frame = ttk.LabelFrame(parent, text="💧 습도센서 (Type 3)", padding="10")
-        self.humidity_frame.grid(row=0, column=2, sticky="nsew", padx=(5, 0))
+    def create_type_sensor_frame(self, parent, column: int, sensor_type: str):
+        """센서 타입별 설정 프레임 (센서 타입 표의 아이콘/이름/단위 사용)"""
+        spec = SENSOR_TYPES[sensor_type]
+        last_column = len(SENSOR_TYPES) - 1
+        frame = ttk.LabelFrame(parent, text=f"{spec.icon} {spec.label}센서 (Type {spec.code})", padding="10")
+        frame.grid(row=0, column=column, sticky="nsew",
+                   padx=(0 if column == 0 else 5, 0 if column == last_column else 5))
         
-        # 센서 목록 프레임
-        self.humidity_sensor_list_frame = ttk.Frame(self.humidity_frame)
-        self.humidity_sensor_list_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
-        
-        # 센서 목록 업데이트
-        self.update_humidity_sensor_list()
+        # 센서 목록 (타입 고정 가상화 목록)
+        browser = SensorBrowser(frame, self.engine.registry, rows=5, type_code=spec.code)
+        browser.grid(row=0, column=0, columnspan=2, sticky="ew")
+        self.type_browsers[sensor_type] = browser
         
         # 구분선
-        ttk.Separator(self.humidity_frame, orient='horizontal').grid(row=10, column=0, columnspan=2, sticky="ew", pady=10)
+        ttk.Separator(frame, orient='horizontal').grid(row=10, column=0, columnspan=2, sticky="ew", pady=10)
         
         # 값 입력
-        ttk.Label(self.humidity_frame, text="⚙️ 값 설정:", font=("", 9, "bold")).grid(row=11, column=0, columnspan=2, sticky="w")
+        ttk.Label(frame, text="⚙️ 값 설정:", font=("", 9, "bold")).grid(row=11, column=0, columnspan=2, sticky="w")
         
-        ttk.Label(self.humidity_frame, text="습도 (%):").grid(row=12, column=0, sticky="w", pady=2)
-        self.humidity_entry = ttk.Entry(self.humidity_frame, width=15)
-        self.humidity_entry.insert(0, str(self.sensor_values["humidity"]["humidity"]))
-        self.humidity_entry.grid(row=12, column=1, padx=(5, 0), pady=2)
+        ttk.Label(frame, text=f"{spec.label} ({spec.unit}):").grid(row=12, column=0, sticky="w", pady=2)
+        entry = ttk.Entry(frame, width=15)
+        entry.insert(0, str(self.engine.sensor_values[sensor_type][sensor_type]))
+        entry.grid(row=12, column=1, padx=(5, 0), pady=2)
+        self.type_entries[sensor_type] = entry
         
         # 업데이트 버튼
-        update_btn = ttk.Button(self.humidity_frame, text="🔄 값 업데이트", command=self.update_humidity_values)
+        update_btn = ttk.Button(frame, text="🔄 값 업데이트", command=lambda: self.update_type_values(sensor_type))
         update_btn.grid(row=13, column=0, columnspan=2, pady=(10, 0))
         
-        parent.columnconfigure(2, weight=1)
+        parent.columnconfigure(column, weight=1)
         
     def create_control_frame(self, parent):
         """제어 버튼 프레임"""
@@ -326,13 +234,34 @@ class MqttDataGeneratorV2:
         self.status_label = ttk.Label(status_frame, text="❌ 연결 끊김", foreground="red")
         self.status_label.grid(row=0, column=0, sticky="w")
         
-        ttk.Label(status_frame, text="발행된 메시지:").grid(row=0, column=1, sticky="w", padx=(30, 0))
-        self.message_count_label = ttk.Label(status_frame, text="0", foreground="blue")
-        self.message_count_label.grid(row=0, column=2, sticky="w", padx=(5, 0))
+        # 발행 통계 (엔진 누적기를 STATS_REFRESH_INTERVAL_MS마다 읽어 표시)
+        stats_frame = ttk.Frame(status_frame)
+        stats_frame.grid(row=0, column=1, columnspan=2, sticky="w", padx=(30, 0))
+        self.stats_labels = {}
+        stats_fields = [
+            ("sent", "발행"), ("acked", "확인"), ("failed", "실패"),
+            ("msgs_per_sec", "msg/s"), ("bytes_per_sec", "bytes/s"), ("in_flight", "in-flight"),
+            ("dropped", "드롭")
+        ]
+        for i, (key, title) in enumerate(stats_fields):
+            ttk.Label(stats_frame, text=f"{title}:").grid(row=0, column=i * 2, sticky="w", padx=(0 if i == 0 else 15, 0))
+            label = ttk.Label(stats_frame, text="0", foreground="red" if key in ("failed", "dropped") else "blue",
+                              width=9)
+            label.grid(row=0, column=i * 2 + 1, sticky="w", padx=(5, 0))
+            self.stats_labels[key] = label
+
+        # 발행 → PUBACK 지연 백분위 (전체 센서/연결 합산)
+        latency_fields = [("p50", "지연 p50"), ("p95", "p95"), ("p99", "p99"), ("max", "max")]
+        for i, (key, title) in enumerate(latency_fields):
+            ttk.Label(stats_frame, text=f"{title}:").grid(row=1, column=i * 2, sticky="w",
+                                                          padx=(0 if i == 0 else 15, 0), pady=(3, 0))
+            label = ttk.Label(stats_frame, text="-", foreground="blue", width=9)
+            label.grid(row=1, column=i * 2 + 1, sticky="w", padx=(5, 0), pady=(3, 0))
+            self.stats_labels[f"latency_{key}"] = label
         
         # 현재 토픽 형식 표시
         ttk.Label(status_frame, text="토픽 형식:").grid(row=1, column=0, sticky="w", pady=(5, 0))
-        self.topic_format_label = ttk.Label(status_frame, text=f"{self.topic_prefix}/{{sensor_id}}/data", 
+        self.topic_format_label = ttk.Label(status_frame, text=f"{self.engine.topic_prefix}/{{sensor_id}}/data", 
                                           foreground="green", font=('Arial', 9, 'bold'))
         self.topic_format_label.grid(row=1, column=1, columnspan=2, sticky="w", padx=(5, 0), pady=(5, 0))
         
@@ -344,32 +273,32 @@ class MqttDataGeneratorV2:
         self.log_text = scrolledtext.ScrolledText(log_frame, height=12, width=120)
         self.log_text.grid(row=0, column=0, sticky="nsew")
         
-        ttk.Button(log_frame, text="🧹 로그 지우기", command=self.clear_log).grid(row=1, column=0, pady=(5, 0))
+        log_control_frame = ttk.Frame(log_frame)
+        log_control_frame.grid(row=1, column=0, pady=(5, 0))
+        
+        ttk.Button(log_control_frame, text="🧹 로그 지우기", command=self.clear_log).grid(row=0, column=0)
+        
+        # 메시지별 전송 로그 샘플링 (N건당 1건, 0: 초당 요약만)
+        ttk.Label(log_control_frame, text="전송 로그 1/N:").grid(row=0, column=1, padx=(20, 0))
+        self.log_sample_entry = ttk.Entry(log_control_frame, width=6)
+        self.log_sample_entry.insert(0, str(self.log_pipeline.sample_every))
+        self.log_sample_entry.grid(row=0, column=2, padx=(5, 0))
+        ttk.Button(log_control_frame, text="적용", command=self.apply_log_sampling).grid(row=0, column=3, padx=(5, 0))
+        
+        # 회전 파일 로그 (JSON 줄, logs/generator.log)
+        self.file_log_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(log_control_frame, text="파일 로그 (logs/generator.log)", variable=self.file_log_var,
+                        command=self.toggle_file_log).grid(row=0, column=4, padx=(20, 0))
         
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
         
-    def update_current_values(self):
-        """전류센서 값 업데이트"""
+    def update_type_values(self, sensor_type: str):
+        """센서 타입별 기준값 업데이트"""
+        spec = SENSOR_TYPES[sensor_type]
         try:
-            self.sensor_values["current"]["current"] = float(self.current_entry.get())
-            self.log("⚡ 전류센서 값이 업데이트되었습니다.")
-        except ValueError:
-            messagebox.showerror("오류", "올바른 숫자를 입력하세요.")
-            
-    def update_temperature_values(self):
-        """온도센서 값 업데이트"""
-        try:
-            self.sensor_values["temperature"]["temperature"] = float(self.temperature_entry.get())
-            self.log("🌡️ 온도센서 값이 업데이트되었습니다.")
-        except ValueError:
-            messagebox.showerror("오류", "올바른 숫자를 입력하세요.")
-            
-    def update_humidity_values(self):
-        """습도센서 값 업데이트"""
-        try:
-            self.sensor_values["humidity"]["humidity"] = float(self.humidity_entry.get())
-            self.log("💧 습도센서 값이 업데이트되었습니다.")
+            self.engine.set_base_value(sensor_type, float(self.type_entries[sensor_type].get()))
+            self.log(f"{spec.icon} {spec.label}센서 값이 업데이트되었습니다.")
         except ValueError:
             messagebox.showerror("오류", "올바른 숫자를 입력하세요.")
             
@@ -379,19 +308,13 @@ class MqttDataGeneratorV2:
             sensor_type = self.sensor_type_var.get()
             sensor_id = int(self.sensor_id_entry.get().strip())
             sensor_name = self.sensor_name_entry.get().strip()
+        except ValueError:
+            messagebox.showerror("오류", "센서 ID는 숫자여야 합니다.")
+            return
             
-            if not sensor_name:
-                messagebox.showerror("오류", "센서 이름을 입력하세요.")
-                return
-                
-            # 중복 ID 체크
-            for sensor in self.sensors[sensor_type]:
-                if sensor["id"] == sensor_id:
-                    messagebox.showerror("오류", f"센서 ID {sensor_id}는 이미 존재합니다.")
-                    return
-            
-            # 센서 추가
-            self.sensors[sensor_type].append({"id": sensor_id, "name": sensor_name})
+        try:
+            # 센서 추가 (이름 누락/중복 ID 검사는 엔진에서 수행)
+            self.engine.add_sensor(sensor_type, sensor_id, sensor_name)
             
             # 입력 필드 초기화
             self.sensor_id_entry.delete(0, tk.END)
@@ -403,148 +326,140 @@ class MqttDataGeneratorV2:
             
             self.log(f"✅ {sensor_type} 센서 추가됨: ID {sensor_id}, 이름 '{sensor_name}'")
             
-        except ValueError:
-            messagebox.showerror("오류", "센서 ID는 숫자여야 합니다.")
+        except ValueError as e:
+            messagebox.showerror("오류", str(e))
             
+    def import_sensors(self):
+        """CSV/JSON/YAML 센서 목록 일괄 가져오기 (검사 후 한 번에 추가, 화면은 끝에 한 번만 갱신)"""
+        path = filedialog.askopenfilename(
+            title="센서 목록 가져오기",
+            filetypes=[("센서 목록", "*.csv *.json *.yaml *.yml"), ("모든 파일", "*.*")]
+        )
+        if not path:
+            return
+        
+        try:
+            self.engine.import_fleet(path)
+        except (ValueError, OSError) as e:
+            messagebox.showerror("가져오기 오류", str(e))
+            return
+        
+        self.refresh_sensor_list()
+        self.refresh_sensor_frames()
+        
     def remove_sensor(self):
-        """선택된 센서 삭제"""
-        selection = self.sensor_listbox.curselection()
-        if not selection:
+        """선택된 센서 삭제 (여러 개 선택 가능, 스크롤로 가려진 선택 포함)"""
+        sensor_ids = self.sensor_browser.selected_sensor_ids()
+        if not sensor_ids:
             messagebox.showwarning("경고", "삭제할 센서를 선택하세요.")
             return
         
-        # 선택된 항목의 정보 파싱
-        selected_text = self.sensor_listbox.get(selection[0])
-        # 형식: "[전류] ID: 19, 이름: 전류센서TEST"
         try:
-            sensor_type_map = {"전류": "current", "온도": "temperature", "습도": "humidity"}
-            parts = selected_text.split("] ID: ")
-            sensor_type_kr = parts[0][1:]  # "[전류" -> "전류"
-            sensor_type = sensor_type_map[sensor_type_kr]
-            sensor_id = int(parts[1].split(",")[0])
-            
-            # 센서 삭제
-            self.sensors[sensor_type] = [s for s in self.sensors[sensor_type] if s["id"] != sensor_id]
-            
-            # 센서 목록 새로고침
-            self.refresh_sensor_list()
-            self.refresh_sensor_frames()
-            
-            self.log(f"🗑️ {sensor_type} 센서 삭제됨: ID {sensor_id}")
-            
-        except (IndexError, ValueError, KeyError):
+            for sensor_id in sensor_ids:
+                self.engine.remove_sensor(sensor_id)
+        except KeyError:
             messagebox.showerror("오류", "센서 삭제 중 오류가 발생했습니다.")
-            
-    def refresh_sensor_list(self):
-        """센서 목록 새로고침"""
-        self.sensor_listbox.delete(0, tk.END)
         
-        sensor_type_names = {"current": "전류", "temperature": "온도", "humidity": "습도"}
+        # 센서 목록 새로고침
+        self.refresh_sensor_list()
+        self.refresh_sensor_frames()
         
-        for sensor_type, sensors in self.sensors.items():
-            type_name = sensor_type_names[sensor_type]
-            for sensor in sensors:
-                item_text = f"[{type_name}] ID: {sensor['id']}, 이름: {sensor['name']}"
-                self.sensor_listbox.insert(tk.END, item_text)
+        shown = ", ".join(str(sensor_id) for sensor_id in sensor_ids[:10])
+        more = f" 외 {len(sensor_ids) - 10}개" if len(sensor_ids) > 10 else ""
+        self.log(f"🗑️ 센서 {len(sensor_ids)}개 삭제됨: ID {shown}{more}")
+            
+    def refresh_sensor_list(self):
+        """센서 목록 새로고침 (뷰 인덱스 재계산 + 보이는 행만 갱신)"""
+        self.sensor_browser.refresh()
                 
     def refresh_sensor_frames(self):
         """센서 프레임 새로고침"""
-        # 각 센서 프레임의 센서 목록 라벨 업데이트
-        # 이 부분은 센서 프레임이 이미 생성된 후에 호출되므로 UI 업데이트가 필요
-        # 간단히 로그로 알림만 표시
-        # 각 센서 프레임의 센서 목록 실시간 업데이트
-        self.update_current_sensor_list()
-        self.update_temperature_sensor_list()
-        self.update_humidity_sensor_list()
+        # 각 센서 프레임의 가상화 목록 갱신 (보이는 행만 다시 채움)
+        for browser in self.type_browsers.values():
+            browser.refresh()
         self.log("🔄 센서 목록이 업데이트되었습니다.")
         
-    def update_current_sensor_list(self):
-        """전류센서 목록 업데이트"""
-        # 기존 센서 목록 제거
-        for widget in self.current_sensor_list_frame.winfo_children():
-            widget.destroy()
-        
-        # 새로운 센서 목록 추가
-        ttk.Label(self.current_sensor_list_frame, text="📍 센서 목록:", font=("", 9, "bold")).grid(row=0, column=0, columnspan=2, sticky="w")
-        
-        if not self.sensors["current"]:
-            ttk.Label(self.current_sensor_list_frame, text="• 등록된 센서가 없습니다", foreground="gray").grid(
-                row=1, column=0, columnspan=2, sticky="w", padx=(10, 0))
-        else:
-            for i, sensor in enumerate(self.sensors["current"]):
-                ttk.Label(self.current_sensor_list_frame, text=f"• ID {sensor['id']}: {sensor['name']}", foreground="blue").grid(
-                    row=i+1, column=0, columnspan=2, sticky="w", padx=(10, 0))
-    
-    def update_temperature_sensor_list(self):
-        """온도센서 목록 업데이트"""
-        # 기존 센서 목록 제거
-        for widget in self.temperature_sensor_list_frame.winfo_children():
-            widget.destroy()
-        
-        # 새로운 센서 목록 추가
-        ttk.Label(self.temperature_sensor_list_frame, text="📍 센서 목록:", font=("", 9, "bold")).grid(row=0, column=0, columnspan=2, sticky="w")
-        
-        if not self.sensors["temperature"]:
-            ttk.Label(self.temperature_sensor_list_frame, text="• 등록된 센서가 없습니다", foreground="gray").grid(
-                row=1, column=0, columnspan=2, sticky="w", padx=(10, 0))
-        else:
-            for i, sensor in enumerate(self.sensors["temperature"]):
-                ttk.Label(self.temperature_sensor_list_frame, text=f"• ID {sensor['id']}: {sensor['name']}", foreground="orange").grid(
-                    row=i+1, column=0, columnspan=2, sticky="w", padx=(10, 0))
-    
-    def update_humidity_sensor_list(self):
-        """습도센서 목록 업데이트"""
-        # 기존 센서 목록 제거
-        for widget in self.humidity_sensor_list_frame.winfo_children():
-            widget.destroy()
-        
-        # 새로운 센서 목록 추가
-        ttk.Label(self.humidity_sensor_list_frame, text="📍 센서 목록:", font=("", 9, "bold")).grid(row=0, column=0, columnspan=2, sticky="w")
-        
-        if not self.sensors["humidity"]:
-            ttk.Label(self.humidity_sensor_list_frame, text="• 등록된 센서가 없습니다", foreground="gray").grid(
-                row=1, column=0, columnspan=2, sticky="w", padx=(10, 0))
-        else:
-            for i, sensor in enumerate(self.sensors["humidity"]):
-                ttk.Label(self.humidity_sensor_list_frame, text=f"• ID {sensor['id']}: {sensor['name']}", foreground="cyan").grid(
-                    row=i+1, column=0, columnspan=2, sticky="w", padx=(10, 0))
-        
     def log(self, message: str):
-        """로그 메시지 출력"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_message)
-        self.log_text.see(tk.END)
-        print(log_message.strip())
+        """로그 메시지 출력 (어느 스레드에서든 호출 가능, 표시는 drain_log에서)"""
+        self.log_pipeline.log(message)
+        
+    def drain_log(self):
+        """Tk 스레드에서 로그 큐를 배치로 비워 표시 (최대 ring_size 줄 유지)"""
+        lines = self.log_pipeline.drain()
+        if lines:
+            text = "\n".join(lines)
+            self.log_text.insert(tk.END, text + "\n")
+            
+            # 링 크기를 넘는 오래된 줄 삭제
+            line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+            excess = line_count - self.log_pipeline.ring_size
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.log_text.see(tk.END)
+            print(text)
+        
+        # 밀린 레코드가 있으면 바로 다음 배치 처리
+        delay = 1 if self.log_pipeline.pending() else LOG_DRAIN_INTERVAL_MS
+        self.root.after(delay, self.drain_log)
         
     def clear_log(self):
         """로그 지우기"""
         self.log_text.delete(1.0, tk.END)
+        self.log_pipeline.clear()
+        
+    def apply_log_sampling(self):
+        """전송 로그 샘플링 간격 적용"""
+        try:
+            sample_every = int(self.log_sample_entry.get())
+            self.log_pipeline.set_sample_every(sample_every)
+            if sample_every:
+                self.log(f"📝 전송 로그: {sample_every}건당 1건 표시")
+            else:
+                self.log("📝 전송 로그: 초당 요약만 표시")
+        except ValueError:
+            messagebox.showerror("오류", "샘플링 간격은 0 이상의 정수여야 합니다.")
+            
+    def toggle_file_log(self):
+        """회전 파일 로그 켜기/끄기"""
+        if self.file_log_var.get():
+            try:
+                self.log_pipeline.open_file("logs/generator.log")
+                self.log("📁 파일 로그 시작: logs/generator.log")
+            except OSError as e:
+                self.file_log_var.set(False)
+                messagebox.showerror("오류", f"파일 로그를 열 수 없습니다: {str(e)}")
+        else:
+            self.log("📁 파일 로그 종료")
+            self.log_pipeline.close_file()
+            
+    def on_close(self):
+        """창 닫기: 연결 정리 후 파일 로그 마감"""
+        if self.engine.is_connected or self.engine.is_running:
+            self.engine.disconnect()
+        self.log_pipeline.close()
+        self.root.destroy()
         
     def apply_topic_prefix(self):
         """토픽 프리픽스 적용"""
         try:
             new_prefix = self.topic_prefix_entry.get().strip()
-            if not new_prefix:
-                messagebox.showerror("오류", "토픽 프리픽스를 입력하세요.")
-                return
+            old_prefix = self.engine.topic_prefix
             
-            # 영문자와 숫자만 허용 (보안 강화)
-            if not new_prefix.replace('_', '').isalnum():
-                messagebox.showerror("오류", "토픽 프리픽스는 영문자, 숫자, 언더스코어(_)만 사용 가능합니다.")
+            # 입력 검증은 엔진에서 수행 (영문자, 숫자, 언더스코어만 허용)
+            try:
+                self.engine.set_topic_prefix(new_prefix)
+            except ValueError as e:
+                messagebox.showerror("오류", str(e))
                 return
             
-            old_prefix = self.topic_prefix
-            self.topic_prefix = new_prefix
-            
             # 상태 표시 업데이트
-            self.topic_format_label.config(text=f"{self.topic_prefix}/{{sensor_id}}/data")
+            self.topic_format_label.config(text=f"{self.engine.topic_prefix}/{{sensor_id}}/data")
             
             self.log(f"🔄 토픽 프리픽스 변경: {old_prefix} → {new_prefix}")
             self.log(f"📝 새로운 토픽 형식: {new_prefix}/{{sensor_id}}/data")
             
             # 현재 상태에 따른 안내 메시지
-            if self.is_connected:
+            if self.engine.is_connected:
                 self.log("ℹ️  토픽 프리픽스가 변경되었습니다. 새로운 데이터는 변경된 토픽으로 전송됩니다.")
             else:
                 self.log("ℹ️  토픽 프리픽스가 설정되었습니다. MQTT 연결 후 이 설정이 적용됩니다.")
@@ -571,227 +486,105 @@ class MqttDataGeneratorV2:
     def connect_mqtt(self):
         """MQTT 브로커에 연결"""
         try:
-            broker = self.broker_entry.get().strip()
-            port = int(self.port_entry.get().strip())
-            client_id = self.client_id_entry.get().strip()
-            
-            if not broker or not client_id:
-                messagebox.showerror("오류", "브로커 주소와 클라이언트 ID를 입력하세요.")
-                return
-            
-            # paho-mqtt 버전에 따라 Client 생성 방식 분기 (v2.x: CallbackAPIVersion, v1.x: 없음)
-            try:
-                _ = mqtt.CallbackAPIVersion  # 존재 확인
-                self.mqtt_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
-            except AttributeError:
-                # paho-mqtt 1.x 호환
-                self.mqtt_client = mqtt.Client(client_id)
-            self.mqtt_client.on_connect = self.on_connect
-            self.mqtt_client.on_disconnect = self.on_disconnect
-            self.mqtt_client.on_publish = self.on_publish
+            self.engine.broker = self.broker_entry.get().strip()
+            self.engine.port = int(self.port_entry.get().strip())
+            self.engine.client_id = self.client_id_entry.get().strip()
             
-            self.log(f"🔗 MQTT 브로커 연결 시도: {broker}:{port}")
-            self.mqtt_client.connect(broker, port, 60)
-            self.mqtt_client.loop_start()
+            self.engine.connect()
             
         except Exception as e:
             self.log(f"❌ MQTT 연결 오류: {str(e)}")
             messagebox.showerror("연결 오류", f"MQTT 브로커 연결에 실패했습니다: {str(e)}")
             
     def disconnect_mqtt(self):
-        """MQTT 브로커 연결 해제"""
-        if self.mqtt_client:
+        """MQTT 브로커 연결 해제 (연결 풀이면 mqtt_client가 없으므로 엔진에 맡김)"""
+        if self.engine.is_running:
             self.stop_generation()
-            self.mqtt_client.loop_stop()
-            self.mqtt_client.disconnect()
+        self.engine.disconnect()
             
-    def on_connect(self, client, userdata, flags, reason_code=None, properties=None):
-        """MQTT 연결 성공 콜백 (paho-mqtt v2 API)"""
-        # reason_code는 MQTT v5에서는 ReasonCode 객체(속성 is_failure/ value), v3에서는 int일 수 있음
-        if hasattr(reason_code, "is_failure"):
-            failed = bool(getattr(reason_code, "is_failure"))
-        else:
-            failed = int(getattr(reason_code, "value", 0 if reason_code is None else reason_code)) != 0
+    def on_connection_change(self, connected: bool):
+        """엔진 연결 상태 변경 콜백 (paho/연결 풀 스레드에서 호출되므로 상태만 기록)
+
+        Tk 위젯은 Tk 스레드에서만 건드린다. root.after로 넘기면 연결 해제 중 Tk 스레드가
+        네트워크 스레드 종료를 기다리는 동안 서로 기다릴 수 있어, refresh_stats가 주기적으로 반영한다.
+        """
+        self.connection_state = connected
 
-        if not failed:
-            self.is_connected = True
+    def show_connection_state(self, connected: bool):
+        """연결 상태 표시와 버튼 활성화 갱신 (Tk 스레드)"""
+        self.shown_connection_state = connected
+        if connected:
             self.status_label.config(text="✅ 연결됨", foreground="green")
             self.connect_btn.config(state=tk.DISABLED)
             self.disconnect_btn.config(state=tk.NORMAL)
             self.start_btn.config(state=tk.NORMAL)
-            self.log("✅ MQTT 브로커에 연결되었습니다.")
         else:
-            self.log(f"❌ MQTT 연결 실패: {reason_code}")
-            
-    def on_disconnect(self, client, userdata, flags=None, reason_code=None, properties=None):
-        """MQTT 연결 해제 콜백 (paho-mqtt v2 API)"""
-        self.is_connected = False
-        self.status_label.config(text="❌ 연결 끊김", foreground="red")
-        self.connect_btn.config(state=tk.NORMAL)
-        self.disconnect_btn.config(state=tk.DISABLED)
-        self.start_btn.config(state=tk.DISABLED)
-        self.stop_btn.config(state=tk.DISABLED)
-        self.log("❌ MQTT 브로커 연결이 해제되었습니다.")
+            self.status_label.config(text="❌ 연결 끊김", foreground="red")
+            self.connect_btn.config(state=tk.NORMAL)
+            self.disconnect_btn.config(state=tk.DISABLED)
+            self.start_btn.config(state=tk.DISABLED)
+            self.stop_btn.config(state=tk.DISABLED)
+            
+    def refresh_stats(self):
+        """발행 통계 패널과 연결 상태 갱신 (Tk 스레드에서 4Hz)"""
+        connected = self.connection_state
+        if connected != self.shown_connection_state:
+            self.show_connection_state(connected)
+        sample = self.engine.stats.sample()
+        values = {
+            "sent": f"{sample['sent']:,}",
+            "acked": f"{sample['acked']:,}",
+            "failed": f"{sample['failed']:,}",
+            "msgs_per_sec": f"{sample['msgs_per_sec']:,.0f}",
+            "bytes_per_sec": format_bytes(sample["bytes_per_sec"]),
+            "in_flight": f"{sample['in_flight']:,}",
+            "dropped": f"{self.engine.in_flight_window.dropped if self.engine.in_flight_window else 0:,}"
+        }
+        latency = self.engine.latency.combined().summary()
+        for key in ("p50", "p95", "p99", "max"):
+            values[f"latency_{key}"] = f"{latency[key]:.1f}ms" if latency["count"] else "-"
+        for key, text in values.items():
+            self.stats_labels[key].config(text=text)
         
-    def on_publish(self, client, userdata, mid, reason_codes=None, properties=None):
-        """메시지 발행 완료 콜백 (paho-mqtt v2 API)"""
-        self.message_count += 1
-        self.message_count_label.config(text=str(self.message_count))
+        # 센서 목록의 보이는 행 마지막 값 갱신 (센서 구성이 바뀌었으면 뷰 재계산)
+        for browser in (self.sensor_browser, *self.type_browsers.values()):
+            browser.update_values()
+        self.root.after(STATS_REFRESH_INTERVAL_MS, self.refresh_stats)
         
     def start_generation(self):
         """데이터 생성 시작"""
-        if not self.is_connected:
+        if not self.engine.is_connected:
             messagebox.showerror("오류", "먼저 MQTT 브로커에 연결하세요.")
             return
             
-        self.is_running = True
+        try:
+            self.engine.interval = float(self.interval_entry.get())
+        except ValueError:
+            self.engine.interval = 2.0
+            
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
-        
-        self.generator_thread = threading.Thread(target=self.generate_data_loop, daemon=True)
-        self.generator_thread.start()
-        
-        self.log("▶️ 데이터 생성을 시작합니다.")
+        self.engine.start()
         
     def stop_generation(self):
         """데이터 생성 중지"""
-        self.is_running = False
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
-        self.log("⏹️ 데이터 생성을 중지합니다.")
+        self.engine.stop()
         
-    def generate_data_loop(self):
-        """데이터 생성 루프"""
-        try:
-            interval = float(self.interval_entry.get())
-        except ValueError:
-            interval = 2.0
-            
-        while self.is_running:
-            try:
-                self.send_all_sensor_data()
-                time.sleep(interval)
-            except Exception as e:
-                self.log(f"❌ 데이터 생성 중 오류: {str(e)}")
-                time.sleep(1)
-                
     def send_single_data(self):
         """단발 데이터 전송"""
-        if not self.is_connected:
+        if not self.engine.is_connected:
             messagebox.showerror("오류", "먼저 MQTT 브로커에 연결하세요.")
             return
-        self.send_all_sensor_data()
-        
-    def send_all_sensor_data(self):
-        """모든 센서 데이터 전송"""
-        if not self.mqtt_client:
-            return
-            
-        # 전류센서 데이터 전송
-        for sensor in self.sensors["current"]:
-            data = self.create_current_sensor_data(sensor)
-            topic = f"{self.topic_prefix}/{sensor['id']}/data"
-            payload = json.dumps(data, ensure_ascii=False)
-            self.mqtt_client.publish(topic, payload, qos=1)
-            self.log(f"⚡ 전송: {topic} -> {sensor['name']} (전류: {data['current']}A)")
-            
-        # 온도센서 데이터 전송
-        for sensor in self.sensors["temperature"]:
-            data = self.create_temperature_sensor_data(sensor)
-            topic = f"{self.topic_prefix}/{sensor['id']}/data"
-            payload = json.dumps(data, ensure_ascii=False)
-            self.mqtt_client.publish(topic, payload, qos=1)
-            self.log(f"🌡️ 전송: {topic} -> {sensor['name']} (온도: {data['temperature']}°C)")
-            
-        # 습도센서 데이터 전송
-        for sensor in self.sensors["humidity"]:
-            data = self.create_humidity_sensor_data(sensor)
-            topic = f"{self.topic_prefix}/{sensor['id']}/data"
-            payload = json.dumps(data, ensure_ascii=False)
-            self.mqtt_client.publish(topic, payload, qos=1)
-            self.log(f"💧 전송: {topic} -> {sensor['name']} (습도: {data['humidity']}%)")
-            
-    def create_current_sensor_data(self, sensor: Dict[str, Any]) -> Dict[str, Any]:
-        """전류센서 데이터 생성"""
-        # 실제와 유사한 변동값 생성
-        current_value = self.generate_realistic_value("current", "current")
-        
-        return {
-            "sensor_id": sensor["id"],
-            "sensor_type": 1,
-            "sensor_name": sensor["name"],
-            "timestamp": datetime.datetime.now().isoformat(),
-            "is_connected": True,
-            "status": "normal",
-            "current": round(current_value, 2),
-            "value": round(current_value, 2),
-            "unit": "A"
-        }
-        
-    def create_temperature_sensor_data(self, sensor: Dict[str, Any]) -> Dict[str, Any]:
-        """온도센서 데이터 생성"""
-        # 실제와 유사한 변동값 생성
-        temperature_value = self.generate_realistic_value("temperature", "temperature")
-        
-        return {
-            "sensor_id": sensor["id"],
-            "sensor_type": 2,
-            "sensor_name": sensor["name"],
-            "timestamp": datetime.datetime.now().isoformat(),
-            "is_connected": True,
-            "status": "normal",
-            "temperature": round(temperature_value, 1),
-            "value": round(temperature_value, 1),
-            "unit": "°C"
-        }
-        
-    def create_humidity_sensor_data(self, sensor: Dict[str, Any]) -> Dict[str, Any]:
-        """습도센서 데이터 생성"""
-        # 실제와 유사한 변동값 생성
-        humidity_value = self.generate_realistic_value("humidity", "humidity")
-        
-        return {
-            "sensor_id": sensor["id"],
-            "sensor_type": 3,
-            "sensor_name": sensor["name"],
-            "timestamp": datetime.datetime.now().isoformat(),
-            "is_connected": True,
-            "status": "normal",
-            "humidity": round(humidity_value, 1),
-            "value": round(humidity_value, 1),
-            "unit": "%"
-        }
-        
-    def generate_realistic_value(self, sensor_type: str, value_key: str) -> float:
-        """실제와 유사한 센서 값 생성"""
-        base_value = self.sensor_values[sensor_type][value_key]
-        variation_config = self.sensor_variations[sensor_type]
-        
-        # 트렌드 변화 확률 체크
-        if random.random() < variation_config["trend_probability"]:
-            # 새로운 트렌드 설정 (-1: 하강, 0: 유지, 1: 상승)
-            self.sensor_trends[sensor_type] = random.choice([-0.3, -0.1, 0.0, 0.1, 0.3])
-        
-        # 기본 랜덤 변동 (-range ~ +range)
-        random_variation = random.uniform(-variation_config["range"], variation_config["range"])
-        
-        # 트렌드 적용 (작은 값으로 지속적인 변화)
-        trend_variation = self.sensor_trends[sensor_type] * variation_config["range"] * 0.1
-        
-        # 최종 값 계산
-        new_value = base_value + random_variation + trend_variation
-        
-        # 센서별 합리적인 범위 제한
-        if sensor_type == "current":
-            new_value = max(0.0, min(999.0, new_value))  # 0~999A
-        elif sensor_type == "temperature":
-            new_value = max(-50.0, min(300.0, new_value))  # -50~300°C
-        elif sensor_type == "humidity":
-            new_value = max(0.0, min(100.0, new_value))  # 0~100% (습도는 물리적 한계)
-        
-        return new_value
+        self.engine.send_all_sensor_data()
 
-if __name__ == "__main__":
+def main():
+    startup_profile.mark("모듈 import")
     root = tk.Tk()
+    startup_profile.mark("Tk 초기화")
     app = MqttDataGeneratorV2(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import struct
+from typing import Dict, Optional, Sequence, Tuple
+
+from payload_encoder import PayloadEncoder, STATUS_NORMAL
+
+# (ISO 8601 문자열 bytes, epoch 밀리초)
+Timestamp = Tuple[bytes, int]
+
+CODEC_NAMES = ("json", "msgpack", "cbor", "struct")
+
+# struct 코덱이 담을 수 있는 센서 ID 최대값 (uint32)
+STRUCT_MAX_SENSOR_ID = 0xFFFFFFFF
+
+# 코덱 태그 방식: 없음 / 토픽 접미사 (.../data/msgpack) / MQTT v5 content-type 속성
+CODEC_TAG_MODES = ("none", "suffix", "content-type")
+
+
+def make_timestamp(moment: datetime.datetime) -> Timestamp:
+    """JSON용 ISO 문자열과 바이너리용 epoch 밀리초를 함께 계산 (틱당 한 번)"""
+    return moment.isoformat().encode("ascii"), int(moment.timestamp() * 1000)
+
+
+class JsonCodec:
+    """기존 JSON 페이로드 (미리 인코딩한 템플릿, json.dumps와 바이트 동일, 부가 필드는 JSON만 실음)"""
+
+    name = "json"
+    content_type = "application/json"
+
+    def __init__(self, encoder: PayloadEncoder):
+        self.encoder = encoder
+
+    def encode(self, sensor_id: int, type_code: int, head: bytes, value: float, timestamp: Timestamp,
+               status: int = STATUS_NORMAL, aux: Optional[Sequence[float]] = None) -> bytes:
+        if aux is None:
+            return self.encoder.encode(head, type_code, value, timestamp[0], status)
+        return self.encoder.encode_aux(head, type_code, value, aux, timestamp[0], status)
+
+
+class MsgpackCodec:
+    """MessagePack 맵 {"i": 센서 ID, "t": 타입, "s": 상태, "ts": epoch ms, "v": 값}
+
+    정수는 고정 폭(int64/uint8/uint8/int64), 값은 float64로 인코딩해 한 번의 struct.pack으로 만든다.
+    (최소 길이 인코딩은 아니지만 표준 MessagePack 디코더로 그대로 읽힌다, 상태는 0: 정상, 1: 오프라인)
+    """
+
+    name = "msgpack"
+    content_type = "application/msgpack"
+
+    # fixmap(5), "i" int64, "t" uint8, "s" uint8, "ts" int64, "v" float64 (빅엔디언)
+    layout = struct.Struct(">4sq3sB3sB4sq3sd")
+
+    def encode(self, sensor_id: int, type_code: int, head: bytes, value: float, timestamp: Timestamp,
+               status: int = STATUS_NORMAL, aux: Optional[Sequence[float]] = None) -> bytes:
+        return self.layout.pack(b"\x85\xa1i\xd3", sensor_id, b"\xa1t\xcc", type_code, b"\xa1s\xcc", status,
+                                b"\xa2ts\xd3", timestamp[1], b"\xa1v\xcb", value)
+
+
+def _cbor_int_head(value: int) -> Tuple[int, int]:
+    """CBOR 64비트 정수 (머리 바이트, 크기): 0 이상은 major 0, 음수는 major 1에 -1 - 값"""
+    if value >= 0:
+        return 0x1b, value
+    return 0x3b, -1 - value
+
+
+class CborCodec:
+    """CBOR 맵 {"i": 센서 ID, "t": 타입, "s": 상태, "ts": epoch ms, "v": 값} (MessagePack과 같은 고정 폭 방식)
+
+    CBOR에는 부호 있는 고정 폭 정수가 없으므로 센서 ID/타임스탬프는 부호에 따라 머리 바이트만 바꾼다.
+    """
+
+    name = "cbor"
+    content_type = "application/cbor"
+
+    # map(5), "i" 64비트 정수, "t" uint8, "s" 0~23 직접 값, "ts" 64비트 정수, "v" float64 (빅엔디언)
+    layout = struct.Struct(">3sBQ3sB2sB3sBQ3sd")
+
+    def encode(self, sensor_id: int, type_code: int, head: bytes, value: float, timestamp: Timestamp,
+               status: int = STATUS_NORMAL, aux: Optional[Sequence[float]] = None) -> bytes:
+        id_head, id_value = _cbor_int_head(sensor_id)
+        ts_head, ts_value = _cbor_int_head(timestamp[1])
+        return self.layout.pack(b"\xa5\x61i", id_head, id_value, b"\x61t\x18", type_code, b"\x61s", status,
+                                b"\x62ts", ts_head, ts_value, b"\x61v\xfb", value)
+
+
+class StructCodec:
+    """고정 17바이트 리틀엔디언 레코드
+
+    uint32 센서 ID | uint8 (상태 << 7 | 센서 타입) | int64 epoch ms | float32 값
+    센서 타입 코드는 1~127이므로 최상위 비트에 상태(0: 정상, 1: 오프라인)를 싣는다.
+    센서 ID는 0 ~ STRUCT_MAX_SENSOR_ID만 담을 수 있어 엔진이 센서 등록/코덱 지정 시 검사한다.
+    """
+
+    name = "struct"
+    content_type = "application/vnd.hdms.sensor-le17"
+
+    layout = struct.Struct("<IBqf")
+
+    def encode(self, sensor_id: int, type_code: int, head: bytes, value: float, timestamp: Timestamp,
+               status: int = STATUS_NORMAL, aux: Optional[Sequence[float]] = None) -> bytes:
+        return self.layout.pack(sensor_id, status << 7 | type_code, timestamp[1], value)
+
+
+def create_codecs(encoder: PayloadEncoder) -> Dict[str, object]:
+    """코덱 이름 → 코덱 인스턴스"""
+    return {
+        "json": JsonCodec(encoder),
+        "msgpack": MsgpackCodec(),
+        "cbor": CborCodec(),
+        "struct": StructCodec()
+    }
+
+
+class CodecSelector:
+    """토픽 프리픽스별 코덱 선택 ({"HS": "json", "BHS": "struct", "*": 기본})
+
+    엔진은 틱(배치)마다 한 번 조회하며, content-type 속성 객체는 코덱별로 한 번만 만든다.
+    """
+
+    def __init__(self, encoder: PayloadEncoder, rules: Optional[Dict[str, str]] = None, tag_mode: str = "none"):
+        self.codecs = create_codecs(encoder)
+        self.rules: Dict[str, str] = {}
+        self.tag_mode = "none"
+        self._properties: Dict[str, object] = {}
+        self.set_rules(rules or {})
+        self.set_tag_mode(tag_mode)
+
+    def set_rules(self, rules: Dict[str, str]):
+        for prefix, codec_name in rules.items():
+            if codec_name not in self.codecs:
+                raise ValueError(f"알 수 없는 페이로드 코덱입니다: {codec_name} (사용 가능: {', '.join(CODEC_NAMES)})")
+        self.rules = dict(rules)
+
+    def set_tag_mode(self, tag_mode: str):
+        if tag_mode not in CODEC_TAG_MODES:
+            raise ValueError(f"알 수 없는 코덱 태그 방식입니다: {tag_mode} (사용 가능: {', '.join(CODEC_TAG_MODES)})")
+        self.tag_mode = tag_mode
+
+    def uses(self, codec_name: str) -> bool:
+        """프리픽스 규칙 중 하나라도 해당 코덱을 쓰는지 (토픽 프리픽스는 실행 중 바뀔 수 있으므로 규칙 전체 기준)"""
+        return codec_name in self.rules.values()
+
+    def codec_for(self, topic_prefix: str):
+        """프리픽스에 해당하는 코덱 (없으면 "*" 규칙, 그것도 없으면 JSON)"""
+        return self.codecs[self.rules.get(topic_prefix, self.rules.get("*", "json"))]
+
+    def topic_suffix(self, codec) -> str:
+        """토픽 접미사 태그 (JSON은 기존 토픽 유지)"""
+        if self.tag_mode == "suffix" and codec.name != "json":
+            return f"/{codec.name}"
+        return ""
+
+    def publish_properties(self, codec):
+        """MQTT v5 PUBLISH content-type 속성 (태그 방식이 content-type일 때만)"""
+        if self.tag_mode != "content-type":
+            return None
+        properties = self._properties.get(codec.name)
+        if properties is None:
+            from paho.mqtt.packettypes import PacketTypes
+            from paho.mqtt.properties import Properties
+
+            properties = Properties(PacketTypes.PUBLISH)
+            properties.ContentType = codec.content_type
+            self._properties[codec.name] = properties
+        return properties
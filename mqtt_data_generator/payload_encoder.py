@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import math
+from typing import Dict, Optional, Sequence, Tuple
+
+# 센서 타입 코드 → (값 필드명, 소수 자릿수, 단위) (센서 타입 표에서 유도)
+from sensor_types import PAYLOAD_FIELDS, SENSOR_TYPES_BY_CODE
+
+# 센서 상태 코드 → (is_connected, status) 페이로드 표기
+STATUS_NORMAL = 0
+STATUS_OFFLINE = 1
+SENSOR_STATUSES: Dict[int, Tuple[bool, str]] = {
+    STATUS_NORMAL: (True, "normal"),
+    STATUS_OFFLINE: (False, "offline")
+}
+
+
+def format_value(value: float) -> str:
+    """json.dumps와 같은 float 표기 (유한값은 repr, 그 외 NaN/Infinity)"""
+    if math.isfinite(value):
+        return float.__repr__(value)
+    return json.dumps(value)
+
+
+class PayloadEncoder:
+    """센서 페이로드를 미리 만든 UTF-8 조각으로 조립하는 인코더
+
+    json.dumps(..., ensure_ascii=False)와 바이트 단위로 같은 결과를 낸다:
+      {"sensor_id": ..., "sensor_type": ..., "sensor_name": "...", "timestamp": "<ts>",
+       "is_connected": true, "status": "normal", "<field>": <v>, "value": <v>, "unit": "..."}
+    (장애 주입의 offline 상태는 "is_connected": false, "status": "offline")
+
+    센서별 앞부분(sensor_id ~ "timestamp": ")은 센서 등록 시 render_head()로 한 번 만들고,
+    타입별 중간/끝 조각은 센서 타입 표에서 한 번 만든다. 틱마다 값과 타임스탬프만 끼워 넣는다.
+    부가 필드(encode_aux)는 주 값 필드 뒤, value 앞에 ADC → 부가 필드 순으로 들어간다 (v1 페이로드 순서).
+    """
+
+    def __init__(self):
+        # 타입 코드 → (자릿수, 상태 코드별 타임스탬프 뒤 조각, value 필드 조각, 끝 조각)
+        self.type_parts: Dict[int, Tuple[int, Tuple[bytes, ...], bytes, bytes]] = {}
+        # 타입 코드 → 부가 필드별 (', "필드": ' 조각, 자릿수 (None이면 정수 ADC))
+        self.aux_parts: Dict[int, Tuple[Tuple[bytes, Optional[int]], ...]] = {}
+        self.compile()
+
+    def compile(self):
+        """센서 타입 표 → 타입별 조각 (센서 타입이 추가되면 다시 호출)"""
+        for type_code, (field, digits, unit) in PAYLOAD_FIELDS.items():
+            middles = tuple(
+                f'", "is_connected": {json.dumps(connected)}, "status": {json.dumps(status)}, {json.dumps(field)}: '.encode("utf-8")
+                for connected, status in (SENSOR_STATUSES[code] for code in sorted(SENSOR_STATUSES))
+            )
+            tail = f', "unit": {json.dumps(unit, ensure_ascii=False)}}}'
+            self.type_parts[type_code] = (digits, middles, b', "value": ', tail.encode("utf-8"))
+
+            sensor_type = SENSOR_TYPES_BY_CODE[type_code]
+            aux = [(sensor_type.adc.name, None)] if sensor_type.adc else []
+            aux += [(aux_field.name, aux_field.digits) for aux_field in sensor_type.aux_fields]
+            self.aux_parts[type_code] = tuple(
+                (f', {json.dumps(name, ensure_ascii=False)}: '.encode("utf-8"), aux_digits) for name, aux_digits in aux
+            )
+
+    @staticmethod
+    def render_head(sensor_id: int, type_code: int, name: str) -> bytes:
+        """센서별 고정 앞부분 (이름 이스케이프는 json.dumps에 맡김)"""
+        head = json.dumps({
+            "sensor_id": sensor_id,
+            "sensor_type": type_code,
+            "sensor_name": name,
+            "timestamp": ""
+        }, ensure_ascii=False)
+        # 끝의 '"}'를 떼어 타임스탬프 문자열이 이어지도록 함
+        return head[:-2].encode("utf-8")
+
+    def round_value(self, type_code: int, value: float) -> float:
+        """타입별 자릿수로 반올림 (페이로드/로그 문구 공용)"""
+        return round(value, self.type_parts[type_code][0])
+
+    def encode(self, head: bytes, type_code: int, value: float, timestamp: bytes, status: int = STATUS_NORMAL) -> bytes:
+        """반올림된 값과 ASCII 타임스탬프로 페이로드 조립"""
+        _, middles, value_sep, tail = self.type_parts[type_code]
+        text = format_value(value).encode("ascii")
+        return b"".join((head, timestamp, middles[status], text, value_sep, text, tail))
+
+    def encode_aux(self, head: bytes, type_code: int, value: float, aux: Sequence[float], timestamp: bytes,
+                   status: int = STATUS_NORMAL) -> bytes:
+        """encode + 부가 필드 (aux: 타입의 ADC/부가 필드 순서대로 반올림 전 값, 남는 칸은 무시)"""
+        _, middles, value_sep, tail = self.type_parts[type_code]
+        text = format_value(value).encode("ascii")
+        parts = [head, timestamp, middles[status], text]
+        for (key, digits), aux_value in zip(self.aux_parts[type_code], aux):
+            parts.append(key)
+            if digits is None:
+                parts.append(str(int(aux_value)).encode("ascii"))
+            else:
+                parts.append(format_value(round(aux_value, digits)).encode("ascii"))
+        parts += (value_sep, text, tail)
+        return b"".join(parts)
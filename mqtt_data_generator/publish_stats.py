@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from typing import Dict, Any, List
+
+
+class StatsAccumulator:
+    """스레드 하나가 단독으로 갱신하는 발행 카운터 (잠금 없음)"""
+
+    __slots__ = ("sent", "acked", "failed", "bytes")
+
+    def __init__(self):
+        self.sent = 0      # publish 호출 수
+        self.acked = 0     # 브로커 확인(PUBACK) 수
+        self.failed = 0    # publish 호출 실패 수 (연결 없음, 큐 가득 참 등)
+        self.bytes = 0     # 발행한 페이로드 바이트 수
+
+
+class PublishStats:
+    """스레드별 누적기를 합산하는 발행 통계
+
+    생성 스레드, paho 네트워크 스레드, 연결 풀 루프 스레드가 각자 자기 누적기만 갱신하므로
+    메시지마다 잠금이나 GUI 호출이 없다. 읽는 쪽(GUI 4Hz 타이머 등)은 sample()로 합산한다.
+    정수 읽기는 원자적이므로 합산 값은 최대 한 건 정도 늦을 수 있을 뿐 깨지지 않는다.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._accumulators: List[StatsAccumulator] = []
+        self._register_lock = threading.Lock()
+
+        # 발행률 계산용 직전 표본
+        self._last_sent = 0
+        self._last_bytes = 0
+        self._last_time = time.monotonic()
+
+    def accumulator(self) -> StatsAccumulator:
+        """호출한 스레드의 누적기 (처음 호출 시 한 번만 등록)"""
+        try:
+            return self._local.accumulator
+        except AttributeError:
+            accumulator = StatsAccumulator()
+            with self._register_lock:
+                self._accumulators.append(accumulator)
+            self._local.accumulator = accumulator
+            return accumulator
+
+    def add_sent(self, count: int, byte_count: int):
+        accumulator = self.accumulator()
+        accumulator.sent += count
+        accumulator.bytes += byte_count
+
+    def add_acked(self, count: int = 1):
+        self.accumulator().acked += count
+
+    def add_failed(self, count: int = 1):
+        self.accumulator().failed += count
+
+    def totals(self) -> Dict[str, int]:
+        """모든 스레드 누적기 합계"""
+        with self._register_lock:
+            accumulators = list(self._accumulators)
+        totals = {"sent": 0, "acked": 0, "failed": 0, "bytes": 0}
+        for accumulator in accumulators:
+            totals["sent"] += accumulator.sent
+            totals["acked"] += accumulator.acked
+            totals["failed"] += accumulator.failed
+            totals["bytes"] += accumulator.bytes
+        # QoS1 미확인 메시지 (발행했지만 아직 PUBACK 없음)
+        totals["in_flight"] = max(0, totals["sent"] - totals["acked"] - totals["failed"])
+        return totals
+
+    def sample(self) -> Dict[str, Any]:
+        """합계 + 직전 sample() 이후 msg/s, bytes/s"""
+        totals: Dict[str, Any] = self.totals()
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        if elapsed > 0:
+            totals["msgs_per_sec"] = (totals["sent"] - self._last_sent) / elapsed
+            totals["bytes_per_sec"] = (totals["bytes"] - self._last_bytes) / elapsed
+        else:
+            totals["msgs_per_sec"] = totals["bytes_per_sec"] = 0.0
+        self._last_sent = totals["sent"]
+        self._last_bytes = totals["bytes"]
+        self._last_time = now
+        return totals
+
+
+def format_bytes(byte_count: float) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    for unit in ("B", "KB", "MB"):
+        if byte_count < 1024:
+            return f"{byte_count:.0f}{unit}" if unit == "B" else f"{byte_count:.1f}{unit}"
+        byte_count /= 1024
+    return f"{byte_count:.1f}GB"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Union
+
+import numpy as np
+
+# 같은 센서/틱 안의 독립 난수 종류 (카운터의 세 번째 축)
+DRAW_NOISE = 0
+DRAW_SWITCH = 1
+DRAW_CHOICE = 2
+# 부가 필드 (ADC는 DRAW_AUX, 타입의 부가 필드 j번은 DRAW_AUX + 1 + j)
+DRAW_AUX = 3
+
+# 임의 틱으로 이동할 때 트렌드를 찾으려고 한 번에 거슬러 보는 틱 수
+LOOKBACK_BLOCK = 8
+
+# 카운터 축별 곱셈 상수 (서로 다른 홀수, 축끼리 겹치지 않게 섞음)
+_ID_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_TICK_MULTIPLIER = np.uint64(0xD1B54A32D192ED03)
+_DRAW_MULTIPLIER = 0xAEF17502108EF2D9
+_MASK64 = (1 << 64) - 1
+
+# 53비트 정수 → [0, 1) 실수
+_UNIT = 1.0 / (1 << 53)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 마무리 함수 (제자리 변환, 입력 1비트 변화가 출력 전체로 퍼짐)"""
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return x
+
+
+class SensorStreams:
+    """실행 시드에서 센서별로 독립된 카운터 기반 난수 스트림
+
+    난수 하나는 (시드 키, 센서 ID, 틱, 종류)의 해시로 정해지므로 상태가 없다.
+    그래서 어떤 틱이든 바로 계산할 수 있고(O(1) 이동), 샤드/스레드/블록 크기와 무관하게
+    같은 시드면 같은 센서·틱에 항상 같은 값이 나온다. 키는 SeedSequence로 시드에서 유도한다.
+    """
+
+    def __init__(self, seed: int):
+        if seed < 0:
+            raise ValueError("시드는 0 이상의 정수여야 합니다.")
+        self.seed = seed
+        self.key, self.tick_key = np.random.SeedSequence(seed).generate_state(2, dtype=np.uint64)
+
+    def bits(self, ids: np.ndarray, ticks: Union[int, np.ndarray], draw: int) -> np.ndarray:
+        """64비트 난수 (ids와 ticks는 브로드캐스트, 예: ticks[:, None] × ids → 틱 × 센서)"""
+        x = ids.astype(np.int64, copy=False).view(np.uint64) * _ID_MULTIPLIER
+        x ^= self.key
+        x = _mix(x)
+        counter = np.array(ticks, dtype=np.int64, ndmin=1).view(np.uint64) * _TICK_MULTIPLIER
+        counter += np.uint64(draw * _DRAW_MULTIPLIER & _MASK64)
+        counter ^= self.tick_key
+        x = x ^ counter
+        return _mix(x)
+
+    def uniform(self, ids: np.ndarray, ticks: Union[int, np.ndarray], draw: int) -> np.ndarray:
+        """[0, 1) 균등 난수"""
+        return (self.bits(ids, ticks, draw) >> np.uint64(11)) * _UNIT
+
+    def trend_choice(self, ids: np.ndarray, ticks: Union[int, np.ndarray], choices: np.ndarray) -> np.ndarray:
+        """트렌드가 바뀐 (센서, 틱)의 새 트렌드 값"""
+        return choices[(self.bits(ids, ticks, DRAW_CHOICE) >> np.uint64(32)) % np.uint64(len(choices))]
+
+    def trends_at(self, ids: np.ndarray, probabilities: np.ndarray, tick: int, choices: np.ndarray) -> np.ndarray:
+        """tick까지 반영한 센서별 트렌드 (틱 0 이전 트렌드는 0)
+
+        트렌드는 마지막으로 바뀐 틱에 뽑은 값이므로, 아직 찾지 못한 센서만 LOOKBACK_BLOCK틱씩
+        거슬러 올라가며 찾는다. 바뀔 확률이 p면 평균 1/p틱만 보면 되어 이동 비용은 틱 번호와 무관하다.
+        확률이 0인 센서는 트렌드가 바뀌지 않으므로(항상 0) 찾지 않는다.
+        """
+        trends = np.zeros(len(ids))
+        pending = np.flatnonzero(probabilities > 0)
+        end = tick
+        while len(pending) and end >= 0:
+            start = max(0, end - LOOKBACK_BLOCK + 1)
+            # 최근 틱이 앞 행에 오도록 거꾸로 배치
+            ticks = np.arange(end, start - 1, -1, dtype=np.int64)[:, None]
+            switch = self.uniform(ids[pending], ticks, DRAW_SWITCH) < probabilities[pending]
+            found = switch.any(axis=0)
+            if found.any():
+                latest = ticks[switch.argmax(axis=0)[found], 0]
+                trends[pending[found]] = self.trend_choice(ids[pending[found]], latest, choices)
+            pending = pending[~found]
+            end = start - 1
+        return trends
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import tkinter as tk
+from tkinter import ttk
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from sensor_registry import SensorRegistry
+# 타입 코드 → 화면 표시 이름 (센서 타입 표에서 유도)
+from sensor_types import SENSOR_TYPE_LABELS as TYPE_LABELS
+
+# 검색어 입력 후 필터를 다시 계산하기까지 대기 (ms, 입력 중 매 글자마다 다시 계산하지 않음)
+FILTER_DELAY_MS = 150
+
+
+class SensorView:
+    """레지스트리 위의 정렬/필터 뷰 (Tk 비의존)
+
+    레지스트리 인덱스 배열만 들고 있고 행 내용은 표시할 때 레지스트리에서 읽는다.
+    레지스트리 version이나 필터가 바뀌었을 때만 (타입, ID) 순 정렬과 필터를 다시 계산한다.
+    """
+
+    def __init__(self, registry: SensorRegistry, type_code: Optional[int] = None):
+        self.registry = registry
+        self.type_code = type_code
+        self.text = ""
+        self.order = np.empty(0, dtype=np.int64)
+        # 검색어 적용 전 (타입 필터만 적용한) 센서 수
+        self.unfiltered = 0
+        self._version = -1
+
+    @property
+    def stale(self) -> bool:
+        return self._version != self.registry.version
+
+    def set_filter(self, text: str = "", type_code: Optional[int] = None):
+        """검색어(ID 앞부분 또는 이름 일부, 대소문자 무시)와 타입 필터 지정"""
+        self.text = text.strip().lower()
+        self.type_code = type_code
+        self._version = -1
+
+    def refresh(self) -> bool:
+        """필요할 때만 뷰 재계산 (재계산했으면 True)"""
+        registry = self.registry
+        if not self.stale:
+            return False
+        with registry.lock:
+            self._version = registry.version
+            count = len(registry)
+            ids = np.frombuffer(registry.ids, dtype=np.int64) if count else np.empty(0, dtype=np.int64)
+            codes = np.frombuffer(registry.type_codes, dtype=np.int8) if count else np.empty(0, dtype=np.int8)
+            candidates = np.arange(count)
+            if self.type_code is not None:
+                candidates = candidates[codes == self.type_code]
+            self.unfiltered = len(candidates)
+            if self.text:
+                text = self.text
+                names = registry.names
+                id_prefix = text if text.isdigit() else None
+                candidates = np.fromiter(
+                    (idx for idx in candidates.tolist()
+                     if text in names[idx].lower() or (id_prefix and str(registry.ids[idx]).startswith(id_prefix))),
+                    dtype=np.int64
+                )
+            # (타입, ID) 순 정렬
+            self.order = candidates[np.lexsort((ids[candidates], codes[candidates]))] if len(candidates) else candidates
+        return True
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def row(self, position: int) -> Optional[Tuple[int, int, str, float]]:
+        """정렬 위치의 (타입 코드, ID, 이름, 마지막 값), 그 사이 센서가 바뀌었으면 None"""
+        registry = self.registry
+        if position >= len(self.order) or self.stale:
+            return None
+        idx = int(self.order[position])
+        return registry.type_codes[idx], registry.ids[idx], registry.names[idx], registry.last_values[idx]
+
+
+class SensorBrowser(ttk.Frame):
+    """가상화 센서 목록: 보이는 줄 수만큼의 Treeview 행을 재사용하고 스크롤 위치의 센서만 채워 넣음
+
+    센서가 10만 개여도 위젯은 rows개뿐이며, 센서 추가/삭제 시에는 뷰 인덱스만 다시 계산하고
+    보이는 행의 값만 바꾼다. 선택은 센서 ID로 기억하므로 스크롤해도 유지된다.
+    """
+
+    def __init__(self, parent, registry: SensorRegistry, rows: int = 8, type_code: Optional[int] = None,
+                 show_type_filter: bool = True):
+        super().__init__(parent)
+        self.view = SensorView(registry, type_code)
+        self.rows = rows
+        self.offset = 0
+        self.selected: Set[int] = set()
+        self._fixed_type = type_code
+        self._filter_job = None
+        self._row_ids: List[Optional[int]] = [None] * rows
+
+        # 검색/타입 필터
+        filter_frame = ttk.Frame(self)
+        filter_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 3))
+        ttk.Label(filter_frame, text="🔍").grid(row=0, column=0, sticky="w")
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self._schedule_filter())
+        ttk.Entry(filter_frame, textvariable=self.search_var, width=18).grid(row=0, column=1, sticky="ew", padx=(3, 0))
+        self.type_var = tk.StringVar(value="전체")
+        if show_type_filter and type_code is None:
+            type_combo = ttk.Combobox(filter_frame, textvariable=self.type_var, state="readonly", width=6,
+                                      values=["전체"] + [TYPE_LABELS[code] for code in sorted(TYPE_LABELS)])
+            type_combo.grid(row=0, column=2, padx=(5, 0))
+            type_combo.bind("<<ComboboxSelected>>", lambda event: self.apply_filter())
+        self.count_label = ttk.Label(filter_frame, text="", foreground="gray")
+        self.count_label.grid(row=0, column=3, sticky="w", padx=(8, 0))
+        filter_frame.columnconfigure(1, weight=1)
+
+        # 고정 행 Treeview + 직접 관리하는 스크롤바
+        columns = ("id", "name", "value") if type_code is not None else ("type", "id", "name", "value")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=rows, selectmode="extended")
+        headings = {"type": ("타입", 50), "id": ("ID", 70), "name": ("이름", 160), "value": ("마지막 값", 80)}
+        for column in columns:
+            title, width = headings[column]
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, stretch=column == "name", anchor="w" if column == "name" else "e")
+        for i in range(rows):
+            self.tree.insert("", "end", iid=f"r{i}", values=())
+        self.tree.grid(row=1, column=0, sticky="nsew")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-1))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(1))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # 필터
+    # ------------------------------------------------------------------
+    def _schedule_filter(self):
+        if self._filter_job:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DELAY_MS, self.apply_filter)
+
+    def apply_filter(self):
+        self._filter_job = None
+        type_code = self._fixed_type
+        if type_code is None and self.type_var.get() != "전체":
+            type_code = {label: code for code, label in TYPE_LABELS.items()}[self.type_var.get()]
+        self.view.set_filter(self.search_var.get(), type_code)
+        self.offset = 0
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # 스크롤
+    # ------------------------------------------------------------------
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None):
+        if action == "moveto":
+            self.offset = int(float(amount) * len(self.view))
+            self.render()
+        elif action == "scroll":
+            self.scroll(int(amount) * (self.rows if unit == "pages" else 1))
+
+    def scroll(self, lines: int):
+        self.offset += lines
+        self.render()
+
+    # ------------------------------------------------------------------
+    # 선택
+    # ------------------------------------------------------------------
+    def _on_select(self, event=None):
+        """보이는 행의 선택 상태를 센서 ID 집합에 반영 (보이지 않는 선택은 유지)"""
+        chosen = set(self.tree.selection())
+        for i, sensor_id in enumerate(self._row_ids):
+            if sensor_id is None:
+                continue
+            if f"r{i}" in chosen:
+                self.selected.add(sensor_id)
+            else:
+                self.selected.discard(sensor_id)
+
+    def selected_sensor_ids(self) -> List[int]:
+        """선택한 센서 ID (삭제된 센서 제외)"""
+        registry = self.view.registry
+        return sorted(sensor_id for sensor_id in self.selected if sensor_id in registry)
+
+    # ------------------------------------------------------------------
+    # 표시
+    # ------------------------------------------------------------------
+    def refresh(self):
+        """센서 추가/삭제/필터 변경 후 뷰 재계산 + 보이는 행 갱신"""
+        self.view.refresh()
+        registry = self.view.registry
+        self.selected = {sensor_id for sensor_id in self.selected if sensor_id in registry}
+        self.render()
+
+    def update_values(self):
+        """주기적 갱신: 레지스트리가 바뀌었으면 재계산, 아니면 보이는 행의 마지막 값만 갱신"""
+        if self.view.stale:
+            self.refresh()
+        else:
+            self.render()
+
+    def render(self):
+        view = self.view
+        total = len(view)
+        self.offset = max(0, min(self.offset, total - self.rows))
+        reselect = []
+        for i in range(self.rows):
+            iid = f"r{i}"
+            row = view.row(self.offset + i)
+            if row is None:
+                self._row_ids[i] = None
+                self.tree.item(iid, values=())
+                continue
+            type_code, sensor_id, name, value = row
+            values = (sensor_id, name, f"{value:.2f}")
+            if self._fixed_type is None:
+                values = (TYPE_LABELS.get(type_code, type_code),) + values
+            self._row_ids[i] = sensor_id
+            self.tree.item(iid, values=values)
+            if sensor_id in self.selected:
+                reselect.append(iid)
+        if set(reselect) != set(self.tree.selection()):
+            self.tree.selection_set(reselect)
+
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.count_label.config(text=f"{total:,}개" if total == view.unfiltered else f"{total:,} / {view.unfiltered:,}개")
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import threading
+from array import array
+from typing import Dict, Any, List, Iterator, Optional
+
+# 피보나치 해싱 상수 (2^64 / 황금비)
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+class IdIndex:
+    """센서 ID → 배열 인덱스 해시 (array 기반 오픈 어드레싱, 선형 탐사)
+
+    dict는 키/값마다 int 객체를 만들기 때문에 센서 100만 개에서 수십 MB를 차지한다.
+    슬롯당 16바이트의 두 배열만 사용하고, 삭제는 backward-shift로 처리해 툼스톤이 없다.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        """빈 슬롯 배열 할당 (capacity는 2의 거듭제곱)"""
+        self.bits = max(3, (capacity - 1).bit_length())
+        size = 1 << self.bits
+        self.mask = size - 1
+        self.shift = 64 - self.bits
+        self.keys = array('q', bytes(8 * size))
+        self.values = array('q', [-1]) * size  # -1: 빈 슬롯
+        self.count = 0
+
+    def _slot(self, key: int) -> int:
+        return ((key * _HASH_MULTIPLIER) & _MASK64) >> self.shift
+
+    def _find(self, key: int) -> int:
+        """키가 있는 슬롯 (없으면 -1)"""
+        keys, values, mask = self.keys, self.values, self.mask
+        slot = self._slot(key)
+        while values[slot] >= 0:
+            if keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+        return -1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: int) -> bool:
+        return self._find(key) >= 0
+
+    def get(self, key: int, default: Optional[int] = None) -> Optional[int]:
+        slot = self._find(key)
+        return self.values[slot] if slot >= 0 else default
+
+    def __getitem__(self, key: int) -> int:
+        slot = self._find(key)
+        if slot < 0:
+            raise KeyError(key)
+        return self.values[slot]
+
+    def __setitem__(self, key: int, value: int):
+        keys, values, mask = self.keys, self.values, self.mask
+        slot = self._slot(key)
+        while values[slot] >= 0:
+            if keys[slot] == key:
+                values[slot] = value
+                return
+            slot = (slot + 1) & mask
+        keys[slot] = key
+        values[slot] = value
+        self.count += 1
+
+        # 적재율 50% 초과 시 두 배로 확장
+        if self.count * 2 > self.mask + 1:
+            self._grow()
+
+    def _grow(self):
+        """두 배 크기로 재해싱"""
+        old_keys, old_values = self.keys, self.values
+        self._allocate((self.mask + 1) * 2)
+        for key, value in zip(old_keys, old_values):
+            if value >= 0:
+                self[key] = value
+
+    def pop(self, key: int) -> int:
+        """키 삭제 후 값 반환 (없으면 KeyError)"""
+        slot = self._find(key)
+        if slot < 0:
+            raise KeyError(key)
+        keys, values, mask = self.keys, self.values, self.mask
+        value = values[slot]
+        values[slot] = -1
+        self.count -= 1
+
+        # backward-shift: 뒤따르는 클러스터 항목을 빈 자리로 당겨 탐사 체인 유지
+        hole = slot
+        probe = slot
+        while True:
+            probe = (probe + 1) & mask
+            if values[probe] < 0:
+                break
+            home = self._slot(keys[probe])
+            # home이 (hole, probe] 구간(순환)에 있으면 이동하지 않음
+            if hole <= probe:
+                stays = hole < home <= probe
+            else:
+                stays = home > hole or home <= probe
+            if not stays:
+                keys[hole] = keys[probe]
+                values[hole] = values[probe]
+                values[probe] = -1
+                hole = probe
+        return value
+
+    def clear(self):
+        self._allocate(8)
+
+    def restore(self, keys: array, values: array, count: int):
+        """저장해 둔 슬롯 배열을 그대로 사용 (재해싱 없음, 슬롯 수는 2의 거듭제곱)"""
+        size = len(keys)
+        if size != len(values) or size < 8 or size & (size - 1):
+            raise ValueError(f"ID 해시 슬롯 배열 크기가 잘못되었습니다: {size}")
+        self.bits = size.bit_length() - 1
+        self.mask = size - 1
+        self.shift = 64 - self.bits
+        self.keys = keys
+        self.values = values
+        self.count = count
+
+    def memory_bytes(self) -> int:
+        return (self.mask + 1) * 16
+
+
+class SensorRegistry:
+    """배열 기반(struct-of-arrays) 센서 레지스트리
+
+    센서 하나당 id/타입 코드/기준값/변동 범위/트렌드/마지막 값을 타입 지정 배열에 저장하고,
+    id → 인덱스 해시로 추가·삭제·조회를 O(1)에 처리한다.
+    삭제 시 마지막 센서를 빈 자리로 옮기므로 인덱스 순서는 보장하지 않는다.
+    """
+
+    def __init__(self):
+        self.ids = array('q')           # 센서 ID
+        self.type_codes = array('b')    # 센서 타입 코드 (1: 전류, 2: 온도, 3: 습도)
+        self.base_values = array('d')   # 센서별 기준값
+        self.variations = array('d')    # 센서별 랜덤 변동 범위 (±)
+        self.trends = array('d')        # 센서별 현재 트렌드
+        self.last_values = array('d')   # 센서별 마지막 생성값
+        self.names: List[str] = []      # 센서 이름 (intern 처리)
+        self.payload_heads: List[bytes] = []  # 미리 인코딩한 페이로드 앞부분 (PayloadEncoder.render_head)
+        self.index = IdIndex()
+
+        # 구조 변경(추가/삭제) 시 증가 - 캐시 무효화용
+        self.version = 0
+
+        # 틱 계산 중 배열 버퍼를 참조하므로 구조 변경과 상호 배제
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, sensor_id: int) -> bool:
+        return sensor_id in self.index
+
+    def add(self, sensor_id: int, type_code: int, name: str, base_value: float, trend: float = 0.0,
+            payload_head: bytes = b"", variation: float = 0.0) -> int:
+        """센서 추가 후 인덱스 반환 (중복 ID면 ValueError)"""
+        with self.lock:
+            if sensor_id in self.index:
+                raise ValueError(f"센서 ID {sensor_id}는 이미 존재합니다.")
+
+            idx = len(self.ids)
+            self.ids.append(sensor_id)
+            self.type_codes.append(type_code)
+            self.base_values.append(base_value)
+            self.variations.append(variation)
+            self.trends.append(trend)
+            self.last_values.append(base_value)
+            self.names.append(sys.intern(name))
+            self.payload_heads.append(payload_head)
+            self.index[sensor_id] = idx
+            self.version += 1
+            return idx
+
+    def add_many(self, ids: List[int], type_codes: List[int], names: List[str], base_values: List[float],
+                 variations: List[float], payload_heads: List[bytes], replace: bool = False) -> int:
+        """센서 여러 개를 한 번에 추가 (열 단위 extend, 버전은 한 번만 증가)
+
+        기존 센서나 목록 안에서 겹치는 ID가 하나라도 있으면 아무것도 추가하지 않고 ValueError.
+        replace면 검사를 통과한 뒤에만 기존 센서를 모두 지우고 추가한다 (실패하면 기존 센서가 그대로 남음).
+        """
+        with self.lock:
+            seen = set()
+            duplicates = []
+            for sensor_id in ids:
+                if sensor_id in seen or (not replace and sensor_id in self.index):
+                    duplicates.append(sensor_id)
+                seen.add(sensor_id)
+            if duplicates:
+                shown = ", ".join(str(sensor_id) for sensor_id in duplicates[:10])
+                more = f" 외 {len(duplicates) - 10}개" if len(duplicates) > 10 else ""
+                raise ValueError(f"중복된 센서 ID가 있습니다: {shown}{more}")
+
+            if replace:
+                self.clear()
+            start = len(self.ids)
+            self.ids.extend(ids)
+            self.type_codes.extend(type_codes)
+            self.base_values.extend(base_values)
+            self.variations.extend(variations)
+            self.trends.extend([0.0] * len(ids))
+            self.last_values.extend(base_values)
+            self.names.extend(sys.intern(name) for name in names)
+            self.payload_heads.extend(payload_heads)
+            index = self.index
+            for offset, sensor_id in enumerate(ids):
+                index[sensor_id] = start + offset
+            self.version += 1
+            return len(ids)
+
+    def remove(self, sensor_id: int):
+        """센서 삭제 (마지막 센서를 빈 자리로 이동, 없는 ID면 KeyError)"""
+        with self.lock:
+            idx = self.index.pop(sensor_id)
+            last = len(self.ids) - 1
+
+            if idx != last:
+                moved_id = self.ids[last]
+                self.ids[idx] = moved_id
+                self.type_codes[idx] = self.type_codes[last]
+                self.base_values[idx] = self.base_values[last]
+                self.variations[idx] = self.variations[last]
+                self.trends[idx] = self.trends[last]
+                self.last_values[idx] = self.last_values[last]
+                self.names[idx] = self.names[last]
+                self.payload_heads[idx] = self.payload_heads[last]
+                self.index[moved_id] = idx
+
+            self.ids.pop()
+            self.type_codes.pop()
+            self.base_values.pop()
+            self.variations.pop()
+            self.trends.pop()
+            self.last_values.pop()
+            self.names.pop()
+            self.payload_heads.pop()
+            self.version += 1
+
+    def clear(self):
+        """모든 센서 삭제"""
+        with self.lock:
+            for column in (self.ids, self.type_codes, self.base_values, self.variations, self.trends,
+                           self.last_values):
+                del column[:]
+            self.names.clear()
+            self.payload_heads.clear()
+            self.index.clear()
+            self.version += 1
+
+    def restore(self, ids: array, type_codes: array, base_values: array, variations: array, trends: array,
+                last_values: array, names: List[str], payload_heads: List[bytes], index_keys: array,
+                index_values: array):
+        """체크포인트에서 읽은 열로 전체 교체 (ID 해시도 저장한 슬롯 배열로 복원해 센서 수만큼의 재해싱이 없음)"""
+        with self.lock:
+            self.ids = ids
+            self.type_codes = type_codes
+            self.base_values = base_values
+            self.variations = variations
+            self.trends = trends
+            self.last_values = last_values
+            self.names = names
+            self.payload_heads = payload_heads
+            self.index.restore(index_keys, index_values, len(ids))
+            self.version += 1
+
+    def get(self, sensor_id: int) -> Optional[Dict[str, Any]]:
+        """센서 ID로 센서 정보 조회"""
+        idx = self.index.get(sensor_id)
+        if idx is None:
+            return None
+        return self.sensor_at(idx)
+
+    def sensor_at(self, idx: int) -> Dict[str, Any]:
+        """인덱스 위치의 센서 정보"""
+        return {
+            "id": self.ids[idx],
+            "type": self.type_codes[idx],
+            "name": self.names[idx],
+            "base_value": self.base_values[idx],
+            "variation": self.variations[idx],
+            "trend": self.trends[idx],
+            "last_value": self.last_values[idx]
+        }
+
+    def iter_type(self, type_code: int) -> Iterator[Dict[str, Any]]:
+        """타입별 센서 순회 (GUI 표시용)"""
+        for idx, code in enumerate(self.type_codes):
+            if code == type_code:
+                yield {"id": self.ids[idx], "name": self.names[idx]}
+
+    def set_base_for_type(self, type_code: int, value: float):
+        """타입의 모든 센서 기준값 변경"""
+        with self.lock:
+            for idx, code in enumerate(self.type_codes):
+                if code == type_code:
+                    self.base_values[idx] = value
+
+    def memory_bytes(self) -> int:
+        """배열/인덱스가 차지하는 대략적인 메모리 (이름/페이로드 조각 객체 제외)"""
+        columns = (self.ids, self.type_codes, self.base_values, self.variations, self.trends, self.last_values)
+        total = sum(column.buffer_info()[1] * column.itemsize for column in columns)
+        total += sys.getsizeof(self.names) + sys.getsizeof(self.payload_heads) + self.index.memory_bytes()
+        return total
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+
+class AuxField(NamedTuple):
+    """부가 필드 (v1 페이로드의 전압/전력/주파수/주변 온습도 등): 범위 안에서 틱마다 조금씩 변하는 값"""
+    name: str
+    low: float
+    high: float
+    initial: float
+    max_change: float
+    digits: int
+
+
+class AdcField(NamedTuple):
+    """ADC 원시값 필드: 주 값 × scale_low ~ 주 값 × scale_high 사이의 정수"""
+    name: str
+    scale_low: float
+    scale_high: float
+
+
+class SensorType(NamedTuple):
+    """센서 타입 정의 (값 계산/범위 제한/페이로드 필드/화면 표시가 모두 이 표에서 나옴)
+
+    페이로드 필드 순서: 주 값(name 필드) → ADC → 부가 필드 → value → unit
+    """
+    name: str                       # 타입 이름 (설정/CLI, 페이로드 주 값 필드명)
+    code: int                       # 페이로드 sensor_type 코드 (1~127)
+    label: str                      # 화면 표시 이름
+    icon: str                       # 전송 로그 아이콘
+    unit: str
+    digits: int                     # 값 반올림 자릿수
+    default_value: float            # 새 센서 기준값
+    variation: float                # ± 랜덤 변동 범위
+    trend_probability: float        # 틱당 트렌드 변화 확률
+    bounds: Tuple[float, float]     # 합리적인 범위 제한 (최소, 최대)
+    walk: Tuple[float, float, float, float]  # v1 안정 변화 (최소, 최대, 시작값, 틱당 최대 변화)
+    adc: Optional[AdcField] = None
+    aux_fields: Tuple[AuxField, ...] = ()
+
+
+# 기본 센서 타입 (v1의 다중 필드 포함)
+BUILTIN_SENSOR_TYPES: Tuple[SensorType, ...] = (
+    SensorType("current", 1, "전류", "⚡", "A", 2, 8.5, 0.5, 0.1, (0.0, 999.0), (1.0, 12.0, 8.5, 0.3),
+               AdcField("current_adc", 100, 300),
+               (AuxField("voltage", 220.0, 240.0, 230.0, 1.0, 1),
+                AuxField("power", 200.0, 2500.0, 1500.0, 50.0, 1),
+                AuxField("frequency", 59.8, 60.2, 60.0, 0.1, 1))),
+    SensorType("temperature", 2, "온도", "🌡️", "°C", 1, 25.0, 2.0, 0.05, (-50.0, 300.0), (25.0, 40.0, 30.0, 0.5),
+               AdcField("temperature_adc", 50, 80),
+               (AuxField("ambient_temp", 18.0, 25.0, 22.0, 0.3, 1),)),
+    SensorType("humidity", 3, "습도", "💧", "%", 1, 55.0, 3.0, 0.08, (0.0, 100.0), (45.0, 70.0, 55.0, 1.0),
+               None,
+               (AuxField("ambient_temp", 20.0, 28.0, 25.0, 0.5, 1),
+                AuxField("ambient_humi", 40.0, 65.0, 55.0, 1.0, 1)))
+)
+
+# 표에서 펼친 조회용 딕셔너리 (register_sensor_type이 제자리에서 갱신하므로 다른 모듈은 같은 객체를 참조)
+SENSOR_TYPES: Dict[str, SensorType] = {}
+SENSOR_TYPES_BY_CODE: Dict[int, SensorType] = {}
+# 타입 이름 → 코드 / 코드 → 타입 이름 / 코드 → 화면 표시 이름
+SENSOR_TYPE_CODES: Dict[str, int] = {}
+SENSOR_TYPE_NAMES: Dict[int, str] = {}
+SENSOR_TYPE_LABELS: Dict[int, str] = {}
+# 타입 이름 → 범위 제한 (최소, 최대)
+SENSOR_BOUNDS: Dict[str, Tuple[float, float]] = {}
+# 코드 → (값 필드명, 소수 자릿수, 단위)
+PAYLOAD_FIELDS: Dict[int, Tuple[str, int, str]] = {}
+# 코드 → 전송 로그 (아이콘, 항목명, 단위)
+MESSAGE_DESCRIPTIONS: Dict[int, Tuple[str, str, str]] = {}
+
+
+def register_sensor_type(sensor_type: SensorType) -> SensorType:
+    """센서 타입 등록 (같은 정의를 다시 등록하면 무시, 이름이나 코드가 다른 정의와 겹치면 ValueError)
+
+    이미 만든 GeneratorEngine에는 reload_sensor_types()로 반영한다.
+    """
+    existing = SENSOR_TYPES.get(sensor_type.name) or SENSOR_TYPES_BY_CODE.get(sensor_type.code)
+    if existing == sensor_type:
+        return sensor_type
+    if existing is not None:
+        raise ValueError(f"센서 타입 '{sensor_type.name}'(코드 {sensor_type.code})가 "
+                         f"기존 타입 '{existing.name}'(코드 {existing.code})와 겹칩니다.")
+    if not 1 <= sensor_type.code <= 127:
+        raise ValueError(f"센서 타입 코드는 1~127이어야 합니다: {sensor_type.code}")
+    low, high = sensor_type.bounds
+    if low > high:
+        raise ValueError(f"센서 타입 '{sensor_type.name}'의 범위 제한이 잘못되었습니다: {sensor_type.bounds}")
+    field_names = [sensor_type.name] + [field.name for field in sensor_type.aux_fields]
+    if sensor_type.adc:
+        field_names.append(sensor_type.adc.name)
+    if len(set(field_names)) != len(field_names) or {"value", "unit"} & set(field_names):
+        raise ValueError(f"센서 타입 '{sensor_type.name}'의 필드 이름이 겹칩니다: {', '.join(field_names)}")
+
+    SENSOR_TYPES[sensor_type.name] = sensor_type
+    SENSOR_TYPES_BY_CODE[sensor_type.code] = sensor_type
+    SENSOR_TYPE_CODES[sensor_type.name] = sensor_type.code
+    SENSOR_TYPE_NAMES[sensor_type.code] = sensor_type.name
+    SENSOR_TYPE_LABELS[sensor_type.code] = sensor_type.label
+    SENSOR_BOUNDS[sensor_type.name] = sensor_type.bounds
+    PAYLOAD_FIELDS[sensor_type.code] = (sensor_type.name, sensor_type.digits, sensor_type.unit)
+    MESSAGE_DESCRIPTIONS[sensor_type.code] = (sensor_type.icon, sensor_type.label, sensor_type.unit)
+    return sensor_type
+
+
+def sensor_type_from_config(config: Dict[str, Any]) -> SensorType:
+    """설정 딕셔너리 → SensorType (name, code, unit 필수, 나머지는 기본값)
+
+    {"name": "pressure", "code": 4, "label": "압력", "unit": "kPa", "digits": 1, "default_value": 101.3,
+     "variation": 0.5, "trend_probability": 0.05, "bounds": [80, 120],
+     "aux_fields": [{"name": "ambient_temp", "low": 18, "high": 25, "initial": 22, "max_change": 0.3, "digits": 1}],
+     "adc": {"name": "pressure_adc", "scale_low": 10, "scale_high": 12}}
+    """
+    try:
+        name = str(config["name"]).strip()
+        if not name.isidentifier():
+            raise ValueError(f"센서 타입 이름은 영문자/숫자/밑줄이어야 합니다: '{name}'")
+        default_value = float(config.get("default_value", 0.0))
+        variation = float(config.get("variation", 1.0))
+        bounds = tuple(float(bound) for bound in config.get("bounds", (float("-inf"), float("inf"))))
+        if len(bounds) != 2:
+            raise ValueError("bounds는 [최소, 최대] 형식이어야 합니다")
+        walk = config.get("walk")
+        if walk is None:
+            low = bounds[0] if bounds[0] != float("-inf") else default_value - variation * 10
+            high = bounds[1] if bounds[1] != float("inf") else default_value + variation * 10
+            walk = (low, high, default_value, variation)
+        adc = config.get("adc")
+        code = int(config["code"])
+        if not 1 <= code <= 127:
+            raise ValueError(f"센서 타입 코드는 1~127이어야 합니다: {code}")
+        trend_probability = float(config.get("trend_probability", 0.05))
+        if not 0.0 <= trend_probability <= 1.0:
+            raise ValueError(f"트렌드 변화 확률은 0~1이어야 합니다: {trend_probability}")
+        return SensorType(
+            name=name,
+            code=code,
+            label=str(config.get("label", name)),
+            icon=str(config.get("icon", "📟")),
+            unit=str(config["unit"]),
+            digits=int(config.get("digits", 1)),
+            default_value=default_value,
+            variation=variation,
+            trend_probability=trend_probability,
+            bounds=bounds,
+            walk=tuple(float(item) for item in walk),
+            adc=AdcField(str(adc["name"]), float(adc["scale_low"]), float(adc["scale_high"])) if adc else None,
+            aux_fields=tuple(
+                AuxField(str(field["name"]), float(field["low"]), float(field["high"]),
+                         float(field.get("initial", (float(field["low"]) + float(field["high"])) / 2)),
+                         float(field.get("max_change", 1.0)), int(field.get("digits", 1)))
+                for field in config.get("aux_fields", ())
+            )
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"센서 타입 설정 형식이 잘못되었습니다: {e}")
+
+
+for _builtin in BUILTIN_SENSOR_TYPES:
+    register_sensor_type(_builtin)
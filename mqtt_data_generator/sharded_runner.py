@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import multiprocessing
+import queue
+import signal
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional, Callable
+
+from generator_engine import GeneratorEngine, DEFAULT_CLIENT_ID, default_log
+from log_pipeline import pipeline_from_config
+from fleet_import import load_fleet
+from fault_injection import parse_faults, parse_target
+from sensor_types import SENSOR_TYPE_CODES
+
+# 표준 입력 제어 명령 도움말 (--control)
+CONTROL_HELP = "start | stop | base <센서 타입> <기준값> | prefix <토픽 프리픽스> | status | quit"
+
+
+def split_sensors(sensors: Dict[str, List[Dict[str, Any]]], shard_count: int) -> List[Dict[str, List[Dict[str, Any]]]]:
+    """센서 ID % 샤드 수로 센서 설정 분할 (연결 풀과 같은 분배 규칙)"""
+    shards = [{sensor_type: [] for sensor_type in sensors} for _ in range(shard_count)]
+    for sensor_type, type_sensors in sensors.items():
+        for sensor in type_sensors:
+            shards[int(sensor["id"]) % shard_count][sensor_type].append(sensor)
+    return shards
+
+
+def split_random_faults(faults: List[Any], sizes: List[int]) -> List[List[Dict[str, Any]]]:
+    """장애 설정을 워커별로 나눔: random:N 대상은 샤드 센서 수 비율로 N을 나눠 전체가 N개가 되게 함
+
+    워커는 자기 샤드에서만 무작위로 고르므로 그대로 넘기면 N × 워커 수만큼 고르게 된다.
+    몫이 0인 워커에는 그 장애를 넘기지 않는다. 나머지는 센서가 많은 샤드부터 하나씩 더 준다.
+    """
+    shard_faults: List[List[Dict[str, Any]]] = [[] for _ in sizes]
+    total = sum(sizes)
+    for spec in parse_faults(faults, check_types=False):
+        fault = spec._asdict()
+        target_kind, count = parse_target(spec.target, check_types=False)
+        if target_kind != "random":
+            for faults_of_shard in shard_faults:
+                faults_of_shard.append(dict(fault))
+            continue
+        count = min(count, total)
+        shares = [count * size // total if total else 0 for size in sizes]
+        by_size = sorted(range(len(sizes)), key=lambda index: -sizes[index])
+        for index in by_size[:count - sum(shares)]:
+            shares[index] += 1
+        for faults_of_shard, share in zip(shard_faults, shares):
+            if share:
+                faults_of_shard.append(dict(fault, target=f"random:{share}"))
+    return shard_faults
+
+
+def shard_worker(index: int, config: Dict[str, Any], commands, statuses, status_interval: float):
+    """워커 프로세스: 자체 MQTT 클라이언트와 샤드 센서 상태로 생성 엔진 실행"""
+    # Ctrl+C는 감독 프로세스가 처리하고 shutdown 명령으로 전달
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    log_pipeline = pipeline_from_config(config, file_suffix=f".w{index}", prefix=f"[w{index}] ")
+    log_pipeline.start_console()
+    engine = GeneratorEngine(log_callback=log_pipeline.log)
+    engine.message_log_callback = log_pipeline.log_message
+    try:
+        engine.apply_config(config)
+        if engine.uses_broker:
+            engine.connect()
+        engine.start_metrics_server()
+    except Exception as e:
+        statuses.put({"worker": index, "fatal": str(e)})
+        log_pipeline.close()
+        return
+
+    while True:
+        try:
+            command = commands.get(timeout=status_interval)
+        except queue.Empty:
+            command = None
+
+        if command:
+            name, args = command[0], command[1:]
+            try:
+                if name == "shutdown":
+                    break
+                if name == "start":
+                    if not engine.uses_broker or engine.wait_until_connected():
+                        engine.start()
+                    else:
+                        engine.log("❌ MQTT 브로커 연결 시간 초과")
+                elif name == "stop":
+                    engine.stop()
+                elif name == "set_base_value":
+                    engine.set_base_value(*args)
+                elif name == "set_topic_prefix":
+                    engine.set_topic_prefix(*args)
+            except Exception as e:
+                engine.error_count += 1
+                engine.log(f"❌ 명령 처리 오류 ({name}): {str(e)}")
+
+        status = engine.status()
+        status["worker"] = index
+        statuses.put(status)
+
+    # 마지막 발행과 파일 기록이 끝나고 확인까지 받은 뒤 연결 해제
+    if engine.is_running:
+        engine.stop()
+    engine.join_generator()
+    engine.wait_for_in_flight(0, timeout=engine.SHUTDOWN_DRAIN_TIMEOUT)
+    engine.disconnect()
+    engine.stop_metrics_server()
+    if engine.uses_broker:
+        engine.report_latency()
+    status = engine.status()
+    status["worker"] = index
+    statuses.put(status)
+    log_pipeline.close()
+
+
+class ShardSupervisor:
+    """센서 집합을 샤드로 나눠 CPU 코어당 워커 프로세스를 실행하고 상태를 집계
+
+    각 워커는 자체 MQTT 클라이언트({client_id}-w{index})와 센서별 랜덤워크 상태를 갖는다.
+    제어 명령(start/stop/set_base_value/set_topic_prefix)은 모든 워커에 전달된다.
+    헤드리스 실행에서는 control을 켜면 표준 입력 명령(CONTROL_HELP)으로 실행 중에 보낼 수 있다.
+    """
+
+    def __init__(self, config: Dict[str, Any], workers: int,
+                 log: Optional[Callable[[str], None]] = None,
+                 status_interval: float = 1.0, report_interval: float = 5.0, control: bool = False):
+        if workers < 1:
+            raise ValueError("워커 수는 1 이상이어야 합니다.")
+        self.config = config
+        self.workers = workers
+        self.log = log or default_log
+        self.status_interval = status_interval
+        self.report_interval = report_interval
+        self.control = control
+        # 표준 입력에서 읽은 제어 명령 줄 (읽기 스레드 → 감독 루프)
+        self._control_lines: "queue.Queue[str]" = queue.Queue()
+
+        self.processes: List[multiprocessing.Process] = []
+        self.command_queues: List[multiprocessing.Queue] = []
+        self.status_queue: Optional[multiprocessing.Queue] = None
+
+        # 워커별 최신 상태 및 발행률 계산용 직전 집계
+        self.worker_status: Dict[int, Dict[str, Any]] = {}
+        self._last_acked = 0
+        self._last_time = time.monotonic()
+
+    def shard_configs(self) -> List[Dict[str, Any]]:
+        """워커별 설정 (센서 샤드, 클라이언트 ID, 발행률 배율)"""
+        sensors = {sensor_type: list(type_sensors) for sensor_type, type_sensors in self.config.get("sensors", {}).items()}
+        # 센서 목록 파일은 감독 프로세스에서 한 번 읽어 샤드별 sensors로 나눔
+        if self.config.get("fleet"):
+            for definition in load_fleet(self.config["fleet"]):
+                sensors.setdefault(definition.sensor_type, []).append({
+                    "id": definition.sensor_id, "name": definition.name,
+                    "base_value": definition.base_value, "variation": definition.variation
+                })
+        shards = split_sensors(sensors, self.workers)
+        shard_faults = split_random_faults(self.config.get("faults", []),
+                                           [sum(len(type_sensors) for type_sensors in shard.values()) for shard in shards])
+        client_id = self.config.get("client_id", DEFAULT_CLIENT_ID)
+        configs = []
+        for index, sensors in enumerate(shards):
+            shard_config = copy.deepcopy(self.config)
+            shard_config["sensors"] = sensors
+            shard_config.pop("fleet", None)
+            if shard_config.get("faults"):
+                shard_config["faults"] = shard_faults[index]
+            shard_config["client_id"] = f"{client_id}-w{index}"
+            shard_config["rate_scale"] = float(self.config.get("rate_scale", 1.0)) / self.workers
+            if shard_config.get("metrics_port"):
+                shard_config["metrics_port"] += index
+            if shard_config.get("record"):
+                shard_config["record"] += f"-w{index}"
+            if shard_config.get("checkpoint"):
+                shard_config["checkpoint"] += f"-w{index}"
+            if shard_config.get("fault_report"):
+                shard_config["fault_report"] += f"-w{index}"
+            if shard_config.get("sink", {}).get("path"):
+                shard_config["sink"]["path"] += f"-w{index}"
+            configs.append(shard_config)
+        return configs
+
+    def start_workers(self):
+        """워커 프로세스 시작 (각자 브로커에 연결)"""
+        self.status_queue = multiprocessing.Queue()
+        for index, shard_config in enumerate(self.shard_configs()):
+            commands = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=shard_worker,
+                args=(index, shard_config, commands, self.status_queue, self.status_interval),
+                name=f"shard-{index}",
+                daemon=True
+            )
+            process.start()
+            self.command_queues.append(commands)
+            self.processes.append(process)
+        self.log(f"🧩 워커 {self.workers}개 시작 (센서 ID % {self.workers} 샤딩)")
+
+    def broadcast(self, *command):
+        """모든 워커에 명령 전달"""
+        for commands in self.command_queues:
+            commands.put(command)
+
+    def start(self):
+        self.broadcast("start")
+
+    def stop(self):
+        self.broadcast("stop")
+
+    def set_base_value(self, sensor_type: str, value: float):
+        """센서 타입 기준값을 모든 워커에 적용 (v2 GUI의 타입별 값 업데이트와 같은 동작)"""
+        if sensor_type not in SENSOR_TYPE_CODES:
+            raise ValueError(f"알 수 없는 센서 타입입니다: {sensor_type} (사용 가능: {', '.join(SENSOR_TYPE_CODES)})")
+        self.broadcast("set_base_value", sensor_type, float(value))
+
+    def set_topic_prefix(self, new_prefix: str):
+        # 워커로 보내기 전에 같은 규칙으로 검증
+        GeneratorEngine(log_callback=lambda message: None).set_topic_prefix(new_prefix)
+        self.broadcast("set_topic_prefix", new_prefix.strip())
+
+    def handle_command(self, line: str) -> bool:
+        """제어 명령 한 줄 처리 (quit이면 False, 잘못된 명령은 로그만 남김)"""
+        parts = line.split()
+        if not parts:
+            return True
+        name, args = parts[0].lower(), parts[1:]
+        try:
+            if name == "quit":
+                return False
+            if name == "start" and not args:
+                self.start()
+            elif name == "stop" and not args:
+                self.stop()
+            elif name == "base" and len(args) == 2:
+                try:
+                    value = float(args[1])
+                except ValueError:
+                    raise ValueError(f"기준값은 숫자여야 합니다: {args[1]}")
+                self.set_base_value(args[0], value)
+            elif name == "prefix" and len(args) == 1:
+                self.set_topic_prefix(args[0])
+            elif name == "status" and not args:
+                self.report()
+                return True
+            else:
+                raise ValueError(f"알 수 없는 명령입니다: {line.strip()} ({CONTROL_HELP})")
+        except ValueError as e:
+            self.log(f"❌ 오류: {e}")
+            return True
+        self.log(f"🎛️ 모든 워커에 전달: {line.strip()}")
+        return True
+
+    def _read_control(self):
+        """표준 입력 읽기 스레드 (입력이 끝나면 종료, 실행은 계속)"""
+        for line in sys.stdin:
+            self._control_lines.put(line)
+
+    def process_control(self) -> bool:
+        """읽어 둔 제어 명령 처리 (quit이 있었으면 False)"""
+        while True:
+            try:
+                line = self._control_lines.get_nowait()
+            except queue.Empty:
+                return True
+            if not self.handle_command(line):
+                return False
+
+    def poll_status(self):
+        """워커 상태 큐 비우기"""
+        while True:
+            try:
+                status = self.status_queue.get_nowait()
+            except queue.Empty:
+                return
+            if "fatal" in status:
+                self.log(f"❌ [w{status['worker']}] 워커 시작 실패: {status['fatal']}")
+            self.worker_status[status["worker"]] = status
+
+    def aggregate(self) -> Dict[str, Any]:
+        """워커 상태 합산 (발행률은 직전 집계 이후 확인 수 기준)"""
+        totals = {"workers": self.workers, "alive": sum(1 for p in self.processes if p.is_alive()),
+                  "connected": 0, "published": 0, "acked": 0, "failed": 0, "bytes": 0, "errors": 0, "dropped": 0,
+                  "sink_rows": 0}
+        for status in self.worker_status.values():
+            totals["connected"] += 1 if status.get("connected") else 0
+            for key in ("published", "acked", "failed", "bytes", "errors", "dropped", "sink_rows"):
+                totals[key] += status.get(key, 0)
+
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        totals["rate"] = (totals["acked"] - self._last_acked) / elapsed if elapsed > 0 else 0.0
+        self._last_acked = totals["acked"]
+        self._last_time = now
+        return totals
+
+    def backfill_finished(self) -> bool:
+        """백필 모드에서 모든 워커가 가상 시계 끝까지 발행했는지"""
+        if not self.config.get("backfill") or len(self.worker_status) < self.workers:
+            return False
+        return all(status.get("backfill_done") for status in self.worker_status.values())
+
+    def report(self):
+        totals = self.aggregate()
+        self.log(f"🧩 워커 {totals['alive']}/{totals['workers']} (연결 {totals['connected']}), "
+                 f"발행 {totals['published']}건, 확인 {totals['acked']}건, 실패 {totals['failed']}건, "
+                 f"{totals['rate']:.0f} msg/s, 오류 {totals['errors']}건"
+                 + (f", 드롭 {totals['dropped']:,}건" if totals["dropped"] else "")
+                 + (f", 파일 {totals['sink_rows']:,}행" if totals["sink_rows"] else ""))
+
+    def shutdown(self, timeout: float = 10.0):
+        """모든 워커 종료 후 최종 상태 집계"""
+        self.broadcast("shutdown")
+        deadline = time.monotonic() + timeout
+        for process in self.processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+        self.poll_status()
+
+    def run_forever(self, duration: Optional[float] = None):
+        """헤드리스 실행: 워커 시작 → 생성 → (duration 경과 또는 Ctrl+C) → 종료"""
+        self.start_workers()
+        self.start()
+        if self.control:
+            threading.Thread(target=self._read_control, name="shard-control", daemon=True).start()
+            self.log(f"🎛️ 제어 명령 입력: {CONTROL_HELP}")
+        started = time.monotonic()
+        next_report = started + self.report_interval
+        try:
+            while any(p.is_alive() for p in self.processes):
+                now = time.monotonic()
+                if duration is not None and now - started >= duration:
+                    break
+                self.poll_status()
+                if self.backfill_finished() or not self.process_control():
+                    break
+                if now >= next_report:
+                    self.report()
+                    next_report += self.report_interval
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            self.log("⛔ 사용자 중단 요청")
+        finally:
+            self.shutdown()
+            self.report()
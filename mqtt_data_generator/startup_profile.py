@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import builtins
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+# 시작 시간 예산 (ms, 진입점 → 준비): 헤드리스 CLI는 엔진 생성까지, GUI는 첫 화면까지
+STARTUP_BUDGETS_MS = {
+    "cli": 400.0,
+    "gui": 800.0
+}
+
+# 보고서에 보여 줄 import 상위 모듈 수
+REPORT_TOP_MODULES = 15
+
+PROFILE_OPTION = "--profile-startup"
+
+
+def profile_requested(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """명령행에서 --profile-startup[=PATH] 찾기 → (보고서 경로 또는 '-'(표준 출력) 또는 None, 나머지 인자)
+
+    import 시간을 재려면 다른 모듈을 불러오기 전에 알아야 하므로 argparse보다 먼저 직접 찾아서 뺀다.
+    """
+    remaining = []
+    output = None
+    for arg in argv:
+        if arg == PROFILE_OPTION:
+            output = "-"
+        elif arg.startswith(PROFILE_OPTION + "="):
+            output = arg.partition("=")[2] or "-"
+        else:
+            remaining.append(arg)
+    return output, remaining
+
+
+def process_uptime() -> Optional[float]:
+    """프로세스 생성부터 지금까지 초 (인터프리터/실행 파일 압축 해제 시간 포함, 알 수 없으면 None)"""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/stat", "rb") as f:
+                # 2번째 필드(실행 파일 이름)에 공백이 있을 수 있어 ')' 뒤부터 나눔
+                fields = f.read().rpartition(b")")[2].split()
+            with open("/proc/uptime", "rb") as f:
+                uptime = float(f.read().split()[0])
+            return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            creation, exit_time, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.GetProcessTimes(kernel32.GetCurrentProcess(), ctypes.byref(creation),
+                                            ctypes.byref(exit_time), ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+            now = wintypes.FILETIME()
+            kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+
+            def ticks(filetime) -> int:
+                return (filetime.dwHighDateTime << 32) | filetime.dwLowDateTime
+
+            # FILETIME 단위는 100ns
+            return (ticks(now) - ticks(creation)) / 1e7
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return None
+
+
+class StartupProfiler:
+    """시작 단계별 시간과 모듈별 import 시간 측정 (-X importtime과 같은 누적/자체 시간)
+
+    builtins.__import__를 감싸 새 모듈을 불러온 import 문만 기록한다. 이미 불러온 모듈의 import는
+    바로 원래 함수로 넘기므로 측정 중 오버헤드는 새 모듈 수에 비례한다.
+    """
+
+    def __init__(self, kind: str = "cli", output: str = "-"):
+        self.kind = kind
+        self.output = output
+        self.started = time.perf_counter()
+        self.uptime_at_start = process_uptime()
+        # (모듈 이름, 누적 초, 자체 초, 깊이)
+        self.modules: List[Tuple[str, float, float, int]] = []
+        # (단계 이름, 시작부터 초)
+        self.phases: List[Tuple[str, float]] = []
+        self.finished = False
+        self._original_import = builtins.__import__
+        # import 중첩 깊이별 자식 import 누적 시간
+        self._child_time: List[float] = [0.0]
+
+    def install(self):
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._original_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        modules = sys.modules
+        if level == 0 and name in modules and not fromlist:
+            return self._original_import(name, globals, locals, fromlist, level)
+        count = len(modules)
+        self._child_time.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._child_time.pop()
+            self._child_time[-1] += elapsed
+            if len(modules) > count:
+                if level and globals:
+                    # from . import a, b 형태는 이름이 비어 있으므로 불러온 항목 이름으로 표시
+                    if not name and fromlist:
+                        name = fromlist[0] + (f" 외 {len(fromlist) - 1}개" if len(fromlist) > 1 else "")
+                    name = f"{globals.get('__package__') or ''}.{name}".strip(".")
+                self.modules.append((name, elapsed, elapsed - children, len(self._child_time) - 1))
+
+    def mark(self, phase: str):
+        """단계 끝 시각 기록"""
+        self.phases.append((phase, time.perf_counter() - self.started))
+
+    def report_lines(self) -> List[str]:
+        total_ms = (self.phases[-1][1] if self.phases else time.perf_counter() - self.started) * 1000
+        budget = STARTUP_BUDGETS_MS.get(self.kind)
+        verdict = ""
+        if budget is not None:
+            verdict = f" (예산 {budget:.0f}ms {'✅' if total_ms <= budget else '⚠️ 초과'})"
+        lines = [f"🚀 시작 시간: 준비까지 {total_ms:.1f}ms{verdict}"]
+        if self.uptime_at_start is not None:
+            lines.append(f"  프로세스 생성 → 진입점: {self.uptime_at_start * 1000:.1f}ms "
+                         f"(인터프리터 초기화, 단일 파일 실행 파일이면 압축 해제 포함)")
+        previous = 0.0
+        for phase, at in self.phases:
+            lines.append(f"  {phase}: {(at - previous) * 1000:.1f}ms")
+            previous = at
+
+        top_level = [entry for entry in self.modules if entry[3] == 0]
+        import_total = sum(entry[1] for entry in top_level)
+        lines.append(f"  import: 새 모듈 {len(self.modules):,}개, {import_total * 1000:.1f}ms "
+                     f"(누적 상위 {REPORT_TOP_MODULES}개, 괄호는 자체 시간)")
+        for name, cumulative, own, depth in sorted(self.modules, key=lambda entry: -entry[1])[:REPORT_TOP_MODULES]:
+            lines.append(f"    {cumulative * 1000:8.1f}ms ({own * 1000:6.1f}ms) {'  ' * min(depth, 4)}{name}")
+        return lines
+
+    def finish(self, phase: str, log: Optional[Callable[[str], None]] = None):
+        """마지막 단계 기록 후 측정 종료, 보고서 출력 (output '-'는 표준 출력, 그 외 파일 경로)"""
+        if self.finished:
+            return
+        self.finished = True
+        self.mark(phase)
+        self.uninstall()
+        lines = self.report_lines()
+        if log:
+            for line in lines:
+                log(line)
+        if self.output == "-":
+            if not log:
+                print("\n".join(lines), flush=True)
+        else:
+            with open(self.output, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def start_profiling(kind: str, output: str) -> StartupProfiler:
+    """측정 시작 (진입점에서 다른 모듈을 불러오기 전에 호출)"""
+    global _profiler
+    _profiler = StartupProfiler(kind, output)
+    _profiler.install()
+    return _profiler
+
+
+def mark(phase: str):
+    """측정 중이면 단계 기록 (측정하지 않으면 아무것도 안 함)"""
+    if _profiler and not _profiler.finished:
+        _profiler.mark(phase)
+
+
+def finish(phase: str = "준비", log: Optional[Callable[[str], None]] = None):
+    """측정 중이면 종료하고 보고 (여러 번 호출해도 한 번만 보고)"""
+    if _profiler:
+        _profiler.finish(phase, log)
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from sensor_types import SENSOR_TYPES_BY_CODE
+from defaults import DEFAULT_CHECKPOINT_INTERVAL
+
+if TYPE_CHECKING:
+    from generator_engine import GeneratorEngine
+
+# 체크포인트 파일 헤더 (매직, 메타데이터 JSON 오프셋, 길이)
+CHECKPOINT_MAGIC = b"HDMSCKP1"
+CHECKPOINT_HEADER = struct.Struct("<8sQQ")
+
+# 엔진 체크포인트 메타데이터의 종류 표시 (v1 GUI 체크포인트와 구분)
+ENGINE_CHECKPOINT_KIND = "engine"
+
+# 구역 시작 정렬 (바이트) 및 메모리 맵 복사 단위 (복사 사이에 생성 스레드가 GIL을 잡을 수 있게)
+SECTION_ALIGN = 64
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def _align(offset: int) -> int:
+    return (offset + SECTION_ALIGN - 1) // SECTION_ALIGN * SECTION_ALIGN
+
+
+def write_checkpoint(path: str, meta: Dict[str, Any], sections: Dict[str, Tuple[str, Any]]) -> int:
+    """메타데이터(JSON)와 이진 구역들을 체크포인트 파일 하나로 저장하고 크기 반환
+
+    sections: 구역 이름 → (array 형식 코드, 버퍼 객체). 파일 배치는 헤더 → 정렬된 구역들 → 메타데이터이며,
+    구역 위치는 메타데이터의 "sections"에 기록한다. 임시 파일을 메모리 맵으로 채운 뒤 헤더를 마지막에 쓰고
+    이름을 바꾸므로, 저장 도중 종료되어도 이전 체크포인트가 그대로 남는다.
+    """
+    views = {}
+    layout = {}
+    offset = _align(CHECKPOINT_HEADER.size)
+    for name, (typecode, data) in sections.items():
+        view = memoryview(data).cast("B")
+        views[name] = view
+        layout[name] = [typecode, offset, view.nbytes]
+        offset = _align(offset + view.nbytes)
+    meta_bytes = json.dumps(dict(meta, sections=layout), ensure_ascii=False).encode("utf-8")
+    total = offset + len(meta_bytes)
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "w+b") as f:
+        f.truncate(total)
+        with mmap.mmap(f.fileno(), total) as mapped:
+            for name, view in views.items():
+                start = layout[name][1]
+                for chunk_start in range(0, view.nbytes, COPY_CHUNK_BYTES):
+                    chunk = view[chunk_start:chunk_start + COPY_CHUNK_BYTES]
+                    mapped[start + chunk_start:start + chunk_start + chunk.nbytes] = chunk
+            mapped[offset:total] = meta_bytes
+            mapped[:CHECKPOINT_HEADER.size] = CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, offset, len(meta_bytes))
+            mapped.flush()
+    os.replace(temp_path, path)
+    return total
+
+
+class CheckpointReader:
+    """체크포인트 파일을 메모리 맵으로 열어 필요한 구역만 복사해 읽음"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < CHECKPOINT_HEADER.size:
+                raise ValueError(f"체크포인트 파일 형식이 아닙니다: {path}")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, offset, length = CHECKPOINT_HEADER.unpack_from(self._map, 0)
+            if magic != CHECKPOINT_MAGIC or offset + length > size:
+                raise ValueError(f"체크포인트 파일 형식이 아닙니다: {path}")
+            self.meta: Dict[str, Any] = json.loads(self._map[offset:offset + length].decode("utf-8"))
+            self.sections: Dict[str, list] = self.meta.pop("sections")
+        except (ValueError, KeyError):
+            self.close()
+            raise
+
+    def __enter__(self) -> "CheckpointReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sections
+
+    def raw(self, name: str) -> bytes:
+        """구역 바이트 복사본 (없는 구역이면 ValueError)"""
+        if name not in self.sections:
+            raise ValueError(f"체크포인트에 '{name}' 구역이 없습니다: {self.path}")
+        _, offset, length = self.sections[name]
+        return self._map[offset:offset + length]
+
+    def array(self, name: str) -> array:
+        data = self.raw(name)
+        column = array(self.sections[name][0])
+        column.frombytes(data)
+        return column
+
+    def ndarray(self, name: str) -> np.ndarray:
+        return np.frombuffer(self.raw(name), dtype=self.sections[name][0]).copy()
+
+
+def _random_state_to_json(state: tuple) -> list:
+    """random.Random.getstate() 튜플 → JSON 목록 (NumPy 비트 생성기 상태는 딕셔너리라 그대로 저장)"""
+    return [state[0], list(state[1])] + list(state[2:])
+
+
+def _random_state_from_json(state: list) -> tuple:
+    return (state[0], tuple(state[1])) + tuple(state[2:])
+
+
+def _serialize_structure(snapshot: Dict[str, Any]) -> Dict[str, Tuple[str, Any]]:
+    """센서 구성 구역 (ID/타입/변동 범위/이름/페이로드 조각/ID 해시), 잠금 밖에서 직렬화
+
+    이름과 페이로드 조각은 NUL로 이어 붙인다. 페이로드 조각은 JSON이라 NUL이 이스케이프되어 들어갈 수 없고,
+    이름에 NUL이 있을 때만 바이트 끝 위치 구역(name_ends)을 따로 둔다.
+    """
+    names = snapshot["names"]
+    encoded_names = "\0".join(names).encode("utf-8")
+    sections = {
+        "ids": ("q", snapshot["ids"]),
+        "type_codes": ("b", snapshot["type_codes"]),
+        "variations": ("d", snapshot["variations"]),
+        "names": ("B", encoded_names),
+        "payload_heads": ("B", b"\0".join(snapshot["payload_heads"])),
+        "index_keys": ("q", snapshot["index_keys"]),
+        "index_values": ("q", snapshot["index_values"])
+    }
+    if names and encoded_names.count(b"\0") != len(names) - 1:
+        ends = np.cumsum([len(name.encode("utf-8")) + 1 for name in names], dtype=np.int64) - 1
+        sections["name_ends"] = ("q", ends)
+    return sections
+
+
+def capture_engine_state(engine: "GeneratorEngine", with_structure: bool) -> Dict[str, Any]:
+    """엔진 값 상태 스냅샷 (registry.lock 안에서 호출, 배열은 memcpy 복사본이라 잠금 밖에서 써도 안전)
+
+    with_structure가 False면 센서 구성 열은 빼고 매 틱 바뀌는 열/카운터/난수 상태만 복사한다.
+    """
+    registry = engine.registry
+    tick_engine = engine.tick_engine
+    snapshot: Dict[str, Any] = {
+        "version": registry.version,
+        "base_values": registry.base_values[:],
+        "trends": registry.trends[:],
+        "last_values": registry.last_values[:],
+        "meta": {
+            "kind": ENGINE_CHECKPOINT_KIND,
+            "saved_at": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "sensor_count": len(registry),
+            "tick": tick_engine.tick,
+            "seed": tick_engine.seed,
+            "tick_rng": tick_engine.rng.bit_generator.state,
+            "value_rng": _random_state_to_json(engine.rng.getstate()),
+            "sensor_values": {name: values[name] for name, values in engine.sensor_values.items()},
+            "sensor_trends": dict(engine.sensor_trends)
+        }
+    }
+    if with_structure:
+        snapshot.update(
+            ids=registry.ids[:],
+            type_codes=registry.type_codes[:],
+            variations=registry.variations[:],
+            names=list(registry.names),
+            payload_heads=list(registry.payload_heads),
+            index_keys=registry.index.keys[:],
+            index_values=registry.index.values[:]
+        )
+    aux_engine = engine.aux_engine
+    if aux_engine:
+        # 부가 필드 랜덤 워크 상태 (타입 코드 → 센서 ID, 센서 × 필드 행렬)
+        snapshot["aux"] = aux_engine.snapshot_state()
+        snapshot["meta"]["aux_rng"] = aux_engine.rng.bit_generator.state
+    return snapshot
+
+
+def restore_engine_state(engine: "GeneratorEngine", path: str) -> Dict[str, Any]:
+    """체크포인트로 센서 구성/값 상태/틱/난수 상태를 복원하고 메타데이터 반환 (잘못된 파일이면 ValueError)
+
+    페이로드 조각과 ID 해시를 저장한 그대로 쓰므로 센서 수에 비례하는 재계산이 없다.
+    시드 모드는 (시드, 틱)으로 같은 값이 이어지고, 시드 없는 모드는 난수 생성기 상태로 이어진다.
+    센서 타입은 체크포인트에 없으므로 사용자 정의 타입은 설정(sensor_types)으로 먼저 등록해야 한다.
+    """
+    registry = engine.registry
+    with CheckpointReader(path) as reader:
+        meta = reader.meta
+        if meta.get("kind") != ENGINE_CHECKPOINT_KIND:
+            raise ValueError(f"생성 엔진 체크포인트가 아닙니다: {path}")
+        count = int(meta["sensor_count"])
+        type_codes = reader.array("type_codes")
+        unknown = sorted(set(type_codes) - set(SENSOR_TYPES_BY_CODE))
+        if unknown:
+            raise ValueError(f"체크포인트의 센서 타입 코드 {unknown}가 등록되어 있지 않습니다 (설정의 sensor_types 확인)")
+
+        encoded_names = reader.raw("names")
+        if "name_ends" in reader:
+            ends = reader.array("name_ends").tolist()
+            starts = [0] + [end + 1 for end in ends[:-1]]
+            names = [encoded_names[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+        else:
+            names = encoded_names.decode("utf-8").split("\0") if count else []
+        heads = reader.raw("payload_heads").split(b"\0") if count else []
+        columns = {name: reader.array(name) for name in ("ids", "base_values", "variations", "trends", "last_values")}
+        if any(len(column) != count for column in columns.values()) or len(names) != count or len(heads) != count:
+            raise ValueError(f"체크포인트 열 길이가 센서 수({count:,})와 다릅니다: {path}")
+        registry.restore(columns["ids"], type_codes, columns["base_values"], columns["variations"],
+                         columns["trends"], columns["last_values"], names, heads,
+                         reader.array("index_keys"), reader.array("index_values"))
+
+        aux_state = {}
+        for code, shape in meta.get("aux_types", {}).items():
+            aux_state[int(code)] = (reader.ndarray(f"aux_ids:{code}"),
+                                    reader.ndarray(f"aux_state:{code}").reshape(shape))
+
+    for name, value in meta["sensor_values"].items():
+        if name in engine.sensor_values:
+            engine.sensor_values[name][name] = value
+    engine.sensor_trends.update((name, trend) for name, trend in meta["sensor_trends"].items()
+                                if name in engine.sensor_trends)
+
+    # 시드/틱 지정 후 (시드 모드에서는 다음 틱 트렌드를 스트림에서 다시 맞춤) 난수 상태를 저장 시점으로 되돌림
+    engine.set_seed(meta["seed"], meta["tick"])
+    engine.tick_engine.rng.bit_generator.state = meta["tick_rng"]
+    engine.rng.setstate(_random_state_from_json(meta["value_rng"]))
+    if engine.aux_engine and "aux_rng" in meta:
+        engine.aux_engine.rng.bit_generator.state = meta["aux_rng"]
+        engine.aux_engine.restore_state(aux_state)
+    return meta
+
+
+class StateCheckpointer:
+    """엔진 상태를 주기적으로 체크포인트 파일에 저장하는 백그라운드 저장기
+
+    registry.lock 안에서는 열 복사만 하고 (센서 100만 개에서 수 ms), 이름/페이로드 조각 직렬화와
+    파일 쓰기는 잠금 밖 저장 스레드에서 한다. 센서 구성(레지스트리 version)이 그대로면
+    직렬화해 둔 구성 구역을 다시 쓰므로 매번 새로 만드는 것은 값/트렌드 열과 난수 상태뿐이다.
+    """
+
+    def __init__(self, engine: "GeneratorEngine", path: str, interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+                 log: Optional[Callable[[str], None]] = None):
+        if interval <= 0:
+            raise ValueError("체크포인트 저장 주기는 0보다 커야 합니다.")
+        self.engine = engine
+        self.path = path
+        self.interval = interval
+        self.log = log or print
+        self._structure_version = -1
+        self._structure_sections: Dict[str, Tuple[str, Any]] = {}
+        self._save_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.saves = 0
+        self.bytes_written = 0
+        # 마지막 저장의 잠금 유지 시간 / 전체 소요 시간 (초)
+        self.last_hold = 0.0
+        self.last_duration = 0.0
+        self.max_hold = 0.0
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="state-checkpoint", daemon=True)
+        self._thread.start()
+
+    def stop(self, final_save: bool = True):
+        """저장 스레드 종료 (final_save면 마지막 상태를 한 번 더 저장)"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=30)
+            self._thread = None
+        if final_save:
+            self.save_safely()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.save_safely()
+
+    def save_safely(self) -> bool:
+        try:
+            self.save()
+            return True
+        except (OSError, ValueError) as e:
+            self.log(f"❌ 체크포인트 저장 실패: {e}")
+            return False
+
+    def save(self) -> int:
+        """지금 상태 저장 후 파일 크기 반환"""
+        with self._save_lock:
+            started = time.perf_counter()
+            registry = self.engine.registry
+            with registry.lock:
+                locked = time.perf_counter()
+                snapshot = capture_engine_state(self.engine, registry.version != self._structure_version)
+                self.last_hold = time.perf_counter() - locked
+            self.max_hold = max(self.max_hold, self.last_hold)
+
+            if "ids" in snapshot:
+                self._structure_sections = _serialize_structure(snapshot)
+                self._structure_version = snapshot["version"]
+            sections = dict(self._structure_sections)
+            sections.update(
+                base_values=("d", snapshot["base_values"]),
+                trends=("d", snapshot["trends"]),
+                last_values=("d", snapshot["last_values"])
+            )
+            meta = snapshot["meta"]
+            if "aux" in snapshot:
+                meta["aux_types"] = {}
+                for code, (ids, matrix) in snapshot["aux"].items():
+                    meta["aux_types"][str(code)] = list(matrix.shape)
+                    sections[f"aux_ids:{code}"] = ("q", ids)
+                    sections[f"aux_state:{code}"] = ("d", np.ascontiguousarray(matrix))
+
+            size = write_checkpoint(self.path, meta, sections)
+            self.saves += 1
+            self.bytes_written += size
+            self.last_duration = time.perf_counter() - started
+            return size
+
+    def describe(self) -> str:
+        size = self.bytes_written / self.saves / (1024 * 1024) if self.saves else 0.0
+        return (f"{self.path}: {self.saves:,}회 저장, 회당 {size:,.1f}MB, 마지막 {self.last_duration * 1000:.1f}ms "
+                f"(생성 잠금 최대 {self.max_hold * 1000:.1f}ms)")
+
+
+def describe_checkpoint(meta: Dict[str, Any]) -> str:
+    """복원한 체크포인트 요약 (로그용)"""
+    seed = "없음" if meta["seed"] is None else meta["seed"]
+    return f"센서 {meta['sensor_count']:,}개, 틱 {meta['tick']:,}, 시드 {seed} (저장 {meta['saved_at']})"
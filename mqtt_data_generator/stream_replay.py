@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import mmap
+import struct
+import time
+from typing import Iterator, List, Optional, Tuple
+
+# 녹화 파일 헤더와 레코드 머리 (발행 시각 ns 오프셋, 센서 ID int64, 토픽 길이, 페이로드 길이)
+RECORDING_MAGIC = b"HDMSREC2"
+RECORD_HEADER = struct.Struct("<qqHI")
+
+# 이전 형식 (센서 ID uint32) 녹화 파일도 읽기 위한 매직 → 레코드 머리
+RECORD_HEADERS = {
+    b"HDMSREC1": struct.Struct("<qIHI"),
+    RECORDING_MAGIC: RECORD_HEADER
+}
+
+# 녹화 파일 쓰기 버퍼 크기
+RECORD_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+class StreamRecorder:
+    """발행한 메시지(토픽, 페이로드 바이트, 발행 시각)를 그대로 녹화
+
+    생성 스레드에서 발행 직후 배치 단위로 호출되며, 버퍼드 파일에 이어 쓰기만 한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "wb", buffering=RECORD_BUFFER_SIZE)
+        self._file.write(RECORDING_MAGIC)
+        self._started = time.monotonic_ns()
+        self.records = 0
+        self.bytes_written = len(RECORDING_MAGIC)
+
+    def write(self, messages: List[Tuple[int, str, bytes]]):
+        """(센서 ID, 토픽, 페이로드) 배치 기록 (배치는 같은 발행 시각)"""
+        offset = time.monotonic_ns() - self._started
+        pack = RECORD_HEADER.pack
+        parts = []
+        for sensor_id, topic, payload in messages:
+            topic_bytes = topic.encode("utf-8")
+            parts.append(pack(offset, sensor_id, len(topic_bytes), len(payload)))
+            parts.append(topic_bytes)
+            parts.append(payload)
+        block = b"".join(parts)
+        self._file.write(block)
+        self.records += len(messages)
+        self.bytes_written += len(block)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class RecordingReader:
+    """녹화 파일을 메모리 맵으로 열어 순회 (파일 전체를 읽어 들이지 않음)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            magic = f.read(len(RECORDING_MAGIC))
+            if magic not in RECORD_HEADERS:
+                raise ValueError(f"녹화 파일 형식이 아닙니다: {path}")
+            self.header = RECORD_HEADERS[magic]
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        """파일 크기 (bytes)"""
+        return len(self._map)
+
+    def records(self, topic_prefix: Optional[str] = None) -> Iterator[Tuple[int, int, str, bytes, int]]:
+        """(발행 시각 ns 오프셋, 센서 ID, 토픽, 페이로드, 다음 레코드 위치) 순회
+
+        topic_prefix를 주면 토픽의 첫 단계(HS 등)를 바꿔 다른 환경으로 재생한다.
+        """
+        data = self._map
+        unpack_from = self.header.unpack_from
+        header_size = self.header.size
+        end = len(data)
+        position = len(RECORDING_MAGIC)
+        while position + header_size <= end:
+            offset, sensor_id, topic_length, payload_length = unpack_from(data, position)
+            position += header_size
+            topic = data[position:position + topic_length].decode("utf-8")
+            position += topic_length
+            payload = data[position:position + payload_length]
+            position += payload_length
+            if len(payload) < payload_length:
+                # 녹화 중 중단되어 잘린 마지막 레코드
+                return
+            if topic_prefix is not None:
+                topic = topic_prefix + topic[topic.find("/"):]
+            yield offset, sensor_id, topic, payload, position
+
+    def close(self):
+        self._map.close()
+
+
+def parse_speed(text: str) -> float:
+    """재생 속도 파싱 (1, 10, 0.5 등 배율 또는 max = 대기 없이 최대 속도 → 0.0)"""
+    if str(text).lower() == "max":
+        return 0.0
+    try:
+        speed = float(text)
+    except ValueError:
+        raise ValueError(f"잘못된 재생 속도입니다: {text} (예: 1, 10, max)")
+    if speed <= 0:
+        raise ValueError("재생 속도는 0보다 커야 합니다 (최대 속도는 max).")
+    return speed
+
+
+class StreamReplayer:
+    """녹화 스트림을 원래 간격 × 1/speed로 다시 발행 (speed 0은 대기 없이 최대 속도)
+
+    발행은 생성 엔진의 연결(단일 클라이언트 또는 연결 풀)과 발행 통계를 그대로 사용한다.
+    원래 같은 시각에 발행된 배치는 다시 한 번에 발행하며, 최대 속도에서는 백필 모드처럼
+    브로커 미확인 메시지 수로만 속도를 조절한다.
+    """
+
+    # 진행 보고 주기 (초)
+    REPORT_INTERVAL = 5.0
+
+    def __init__(self, engine, reader: RecordingReader, speed: float = 1.0, topic_prefix: Optional[str] = None):
+        self.engine = engine
+        self.reader = reader
+        self.speed = speed
+        self.topic_prefix = topic_prefix
+        self.replayed = 0
+        self.finished = False
+
+    def run(self, should_continue=lambda: True):
+        engine = self.engine
+        speed = self.speed
+        started = time.monotonic()
+        next_report = started + self.REPORT_INTERVAL
+        batch: List[Tuple[int, str, bytes]] = []
+        batch_offset = None
+        position = 0
+
+        def flush():
+            engine.publish_messages(batch[:])
+            self.replayed += len(batch)
+            batch.clear()
+            if not speed:
+                engine.wait_for_in_flight(engine.BACKFILL_MAX_IN_FLIGHT)
+
+        for offset, sensor_id, topic, payload, position in self.reader.records(self.topic_prefix):
+            if offset != batch_offset:
+                if batch:
+                    flush()
+                if not should_continue():
+                    break
+                batch_offset = offset
+                if speed:
+                    # 원래 발행 시각까지 대기 (시작 시각 기준 누적, 발행 처리 시간만큼 밀리지 않음)
+                    delay = started + offset / 1e9 / speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+
+                now = time.monotonic()
+                if now >= next_report:
+                    self.report(position, now - started)
+                    next_report += self.REPORT_INTERVAL
+            batch.append((sensor_id, topic, payload))
+        else:
+            if batch:
+                flush()
+            engine.wait_for_in_flight(0, timeout=30.0)
+            self.finished = True
+
+        self.report(position, time.monotonic() - started)
+
+    def report(self, position: int, elapsed: float):
+        progress = position / len(self.reader) * 100 if len(self.reader) else 100.0
+        rate = self.replayed / elapsed if elapsed > 0 else 0.0
+        self.engine.log(f"🔁 재생 {'완료' if self.finished else '진행'}: {self.replayed:,}건 ({progress:.1f}%), "
+                        f"{rate:,.0f} msg/s")
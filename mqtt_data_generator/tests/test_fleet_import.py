@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from fleet_import import MAX_REPORTED_ERRORS, SensorDefinition, load_fleet, parse_definitions
+from sensor_types import SENSOR_TYPE_CODES, SENSOR_TYPE_NAMES
+
+
+def _rows(*rows):
+    return [(f"[{position}]", row) for position, row in enumerate(rows)]
+
+
+def test_parses_names_codes_and_optional_values():
+    code = SENSOR_TYPE_CODES["humidity"]
+    definitions = parse_definitions(_rows(
+        {"id": "7", "type": "temperature", "name": "t7", "base_value": "21.5"},
+        {"id": 8, "type": str(code), "name": "h8", "variation": ""},
+    ))
+    assert definitions == [
+        SensorDefinition("temperature", 7, "t7", 21.5, None),
+        SensorDefinition(SENSOR_TYPE_NAMES[code], 8, "h8", None, None),
+    ]
+
+
+def test_duplicate_id_reports_first_position():
+    with pytest.raises(ValueError) as excinfo:
+        parse_definitions(_rows(
+            {"id": 1, "type": "temperature", "name": "a"},
+            {"id": 2, "type": "temperature", "name": "b"},
+            {"id": 1, "type": "humidity", "name": "c"},
+        ))
+    message = str(excinfo.value)
+    assert message.startswith("센서 정의 오류 1건:")
+    assert "[2]: 센서 ID 1 중복 (처음 나온 위치: [0])" in message
+
+
+def test_collects_every_row_error():
+    with pytest.raises(ValueError) as excinfo:
+        parse_definitions(_rows(
+            {"id": "x", "type": "temperature", "name": "a"},
+            {"id": 2, "type": "bogus", "name": "b"},
+            {"id": 3, "type": "temperature", "name": " "},
+            {"id": 4, "type": "temperature", "name": "d", "variation": -1},
+            "not a row",
+            {"id": 5, "type": "temperature", "name": "ok"},
+        ))
+    lines = str(excinfo.value).splitlines()
+    assert lines[0] == "센서 정의 오류 5건:"
+    assert lines[1] == "[0]: 센서 ID가 정수가 아닙니다: 'x'"
+    assert lines[2] == "[1]: 알 수 없는 센서 타입 'bogus'"
+    assert lines[3] == "[2]: 센서 이름이 비어 있습니다"
+    assert lines[4] == "[3]: 변동 범위는 0 이상이어야 합니다"
+    assert lines[5] == "[4]: 센서 정의는 객체여야 합니다"
+
+
+def test_error_report_is_truncated():
+    count = MAX_REPORTED_ERRORS + 3
+    with pytest.raises(ValueError) as excinfo:
+        parse_definitions(_rows(*[{"id": i, "type": "bogus", "name": "s"} for i in range(count)]))
+    lines = str(excinfo.value).splitlines()
+    assert lines[0] == f"센서 정의 오류 {count}건:"
+    assert len(lines) == MAX_REPORTED_ERRORS + 2
+    assert lines[-1] == "... 외 3건"
+
+
+def test_load_fleet_reports_typed_mapping_positions(tmp_path):
+    path = tmp_path / "fleet.json"
+    path.write_text(json.dumps({"sensors": {"temperature": [
+        {"id": 1, "name": "a"},
+        {"id": 1, "name": "b"},
+    ]}}), encoding="utf-8")
+    with pytest.raises(ValueError, match=r"temperature\[1\]: 센서 ID 1 중복 \(처음 나온 위치: temperature\[0\]\)"):
+        load_fleet(str(path))
+
+
+def test_load_fleet_rejects_unknown_extension(tmp_path):
+    path = tmp_path / "fleet.txt"
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="지원하지 않는 센서 목록 형식"):
+        load_fleet(str(path))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+import pytest
+
+from inflight_window import InFlightWindow
+
+
+def _publish(window: InFlightWindow, keys):
+    for key in keys:
+        window.track(key)
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        InFlightWindow(10, "queue")
+    with pytest.raises(ValueError):
+        InFlightWindow(0)
+    with pytest.raises(ValueError):
+        InFlightWindow(InFlightWindow.MAX_WINDOW + 1)
+
+
+def test_block_waits_for_release():
+    window = InFlightWindow(2, "block")
+    assert window.admit(5) == 2
+    _publish(window, [(0, 1), (0, 2)])
+    assert window.depth == 2
+
+    released = threading.Timer(0.2, window.release, args=((0, 1),))
+    started = time.monotonic()
+    released.start()
+    assert window.admit(1) == 1
+    assert time.monotonic() - started >= 0.15
+    assert window.depth == 2
+    assert window.dropped == 0
+
+
+def test_block_stops_waiting_when_interrupted():
+    window = InFlightWindow(1, "block")
+    window.admit(1)
+    threading.Timer(0.1, window.interrupt).start()
+    # 중지되면 기다리지 않고 요청한 만큼 내보냄
+    assert window.admit(3) == 3
+    window.resume()
+    assert window.admit(1, should_wait=lambda: False) == 1
+
+
+def test_drop_discards_overflow():
+    window = InFlightWindow(3, "drop")
+    assert window.admit(5) == 3
+    assert window.dropped == 2
+    _publish(window, [(0, 1), (0, 2), (0, 3)])
+    assert window.admit(1) == 0
+    assert window.dropped == 3
+
+    window.release((0, 2))
+    assert window.admit(4) == 1
+    assert window.dropped == 6
+
+
+def test_slow_halves_factor_and_allows_double_window():
+    window = InFlightWindow(4, "slow")
+    assert window.admit(4) == 4
+    assert window.slow_factor == 1.0
+    # 창이 찼을 때 조절 주기가 되면 배율 절반, 창의 2배까지는 기다리지 않음
+    window._next_adjust = 0.0
+    assert window.admit(10, should_wait=lambda: False) == 4
+    assert window.slow_factor == 0.5
+    assert window.depth == 8
+
+    window.reset()
+    assert window.depth == 0
+    assert window.slow_factor == 1.0
+
+
+def test_early_ack_before_track_frees_slot():
+    window = InFlightWindow(2, "drop")
+    assert window.admit(1) == 1
+    # publish()가 mid를 돌려주기 전에 PUBACK이 먼저 온 경우
+    window.release((0, 7))
+    window.track((0, 7))
+    assert window.depth == 0
+    assert window.admit(2) == 2
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+from latency_metrics import LatencyHistogram, LatencyTracker
+
+
+def _histogram(values):
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def _exact_percentile(values, percent):
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def test_empty_histogram_is_zero():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0
+    assert histogram.summary()["count"] == 0
+
+
+def test_small_values_are_exact():
+    values = list(range(LatencyHistogram.SUB_BUCKETS))
+    histogram = _histogram(values)
+    for percent in (1, 25, 50, 75, 99, 100):
+        assert histogram.percentile(percent) == _exact_percentile(values, percent)
+
+
+def test_bucket_upper_bounds_its_values():
+    for value in [0, 1, 15, 16, 17, 31, 32, 1000, 123456, 2 ** 40 + 7]:
+        index = LatencyHistogram.bucket_index(value)
+        assert value <= LatencyHistogram.bucket_upper(index)
+        if index:
+            assert LatencyHistogram.bucket_upper(index - 1) < value
+
+
+@pytest.mark.parametrize("percent", [50.0, 90.0, 95.0, 99.0, 99.9])
+def test_percentile_relative_error(percent):
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(8, 1.5)) for _ in range(20000)]
+    exact = _exact_percentile(values, percent)
+    estimate = _histogram(values).percentile(percent)
+    # 버킷 상한을 돌려주므로 실제 값 이상, 하위 버킷 폭(1/16) 이내
+    assert exact <= estimate <= exact * (1 + 1 / LatencyHistogram.SUB_BUCKETS)
+
+
+def test_percentile_never_exceeds_max():
+    histogram = _histogram([1000, 1001, 1002])
+    assert histogram.percentile(100) == 1002
+    assert histogram.percentile(99.99) == 1002
+
+
+def test_negative_values_clamp_to_zero():
+    histogram = _histogram([-5, 10])
+    assert histogram.percentile(50) == 0
+    assert histogram.total == 10
+
+
+def test_merge_matches_single_histogram():
+    rng = random.Random(3)
+    left = [rng.randrange(1, 10 ** 6) for _ in range(5000)]
+    right = [rng.randrange(1, 10 ** 4) for _ in range(5000)]
+    merged = _histogram(left)
+    merged.merge(_histogram(right))
+    whole = _histogram(left + right)
+    assert merged.counts == whole.counts
+    assert merged.summary() == whole.summary()
+
+
+def test_summary_reports_milliseconds():
+    summary = _histogram([2000] * 10).summary()
+    assert summary["count"] == 10
+    assert summary["max"] == 2.0
+    assert summary["avg"] == 2.0
+    assert summary["p50"] == 2.0
+
+
+def test_tracker_records_early_ack():
+    tracker = LatencyTracker()
+    # PUBACK이 stamp()보다 먼저 처리돼도 한 건으로 기록
+    tracker.acked((0, 1))
+    tracker.stamp((0, 1), sensor_id=5, sent_ns=0)
+    tracker.stamp((0, 2), sensor_id=5, sent_ns=0)
+    tracker.acked((0, 2))
+    assert tracker.combined().count == 2
+    assert [(name, connection) for name, connection, _ in tracker.snapshots()] == [("unknown", 0)]
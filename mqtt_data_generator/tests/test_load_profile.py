@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+
+from load_profile import ConstantProfile, RateScheduler, parse_profile
+
+
+class _Batcher:
+    """emit은 모으기만 하고 flush에서 한 번에 발행하는 발행기 흉내"""
+
+    def __init__(self, limit, emit_delay=0.0, flush_delay=0.0):
+        self.limit = limit
+        self.emit_delay = emit_delay
+        self.flush_delay = flush_delay
+        self.emitted = 0
+        self.pending = 0
+        self.batches = []
+
+    def emit(self):
+        self.emitted += 1
+        self.pending += 1
+        if self.emit_delay:
+            time.sleep(self.emit_delay)
+
+    def flush(self):
+        if self.flush_delay:
+            time.sleep(self.flush_delay)
+        self.batches.append(self.pending)
+        self.pending = 0
+
+    def should_continue(self):
+        return self.emitted < self.limit
+
+
+def test_parse_profile():
+    assert parse_profile("constant:500").rate_at(3.0) == 500
+    with pytest.raises(ValueError):
+        parse_profile("constant:fast")
+    with pytest.raises(ValueError):
+        RateScheduler(ConstantProfile(1), arrival="burst")
+
+
+def test_overload_flushes_by_message_budget():
+    scheduler = RateScheduler(ConstantProfile(10_000_000))
+    scheduler.FLUSH_MESSAGES = 50
+    scheduler.FLUSH_INTERVAL = 3600.0
+    batcher = _Batcher(500)
+    scheduler.run(batcher.emit, batcher.should_continue, flush=batcher.flush)
+
+    # 목표를 못 따라가 대기가 한 번도 없어도 50건마다 발행
+    assert [size for size in batcher.batches if size] == [50] * 10
+    assert batcher.pending == 0
+    assert scheduler.stats.sent == 500
+
+
+def test_overload_flushes_by_time_budget():
+    scheduler = RateScheduler(ConstantProfile(10_000_000))
+    scheduler.FLUSH_INTERVAL = 0.01
+    batcher = _Batcher(60, emit_delay=0.002)
+    scheduler.run(batcher.emit, batcher.should_continue, flush=batcher.flush)
+
+    sizes = [size for size in batcher.batches if size]
+    assert len(sizes) >= 5
+    assert max(sizes) < scheduler.FLUSH_MESSAGES
+    assert sum(sizes) == scheduler.stats.sent == 60
+
+
+def test_lag_is_measured_at_publish_time():
+    scheduler = RateScheduler(ConstantProfile(10_000_000), miss_threshold=0.01)
+    scheduler.FLUSH_MESSAGES = 10
+    batcher = _Batcher(30, flush_delay=0.03)
+    scheduler.run(batcher.emit, batcher.should_continue, flush=batcher.flush)
+
+    summary = scheduler.stats.summary()
+    # flush가 걸린 시간만큼 모아 둔 메시지 모두 늦게 발행된 것으로 집계
+    assert summary["lag_max_ms"] >= 30
+    assert summary["missed"] == 30
+
+
+def test_underload_flushes_before_waiting():
+    scheduler = RateScheduler(ConstantProfile(200))
+    batcher = _Batcher(10)
+    scheduler.run(batcher.emit, batcher.should_continue, flush=batcher.flush)
+
+    assert [size for size in batcher.batches if size] == [1] * 10
+    summary = scheduler.stats.summary()
+    assert summary["sent"] == 10
+    assert summary["lag_max_ms"] < 50
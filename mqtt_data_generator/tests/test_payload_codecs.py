@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import json
+import struct
+
+import pytest
+
+from payload_codecs import CborCodec, JsonCodec, MsgpackCodec, StructCodec, make_timestamp
+from payload_encoder import PayloadEncoder, STATUS_NORMAL, STATUS_OFFLINE
+
+# (센서 ID, epoch ms): 음수/32비트 초과 ID, 1970년 이전 시각 포함
+CASES = [
+    (21, 1760000000123),
+    (0, 0),
+    (-4, -86400000),
+    (9000000000, 1760000000123),
+]
+
+
+def _timestamp(epoch_ms: int):
+    return b"2026-10-17T00:00:00", epoch_ms
+
+
+@pytest.mark.parametrize("sensor_id, epoch_ms", CASES)
+@pytest.mark.parametrize("status", [STATUS_NORMAL, STATUS_OFFLINE])
+def test_msgpack_round_trip(sensor_id, epoch_ms, status):
+    msgpack = pytest.importorskip("msgpack")
+    payload = MsgpackCodec().encode(sensor_id, 2, b"", -12.75, _timestamp(epoch_ms), status)
+    assert len(payload) == 43
+    assert msgpack.unpackb(payload) == {"i": sensor_id, "t": 2, "s": status, "ts": epoch_ms, "v": -12.75}
+
+
+@pytest.mark.parametrize("sensor_id, epoch_ms", CASES)
+@pytest.mark.parametrize("status", [STATUS_NORMAL, STATUS_OFFLINE])
+def test_cbor_round_trip(sensor_id, epoch_ms, status):
+    cbor2 = pytest.importorskip("cbor2")
+    payload = CborCodec().encode(sensor_id, 3, b"", 55.5, _timestamp(epoch_ms), status)
+    assert len(payload) == 42
+    assert cbor2.loads(payload) == {"i": sensor_id, "t": 3, "s": status, "ts": epoch_ms, "v": 55.5}
+
+
+@pytest.mark.parametrize("status", [STATUS_NORMAL, STATUS_OFFLINE])
+def test_struct_layout(status):
+    payload = StructCodec().encode(4294967295, 127, b"", 8.5, _timestamp(-1000), status)
+    assert len(payload) == 17
+    sensor_id, type_and_status, epoch_ms, value = struct.unpack("<IBqf", payload)
+    assert (sensor_id, type_and_status & 0x7F, type_and_status >> 7, epoch_ms, value) == \
+        (4294967295, 127, status, -1000, 8.5)
+
+
+def test_struct_rejects_out_of_range_id():
+    with pytest.raises(struct.error):
+        StructCodec().encode(4294967296, 1, b"", 1.0, _timestamp(0))
+
+
+@pytest.mark.parametrize("status", [STATUS_NORMAL, STATUS_OFFLINE])
+def test_json_matches_json_dumps(status):
+    encoder = PayloadEncoder()
+    timestamp = make_timestamp(datetime.datetime(2026, 10, 17, 1, 2, 3, 456000))
+    head = encoder.render_head(21, 1, "전류센서 \"TEST\"")
+    payload = JsonCodec(encoder).encode(21, 1, head, 8.25, timestamp, status)
+    connected, status_text = (True, "normal") if status == STATUS_NORMAL else (False, "offline")
+    expected = {
+        "sensor_id": 21, "sensor_type": 1, "sensor_name": "전류센서 \"TEST\"",
+        "timestamp": timestamp[0].decode("ascii"), "is_connected": connected, "status": status_text,
+        "current": 8.25, "value": 8.25, "unit": "A"
+    }
+    assert payload == json.dumps(expected, ensure_ascii=False).encode("utf-8")
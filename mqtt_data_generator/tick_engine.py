@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
+
+from sensor_registry import SensorRegistry
+from sensor_types import SENSOR_BOUNDS, SENSOR_TYPE_CODES
+from rng_streams import SensorStreams, DRAW_NOISE, DRAW_SWITCH
+
+# 트렌드 후보값 (-: 하강, 0: 유지, +: 상승) - generate_realistic_value와 동일
+TREND_CHOICES = np.array([-0.3, -0.1, 0.0, 0.1, 0.3])
+
+
+
+class VectorTickEngine:
+    """레지스트리의 모든 센서 다음 값을 한 번의 NumPy 연산으로 계산하는 배치 엔진
+
+    generate_realistic_value와 같은 분포(균등 노이즈 + 트렌드 + 범위 제한)를 따르며,
+    트렌드 변화 확률/범위 제한은 타입 코드로 인덱싱하는 조회 테이블로 펼쳐 적용하고,
+    랜덤 변동 범위는 레지스트리의 센서별 값(기본값은 타입별 range)을 그대로 쓴다.
+
+    시드를 지정하면 공유 난수 생성기 대신 센서별 카운터 기반 스트림(SensorStreams)으로 값을 뽑는다.
+    값은 (시드, 센서 ID, 틱 번호)만으로 정해지므로 seek()로 임의 틱에서 시작해도, 센서를 샤드로
+    나눠도, 블록 단위로 미리 계산해도 같은 시드면 같은 값이 나온다.
+    """
+
+    def __init__(self, sensor_variations: Dict[str, Dict[str, Any]],
+                 bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                 rng: Optional[np.random.Generator] = None, seed: Optional[int] = None):
+        self.rng = rng or np.random.default_rng()
+        self.streams: Optional[SensorStreams] = None
+        # 다음 step이 계산할 틱 번호 (시드 모드에서 난수 카운터로 사용)
+        self.tick = 0
+        # 레지스트리 trends가 (레지스트리 version, 틱) 시점 값인지 (시드 모드에서 이어 계산 가능 여부)
+        self._synced = (-1, -1)
+        self.set_seed(seed)
+        self.bounds = bounds
+        self.build_tables(sensor_variations)
+
+    def build_tables(self, sensor_variations: Dict[str, Dict[str, Any]]):
+        """타입 코드 → 트렌드 변화 확률 / 최소 / 최대 조회 테이블 (센서 타입 표가 바뀌면 다시 호출)"""
+        bounds = self.bounds or SENSOR_BOUNDS
+        table_size = max(SENSOR_TYPE_CODES.values()) + 1
+        probability_table = np.zeros(table_size)
+        low_table = np.full(table_size, -np.inf)
+        high_table = np.full(table_size, np.inf)
+        for sensor_type, code in SENSOR_TYPE_CODES.items():
+            probability_table[code] = sensor_variations[sensor_type]["trend_probability"]
+            low_table[code], high_table[code] = bounds[sensor_type]
+        self.probability_table, self.low_table, self.high_table = probability_table, low_table, high_table
+
+    @property
+    def seed(self) -> Optional[int]:
+        return self.streams.seed if self.streams else None
+
+    def set_seed(self, seed: Optional[int]):
+        """실행 시드 지정 (None이면 공유 난수 생성기, 틱 번호는 0부터 다시 시작)"""
+        self.streams = SensorStreams(seed) if seed is not None else None
+        self.seek(0)
+
+    def seek(self, tick: int):
+        """다음 step이 계산할 틱 번호 이동 (시드 모드에서 O(1), 트렌드는 다음 step에서 다시 맞춤)"""
+        if tick < 0:
+            raise ValueError("틱 번호는 0 이상이어야 합니다.")
+        self.tick = tick
+        self._synced = (-1, -1)
+
+    def mark_synced(self, registry: SensorRegistry):
+        """레지스트리 trends가 방금 계산한 틱(tick - 1)의 트렌드임을 기록 (registry.lock 안에서 호출)"""
+        self._synced = (registry.version, self.tick - 1)
+
+    def trends_at(self, ids: np.ndarray, codes: np.ndarray, tick: int) -> np.ndarray:
+        """시드 모드: tick까지 반영한 센서별 트렌드 (이전 틱을 계산하지 않고 바로 구함)"""
+        if tick < 0:
+            return np.zeros(len(ids))
+        return self.streams.trends_at(ids, self.probability_table[codes], tick, TREND_CHOICES)
+
+    def step(self, registry: SensorRegistry) -> np.ndarray:
+        """모든 센서의 다음 값 계산 (트렌드/마지막 값은 레지스트리에 직접 기록)"""
+        with registry.lock:
+            count = len(registry)
+            tick = self.tick
+            self.tick += 1
+            if count == 0:
+                return np.empty(0)
+
+            codes = np.frombuffer(registry.type_codes, dtype=np.int8)
+            trends = np.frombuffer(registry.trends)
+            ranges = np.frombuffer(registry.variations)
+
+            if self.streams:
+                ids = np.frombuffer(registry.ids, dtype=np.int64)
+                # 센서 추가/삭제나 seek 뒤에는 직전 틱 트렌드를 스트림에서 다시 구함
+                if self._synced != (registry.version, tick - 1):
+                    trends[:] = self.trends_at(ids, codes, tick - 1)
+                switch = self.streams.uniform(ids, tick, DRAW_SWITCH) < self.probability_table[codes]
+                if switch.any():
+                    trends[switch] = self.streams.trend_choice(ids[switch], tick, TREND_CHOICES)
+                values = self.streams.uniform(ids, tick, DRAW_NOISE)
+                values *= 2.0
+                values -= 1.0
+                values *= ranges
+                self._synced = (registry.version, tick)
+            else:
+                # 트렌드 변화 확률 체크 후 새 트렌드 선택
+                switch = self.rng.random(count) < self.probability_table[codes]
+                switched = int(switch.sum())
+                if switched:
+                    trends[switch] = self.rng.choice(TREND_CHOICES, size=switched)
+
+                # 기본 랜덤 변동 (-range ~ +range)
+                values = self.rng.uniform(-ranges, ranges)
+
+            # 기준값 + 트렌드 적용
+            values += np.frombuffer(registry.base_values)
+            values += trends * ranges * 0.1
+
+            # 센서별 합리적인 범위 제한
+            np.clip(values, self.low_table[codes], self.high_table[codes], out=values)
+            np.frombuffer(registry.last_values)[:] = values
+            return values
+
+    def step_block(self, codes: np.ndarray, base_values: np.ndarray, ranges: np.ndarray, trends: np.ndarray,
+                   out: np.ndarray, chunk: int = 65536, ids: Optional[np.ndarray] = None, start_tick: int = 0):
+        """여러 틱을 한 번에 계산 (out: 틱 × 센서, trends는 마지막 틱 트렌드로 갱신)
+
+        step()을 틱마다 반복한 것과 같은 분포이며, 난수는 블록 전체 분량을 한 번에 뽑고
+        틱 축으로는 트렌드 갱신/적용만 반복한다. 센서는 chunk개씩 나눠 임시 배열 크기를 제한한다.
+        시드 모드에서는 센서 ID(ids)와 첫 틱 번호(start_tick)로 난수를 정하며 step()과 값이 같다.
+        """
+        ticks = out.shape[0]
+        tick_numbers = np.arange(start_tick, start_tick + ticks, dtype=np.int64)[:, None]
+        for start in range(0, len(codes), chunk):
+            end = min(start + chunk, len(codes))
+            chunk_codes = codes[start:end]
+            chunk_ranges = ranges[start:end]
+            chunk_trends = trends[start:end]
+            trend_scale = chunk_ranges * 0.1
+
+            values = out[:, start:end]
+            if self.streams:
+                chunk_ids = ids[start:end]
+                switch = self.streams.uniform(chunk_ids, tick_numbers, DRAW_SWITCH) < self.probability_table[chunk_codes]
+                # np.nonzero는 틱 순서로 나오므로 아래 틱별 소비 순서와 맞음
+                rows, columns = np.nonzero(switch)
+                new_trends = self.streams.trend_choice(chunk_ids[columns], tick_numbers[rows, 0], TREND_CHOICES)
+                values[:] = self.streams.uniform(chunk_ids, tick_numbers, DRAW_NOISE)
+                values *= 2.0
+                values -= 1.0
+                values *= chunk_ranges
+            else:
+                switch = self.rng.random((ticks, end - start)) < self.probability_table[chunk_codes]
+                new_trends = self.rng.choice(TREND_CHOICES, size=int(switch.sum()))
+                values[:] = self.rng.uniform(-chunk_ranges, chunk_ranges, size=(ticks, end - start))
+            values += base_values[start:end]
+            used = 0
+            for tick in range(ticks):
+                mask = switch[tick]
+                switched = int(np.count_nonzero(mask))
+                if switched:
+                    chunk_trends[mask] = new_trends[used:used + switched]
+                    used += switched
+                values[tick] += chunk_trends * trend_scale
+            np.clip(values, self.low_table[chunk_codes], self.high_table[chunk_codes], out=values)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from sensor_registry import SensorRegistry
+from tick_engine import VectorTickEngine
+
+
+class ValueBlock:
+    """미리 계산한 틱 묶음 하나 (재사용하는 평면 버퍼 위의 틱 × 센서 뷰)"""
+
+    __slots__ = ("buffer", "values", "trends", "ticks", "count", "version", "epoch", "position", "start_tick")
+
+    def __init__(self):
+        self.buffer = np.empty(0)
+        self.values = self.buffer.reshape(0, 0)
+        self.trends = np.empty(0)
+        self.ticks = 0
+        self.count = 0
+        self.version = -1
+        self.epoch = -1
+        self.position = 0
+        self.start_tick = 0
+
+    def prepare(self, ticks: int, count: int):
+        """ticks × count 뷰 준비 (버퍼가 모자랄 때만 다시 할당)"""
+        if len(self.buffer) < ticks * count:
+            self.buffer = np.empty(ticks * count)
+        self.values = self.buffer[:ticks * count].reshape(ticks, count)
+        self.ticks = ticks
+        self.count = count
+        self.position = 0
+
+
+class ValuePrefetcher:
+    """센서 값 선계산 단계: 백그라운드 스레드가 다음 block_ticks틱 값을 블록 단위로 미리 계산
+
+    블록 버퍼 depth개를 돌려 쓰며(빈 블록 큐 → 계산 → 준비 큐), 생성 스레드는 next_values()로
+    준비된 블록의 다음 행만 꺼낸다. 센서 추가/삭제(레지스트리 version 변경)나 기준값 변경(invalidate)이 있으면
+    준비된 블록을 버리고 그 틱은 즉시 계산한다. 블록 하나는 max_block_bytes를 넘지 않도록 틱 수를 줄인다.
+    시드 모드에서는 블록마다 첫 틱 번호를 기록해 틱 엔진의 현재 틱에 해당하는 행을 꺼내므로
+    즉시 계산한 틱이 섞여도 값은 선계산 없이 돌린 것과 같다.
+    """
+
+    # 센서가 없을 때 작업 스레드 대기 시간 (초)
+    IDLE_WAIT = 0.05
+
+    def __init__(self, tick_engine: VectorTickEngine, registry: SensorRegistry, block_ticks: int = 64,
+                 depth: int = 2, max_block_bytes: int = 32 * 1024 * 1024):
+        if block_ticks < 1:
+            raise ValueError("선계산 틱 수는 1 이상이어야 합니다.")
+        self.tick_engine = tick_engine
+        self.registry = registry
+        self.block_ticks = block_ticks
+        self.max_block_bytes = max_block_bytes
+
+        self._free: "queue.Queue[ValueBlock]" = queue.Queue()
+        self._ready: "queue.Queue[ValueBlock]" = queue.Queue()
+        for _ in range(depth):
+            self._free.put(ValueBlock())
+        self._current: Optional[ValueBlock] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 무효화 세대 (증가하면 그 전에 계산한 블록은 버림)
+        self.epoch = 0
+
+        # 작업 스레드의 이어 계산할 트렌드 (계산한 블록의 세대/레지스트리 버전/다음 틱 번호와 함께)
+        self._trends = np.empty(0)
+        self._trends_epoch = -1
+        self._trends_version = -1
+        self._next_tick = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.blocks = 0
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._worker_loop, name="value-prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def invalidate(self):
+        """기준값 변경 등으로 미리 계산한 값을 모두 버림"""
+        self.epoch += 1
+
+    def ticks_for(self, count: int) -> int:
+        """센서 수에 맞춘 블록 틱 수 (블록 하나가 max_block_bytes 이하)"""
+        return max(1, min(self.block_ticks, self.max_block_bytes // max(1, count * 8)))
+
+    def _worker_loop(self):
+        registry = self.registry
+        engine = self.tick_engine
+        while not self._stopped.is_set():
+            try:
+                block = self._free.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # 계산에 쓸 열은 잠금 안에서 복사 (계산 중 센서 추가/삭제와 무관하게)
+            with registry.lock:
+                epoch = self.epoch
+                version = registry.version
+                count = len(registry)
+                continued = self._trends_epoch == epoch and self._trends_version == version
+                # 시드 모드: 생성 스레드가 이미 지나간 틱은 건너뜀
+                start_tick = self._next_tick if continued and self._next_tick >= engine.tick else engine.tick
+                if count:
+                    ids = np.frombuffer(registry.ids, dtype=np.int64).copy() if engine.streams else None
+                    codes = np.frombuffer(registry.type_codes, dtype=np.int8).copy()
+                    base_values = np.frombuffer(registry.base_values).copy()
+                    ranges = np.frombuffer(registry.variations).copy()
+                    if not continued and not engine.streams:
+                        self._trends = np.frombuffer(registry.trends).copy()
+            if not count:
+                self._free.put(block)
+                self._stopped.wait(self.IDLE_WAIT)
+                continue
+
+            if engine.streams and (not continued or start_tick != self._next_tick):
+                self._trends = engine.trends_at(ids, codes, start_tick - 1)
+            block.prepare(self.ticks_for(count), count)
+            engine.step_block(codes, base_values, ranges, self._trends, block.values, ids=ids, start_tick=start_tick)
+            block.trends = self._trends.copy()
+            block.version = version
+            block.epoch = epoch
+            block.start_tick = start_tick
+            self._trends_epoch = epoch
+            self._trends_version = version
+            self._next_tick = start_tick + block.ticks
+            self.blocks += 1
+            self._ready.put(block)
+
+    def _discard_ready(self):
+        """준비된 블록을 모두 빈 블록 큐로 돌려보냄"""
+        while True:
+            try:
+                self._free.put(self._ready.get_nowait())
+            except queue.Empty:
+                return
+
+    def next_values(self) -> np.ndarray:
+        """다음 틱 값 (registry.lock을 잡은 상태에서 호출, 준비된 값이 없거나 낡았으면 즉시 계산)
+
+        소비한 값은 레지스트리 last_values에, 블록을 다 쓰면 블록 끝 트렌드를 trends에 기록한다.
+        """
+        registry = self.registry
+        engine = self.tick_engine
+        while True:
+            block = self._current
+            if block is not None and block.position >= block.ticks:
+                self._free.put(block)
+                block = self._current = None
+            if block is None:
+                # 기다리지 않음: 준비된 블록이 없으면 그 틱은 즉시 계산해 틱 지연을 일정하게 유지
+                try:
+                    block = self._current = self._ready.get_nowait()
+                except queue.Empty:
+                    break
+            if not engine.streams:
+                break
+            # 시드 모드: 즉시 계산으로 이미 지나간 틱의 행은 건너뜀
+            block.position = max(block.position, engine.tick - block.start_tick)
+            if block.position < block.ticks:
+                break
+
+        if block is None or block.epoch != self.epoch or block.version != registry.version:
+            if block is not None:
+                # 낡은 블록: 버리고 작업 스레드가 현재 레지스트리 상태에서 다시 계산하게 함
+                self._current = None
+                self._free.put(block)
+                self._discard_ready()
+                self.epoch += 1
+            self.misses += 1
+            return self.tick_engine.step(registry)
+
+        row = block.values[block.position]
+        block.position += 1
+        engine.tick += 1
+        np.frombuffer(registry.last_values)[:] = row
+        if block.position == block.ticks:
+            np.frombuffer(registry.trends)[:] = block.trends
+            engine.mark_synced(registry)
+        self.hits += 1
+        # 버퍼는 재사용되므로 복사본 반환 (파일 출력 등 다른 스레드가 값을 나중에 읽음)
+        return row.copy()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "blocks": self.blocks, "ready": self._ready.qsize()}
+
+    def describe(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"선계산 적중 {self.hits:,}/{total:,}틱 ({rate:.1f}%), 블록 {self.blocks:,}개"